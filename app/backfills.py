@@ -0,0 +1,403 @@
+# app/backfills.py
+"""
+온라인 데이터 백필 (스키마 변경 뒤 기존 행을 채우는 작업)
+
+한 UPDATE로 테이블 전체를 고치면 그동안 쓰기 락을 잡고 있어서 모든 쓰기 요청이 멈춤
+→ id 범위를 작게 잘라 배치마다 따로 커밋하고 배치 사이에 쉬면서 API와 번갈아 실행
+
+- 배치는 쓰기 큐(app/write_queue.py)의 작업 하나: 요청 쓰기와 같은 연결/그룹 커밋을 쓰고
+  배치 크기만큼만 락을 잡음 (TODO_BACKFILL_BATCH_SIZE, 실행 중에도 /throttle로 변경)
+- 진행 위치(last_id)는 backfill_progress 테이블에 배치와 같은 트랜잭션으로 기록
+  → 프로세스가 죽어도 커밋된 배치까지는 반영돼 있고 다음 시작 때 그 다음 id부터 이어감
+- 배치는 같은 행을 다시 실행해도 결과가 같아야 함 (WHERE에 "아직 안 채운 행" 조건)
+- 갱신한 행은 이 프로세스의 GET /todos/{id} 캐시에서 지움 (다른 워커는 캐시 TTL 뒤 반영)
+
+실행: 앱이 시작될 때 대기/중단된 백필을 자동으로 이어감 (TODO_BACKFILL_AUTO_START)
+      수동: python -m app.backfills status | run NAME [--batch-size N] [--pause-ms MS] | pause NAME
+"""
+import argparse
+import asyncio
+import contextvars
+import logging
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app import config
+from app.cache import TodoCache, todo_cache
+from app.database import ReadSessionLocal
+from app.write_queue import WriteCoordinator, write_queue
+
+logger = logging.getLogger("todo.backfill")
+
+# 백필별 진행 상태 (이름당 한 줄)
+# status: pending(등록만 됨) → running → done, 운영자가 멈추면 paused
+BACKFILL_PROGRESS_DDL = """
+    CREATE TABLE IF NOT EXISTS backfill_progress (
+        name TEXT PRIMARY KEY,
+        status TEXT NOT NULL DEFAULT 'pending',
+        last_id INTEGER NOT NULL DEFAULT 0,
+        max_id INTEGER NOT NULL DEFAULT 0,
+        rows_updated INTEGER NOT NULL DEFAULT 0,
+        batches INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        started_at TEXT,
+        updated_at TEXT,
+        finished_at TEXT
+    ) WITHOUT ROWID
+"""
+
+REGISTER_SQL = "INSERT INTO backfill_progress (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"
+
+PROGRESS_SQL = """
+    SELECT name, status, last_id, max_id, rows_updated, batches,
+           created_at, started_at, updated_at, finished_at
+    FROM backfill_progress
+"""
+
+# 시작/재개: 끝 id를 지금 테이블의 최대 id로 다시 잡음 (등록 뒤 구버전 워커가 넣은 행까지 포함)
+START_SQL = """
+    UPDATE backfill_progress
+    SET status = 'running', max_id = max(max_id, :max_id),
+        started_at = coalesce(started_at, CURRENT_TIMESTAMP), updated_at = CURRENT_TIMESTAMP
+    WHERE name = :name AND status != 'done'
+"""
+
+PAUSE_SQL = """
+    UPDATE backfill_progress SET status = 'paused', updated_at = CURRENT_TIMESTAMP
+    WHERE name = :name AND status IN ('pending', 'running')
+"""
+
+ADVANCE_SQL = """
+    UPDATE backfill_progress
+    SET last_id = :last_id, rows_updated = rows_updated + :rows, batches = batches + 1,
+        status = CASE WHEN :done THEN 'done' ELSE status END,
+        finished_at = CASE WHEN :done THEN CURRENT_TIMESTAMP END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = :name
+"""
+
+
+@dataclass(frozen=True)
+class Backfill:
+    """
+    백필 하나
+
+    sql: (start, end] id 범위의 행을 고치고 고친 행의 id를 RETURNING하는 UPDATE
+         이미 채운 행은 WHERE로 걸러야 함 (재실행/재시작에 안전)
+    """
+    name: str
+    description: str
+    table: str
+    sql: str
+
+
+# 등록된 백필 (마이그레이션에서 register_backfill로 진행 상태 행을 만듦)
+BACKFILLS: dict[str, Backfill] = {
+    backfill.name: backfill
+    for backfill in [
+        Backfill(
+            "todos_completed_at",
+            "completed_at 컬럼 추가(마이그레이션 6) 전에 완료된 할일의 완료 시각을 updated_at으로 채움",
+            "todos",
+            """
+            UPDATE todos SET completed_at = updated_at
+            WHERE id > :start AND id <= :end AND completed AND completed_at IS NULL
+            RETURNING id
+            """,
+        ),
+    ]
+}
+
+
+def register_backfill(conn: Connection, name: str) -> None:
+    """마이그레이션 안에서 백필을 대기 상태로 등록 (컬럼 추가와 같은 트랜잭션)"""
+    conn.execute(text(REGISTER_SQL), {"name": name})
+
+
+def create_backfill_progress(conn: Connection) -> None:
+    conn.exec_driver_sql(BACKFILL_PROGRESS_DDL)
+
+
+def run_to_completion(conn: Connection, name: str) -> int:
+    """
+    백필 전체를 UPDATE 한 번으로 실행하고 done으로 기록 (동기, 고친 행 수 반환)
+
+    서비스 중이 아닌 DB(벤치마크 시드 등)용: 전체 범위를 한 트랜잭션으로 처리
+    """
+    backfill = BACKFILLS[name]
+    max_id = conn.exec_driver_sql(f"SELECT coalesce(max(id), 0) FROM {backfill.table}").scalar()
+    rows = len(conn.execute(text(backfill.sql), {"start": 0, "end": max_id}).all())
+    conn.execute(text(START_SQL), {"name": name, "max_id": max_id})
+    conn.execute(text(ADVANCE_SQL), {"name": name, "last_id": max_id, "rows": rows, "done": True})
+    return rows
+
+
+@dataclass
+class BatchResult:
+    """배치 하나의 결과"""
+    ids: list[int]
+    last_id: int
+    done: bool
+
+
+async def start_backfill(db: AsyncSession, backfill: Backfill) -> bool:
+    """쓰기 작업: running으로 바꿈 (이미 done이거나 없으면 False)"""
+    max_id = (
+        await db.execute(text(f"SELECT coalesce(max(id), 0) FROM {backfill.table}"))
+    ).scalar()
+    result = await db.execute(text(START_SQL), {"name": backfill.name, "max_id": max_id})
+    return result.rowcount > 0
+
+
+async def pause_backfill(db: AsyncSession, backfill: Backfill) -> bool:
+    """쓰기 작업: paused로 바꿈 (진행 중인 배치는 끝까지 커밋되고 다음 배치부터 멈춤)"""
+    result = await db.execute(text(PAUSE_SQL), {"name": backfill.name})
+    return result.rowcount > 0
+
+
+async def run_batch(db: AsyncSession, backfill: Backfill, batch_size: int) -> BatchResult | None:
+    """
+    쓰기 작업: 진행 위치 다음 batch_size개 id 범위를 고치고 진행 위치를 옮김
+
+    진행 위치를 쓰기 트랜잭션 안에서 읽으므로 여러 워커가 같은 백필을 돌려도
+    범위가 겹치거나 건너뛰지 않음 (running이 아니면 아무것도 안 하고 None)
+    """
+    progress = (
+        await db.execute(text(PROGRESS_SQL + " WHERE name = :name"), {"name": backfill.name})
+    ).one_or_none()
+    if progress is None or progress.status != "running":
+        return None
+    end = min(progress.last_id + batch_size, progress.max_id)
+    ids = list((await db.execute(text(backfill.sql), {"start": progress.last_id, "end": end})).scalars())
+    done = end >= progress.max_id
+    await db.execute(
+        text(ADVANCE_SQL),
+        {"name": backfill.name, "last_id": end, "rows": len(ids), "done": done},
+    )
+    return BatchResult(ids, end, done)
+
+
+class BackfillRunner:
+    """
+    백필을 백그라운드 태스크로 실행 (백필마다 태스크 하나)
+
+    배치를 쓰기 큐에 넣고 커밋을 기다린 뒤 pause_seconds 쉬고 다음 배치
+    batch_size / pause_seconds는 실행 중에도 throttle()로 바꿀 수 있음 (다음 배치부터 적용)
+    """
+
+    def __init__(
+        self,
+        coordinator: WriteCoordinator,
+        read_session_factory: async_sessionmaker[AsyncSession],
+        cache: TodoCache | None,
+        batch_size: int,
+        pause_seconds: float,
+    ):
+        self.coordinator = coordinator
+        self.read_session_factory = read_session_factory
+        self.cache = cache
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.last_errors: dict[str, str] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._stopping: asyncio.Event | None = None
+
+    def throttle(self, batch_size: int | None = None, pause_seconds: float | None = None) -> None:
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if pause_seconds is not None:
+            self.pause_seconds = pause_seconds
+
+    def is_running(self, name: str) -> bool:
+        task = self._tasks.get(name)
+        return task is not None and not task.done()
+
+    async def start(self, name: str) -> bool:
+        """백필을 running으로 바꾸고 태스크 시작 (이미 done이면 False)"""
+        backfill = BACKFILLS[name]
+        if not await self.coordinator.submit(partial(start_backfill, backfill=backfill)):
+            return False
+        self._spawn(name)
+        return True
+
+    async def pause(self, name: str) -> bool:
+        """paused로 바꿈 (태스크는 다음 배치에서 running이 아닌 것을 보고 끝남)"""
+        return await self.coordinator.submit(partial(pause_backfill, backfill=BACKFILLS[name]))
+
+    async def resume(self, include_pending: bool = True) -> list[str]:
+        """
+        시작 시 이어서 실행: running(실행 중 종료됨)과 pending(마이그레이션이 등록만 함)
+
+        paused는 운영자가 멈춘 것이므로 그대로 둠
+        """
+        statuses = ("running", "pending") if include_pending else ("running",)
+        names = [
+            progress["name"] for progress in await self.progress()
+            if progress["status"] in statuses and progress["name"] in BACKFILLS
+        ]
+        for name in names:
+            await self.start(name)
+        return names
+
+    async def stop(self) -> None:
+        """
+        진행 중인 배치가 커밋될 때까지 기다린 뒤 태스크 종료
+
+        DB 상태는 running으로 남으므로 다음 시작 때 이어서 실행됨
+        (쓰기 큐보다 먼저 멈춰야 함: 배치가 큐에 남아 있으면 안 됨)
+        """
+        if self._stopping is not None:
+            self._stopping.set()
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._stopping = None
+
+    async def wait(self, name: str) -> None:
+        """태스크가 끝날 때까지 대기 (CLI용)"""
+        task = self._tasks.get(name)
+        if task is not None:
+            await task
+
+    async def progress(self) -> list[dict[str, Any]]:
+        """backfill_progress 전체 (읽기 연결)"""
+        async with self.read_session_factory() as db:
+            result = await db.execute(text(PROGRESS_SQL + " ORDER BY name"))
+            return [dict(row) for row in result.mappings()]
+
+    async def status(self) -> list[dict[str, Any]]:
+        """진행 상태 + 이 프로세스에서 실행 중인지/마지막 오류"""
+        return [
+            {
+                **progress,
+                "description": BACKFILLS[progress["name"]].description if progress["name"] in BACKFILLS else None,
+                "progress": min(progress["last_id"] / progress["max_id"], 1.0) if progress["max_id"] else (
+                    1.0 if progress["status"] == "done" else 0.0
+                ),
+                "running_here": self.is_running(progress["name"]),
+                "last_error": self.last_errors.get(progress["name"]),
+            }
+            for progress in await self.progress()
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """모니터링용 설정/실행 중 백필"""
+        return {
+            "batch_size": self.batch_size,
+            "pause_ms": self.pause_seconds * 1000,
+            "running": sorted(name for name in self._tasks if self.is_running(name)),
+        }
+
+    def _spawn(self, name: str) -> None:
+        if self.is_running(name):
+            return
+        if self._stopping is None:
+            self._stopping = asyncio.Event()
+        self.last_errors.pop(name, None)
+        # 빈 컨텍스트로 시작: create_task는 호출한 쪽의 contextvar를 복사하므로
+        # POST /internal/backfills/{name}/start에서 시작하면 요청의 쿼리 집계/단계 시간이
+        # 요청이 끝난 뒤에도 백필의 문장과 배치 시간까지 세게 됨
+        self._tasks[name] = asyncio.create_task(
+            self._run(BACKFILLS[name], self._stopping), context=contextvars.Context()
+        )
+
+    async def _run(self, backfill: Backfill, stopping: asyncio.Event) -> None:
+        started = time.perf_counter()
+        rows = batches = 0
+        while not stopping.is_set():
+            try:
+                result = await self.coordinator.submit(
+                    partial(run_batch, backfill=backfill, batch_size=self.batch_size)
+                )
+            except Exception as exc:
+                # 진행 위치는 마지막으로 커밋된 배치에 그대로 있음 → 다시 start하면 이어감
+                self.last_errors[backfill.name] = repr(exc)
+                logger.exception("backfill %s failed", backfill.name)
+                return
+            if result is None:
+                break
+            rows += len(result.ids)
+            batches += 1
+            if self.cache is not None:
+                for todo_id in result.ids:
+                    self.cache.invalidate(todo_id)
+            if result.done:
+                logger.info(
+                    "backfill %s done: %d rows in %d batches, %.1fs",
+                    backfill.name, rows, batches, time.perf_counter() - started,
+                )
+                return
+            # 배치 사이에 쉬면서 요청 쓰기가 먼저 실행되게 함 (stop()이면 바로 깸)
+            try:
+                await asyncio.wait_for(stopping.wait(), self.pause_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+# 앱 전체에서 공유하는 실행기 (배치는 write_queue로, 갱신한 행은 todo_cache에서 제거)
+backfill_runner = BackfillRunner(
+    write_queue,
+    ReadSessionLocal,
+    todo_cache,
+    batch_size=config.BACKFILL_BATCH_SIZE,
+    pause_seconds=config.BACKFILL_PAUSE_MS / 1000,
+)
+
+
+def print_status(statuses: Sequence[dict[str, Any]]) -> None:
+    for status in statuses:
+        print(
+            f"{status['name']:<24} {status['status']:<8} {status['progress']:>7.1%}  "
+            f"id {status['last_id']:,}/{status['max_id']:,}  "
+            f"rows {status['rows_updated']:,}  batches {status['batches']:,}"
+        )
+
+
+async def run_command(args: argparse.Namespace) -> int:
+    runner = backfill_runner
+    runner.throttle(args.batch_size, None if args.pause_ms is None else args.pause_ms / 1000)
+    try:
+        if args.command == "status":
+            print_status(await runner.status())
+        elif args.command == "pause":
+            if not await runner.pause(args.name):
+                print(f"{args.name} is not pending or running", file=sys.stderr)
+                return 1
+        elif args.command == "run":
+            if not await runner.start(args.name):
+                print(f"{args.name} is already done (or not registered by a migration)", file=sys.stderr)
+                return 1
+            try:
+                await runner.wait(args.name)
+            finally:
+                await runner.stop()
+            print_status([status for status in await runner.status() if status["name"] == args.name])
+            if args.name in runner.last_errors:
+                return 1
+        return 0
+    finally:
+        await write_queue.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["status", "run", "pause"])
+    parser.add_argument("name", nargs="?", choices=sorted(BACKFILLS))
+    parser.add_argument("--batch-size", type=int, help=f"ids per batch (default {config.BACKFILL_BATCH_SIZE})")
+    parser.add_argument("--pause-ms", type=float, help=f"pause between batches (default {config.BACKFILL_PAUSE_MS})")
+    args = parser.parse_args()
+    if args.command != "status" and args.name is None:
+        parser.error(f"{args.command} needs a backfill name")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return asyncio.run(run_command(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
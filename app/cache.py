@@ -0,0 +1,140 @@
+# app/cache.py
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from app import config
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/실패/축출 카운터"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    rejected_fills: int = 0
+
+
+@dataclass
+class CacheEntry:
+    payload: bytes
+    etag: str
+    expires_at: float
+
+
+class TodoCache:
+    """
+    GET /todos/{todo_id} 응답(직렬화된 JSON + ETag)을 id별로 저장하는 LRU + TTL 캐시
+
+    - 개수(max_entries) 또는 바이트(max_bytes) 한도를 넘으면 가장 오래 안 쓴 항목부터 축출
+    - 0은 그 기준으로는 한도 없음 (둘 다 0이면 캐시 끔)
+    - 쓰기 경로(create/update/delete)가 항목을 갱신하거나 무효화함
+
+    읽기 도중 같은 id에 쓰기가 끝나면 읽은 값이 이미 낡았을 수 있으므로
+    읽기 시작 전에 fill_token()을 받아 두고, 그 뒤에 쓰기가 있었으면 fill()을 거부함
+    """
+
+    # 쓰기 시점을 기억하는 id 수 (넘으면 오래된 것부터 잊고 _floor로 보수적으로 판단)
+    WRITE_LOG_SIZE = 4096
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[int, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._write_counter = 0
+        self._last_write: OrderedDict[int, int] = OrderedDict()
+        self._floor = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries != 0 or self.max_bytes != 0
+
+    def get(self, todo_id: int) -> CacheEntry | None:
+        """캐시된 항목 반환 (없거나 만료되면 None)"""
+        entry = self._entries.get(todo_id)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if self.ttl and entry.expires_at <= time.monotonic():
+            self._remove(todo_id)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(todo_id)
+        self.stats.hits += 1
+        return entry
+
+    def fill_token(self) -> int:
+        """DB 읽기 직전에 받아 두는 토큰"""
+        return self._write_counter
+
+    def fill(self, todo_id: int, payload: bytes, etag: str, token: int) -> None:
+        """읽기 경로에서 캐시 채우기 (token 이후 이 id에 쓰기가 있었으면 무시)"""
+        if self._last_write.get(todo_id, self._floor) > token:
+            self.stats.rejected_fills += 1
+            return
+        self._store(todo_id, payload, etag)
+
+    def put(self, todo_id: int, payload: bytes, etag: str) -> None:
+        """쓰기 경로에서 커밋된 최신 값으로 갱신"""
+        self._record_write(todo_id)
+        self._store(todo_id, payload, etag)
+
+    def invalidate(self, todo_id: int) -> None:
+        """쓰기 경로에서 항목 제거 (삭제 등)"""
+        self._record_write(todo_id)
+        if todo_id in self._entries:
+            self._remove(todo_id)
+            self.stats.invalidations += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """모니터링용 통계"""
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            **self.stats.__dict__,
+            "hit_ratio": self.stats.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _store(self, todo_id: int, payload: bytes, etag: str) -> None:
+        if not self.enabled:
+            return
+        if todo_id in self._entries:
+            self._remove(todo_id)
+        self._entries[todo_id] = CacheEntry(payload, etag, time.monotonic() + self.ttl)
+        self._bytes += len(payload)
+        # 한도를 넘으면 가장 오래 안 쓴 항목부터 축출
+        while self._entries and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _remove(self, todo_id: int) -> None:
+        entry = self._entries.pop(todo_id)
+        self._bytes -= len(entry.payload)
+
+    def _record_write(self, todo_id: int) -> None:
+        self._write_counter += 1
+        self._last_write[todo_id] = self._write_counter
+        self._last_write.move_to_end(todo_id)
+        if len(self._last_write) > self.WRITE_LOG_SIZE:
+            _, self._floor = self._last_write.popitem(last=False)
+
+
+# 앱 전체에서 공유하는 캐시
+todo_cache = TodoCache(
+    max_entries=config.TODO_CACHE_MAX_ENTRIES,
+    max_bytes=config.TODO_CACHE_MAX_BYTES,
+    ttl=config.TODO_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,286 @@
+# app/compression.py
+import time
+import zlib
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import config
+from app.timing import timed
+
+# 선택 의존성: 설치돼 있으면 br / zstd도 협상 대상에 포함
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축할 응답 Content-Type (이미 압축된 이미지 등은 제외)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript")
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip 헤더 포함
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        # 지금까지 받은 데이터를 클라이언트가 바로 풀 수 있게 내보냄 (스트림은 계속)
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    """설치된 라이브러리 기준으로 쓸 수 있는 인코딩 → 인코더 생성 함수"""
+    encoders: dict[str, Callable[[], Encoder]] = {
+        "gzip": lambda: GzipEncoder(config.COMPRESSION_GZIP_LEVEL),
+    }
+    if brotli is not None:
+        encoders["br"] = lambda: BrotliEncoder(config.COMPRESSION_BROTLI_QUALITY)
+    if zstandard is not None:
+        encoders["zstd"] = lambda: ZstdEncoder(config.COMPRESSION_ZSTD_LEVEL)
+    return encoders
+
+
+def negotiate(accept_encoding: str, preferred: Sequence[str]) -> str | None:
+    """
+    Accept-Encoding 헤더 → 사용할 인코딩 (없으면 None)
+
+    클라이언트 q값이 가장 높은 것, 같으면 preferred 순서가 앞선 것
+    q=0은 거부, *는 나열되지 않은 인코딩 전부에 적용
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            qualities[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in preferred:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+@dataclass
+class EncodingStats:
+    """인코딩 하나의 누적 통계"""
+    responses: int = 0
+    streamed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds_total: float = 0.0
+    cpu_seconds_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **self.__dict__,
+            "ratio": self.bytes_out / self.bytes_in if self.bytes_in else 0.0,
+            "cpu_seconds_mean": self.cpu_seconds_total / self.responses if self.responses else 0.0,
+        }
+
+
+@dataclass
+class CompressionStats:
+    """응답 압축 통계 (압축률 = 압축 후 / 압축 전, CPU 시간은 응답 하나 기준)"""
+    encodings: dict[str, EncodingStats] = field(default_factory=dict)
+    skipped_small: int = 0  # threshold 미만이라 압축 안 함
+    skipped_type: int = 0  # 압축 대상 Content-Type이 아니거나 이미 인코딩됨
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float, streamed: bool) -> None:
+        stats = self.encodings.setdefault(encoding, EncodingStats())
+        stats.responses += 1
+        stats.streamed += streamed
+        stats.bytes_in += bytes_in
+        stats.bytes_out += bytes_out
+        stats.cpu_seconds_total += cpu_seconds
+        stats.cpu_seconds_max = max(stats.cpu_seconds_max, cpu_seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "encodings": {name: stats.as_dict() for name, stats in self.encodings.items()},
+            "skipped_small": self.skipped_small,
+            "skipped_type": self.skipped_type,
+        }
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 협상 후 응답 본문 압축 (순수 ASGI 미들웨어)
+
+    - 본문이 한 번에 오는 응답: minimum_size 미만이면 그대로, 이상이면 통째로 압축
+    - 스트리밍 응답(StreamingResponse): 크기를 미리 알 수 없으므로 항상 압축하되
+      덩어리마다 flush해서 클라이언트가 받는 즉시 풀 수 있게 함 (첫 바이트 지연 없음)
+    - 압축하면 Content-Encoding, Vary: Accept-Encoding을 붙이고 ETag를 weak로 바꿈
+      (바이트가 달라지므로 strong ETag를 그대로 두면 안 됨, If-None-Match는 weak 비교라 304는 그대로 동작)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = config.COMPRESSION_MIN_SIZE,
+        encodings: Sequence[str] = config.COMPRESSION_ENCODINGS,
+        stats: CompressionStats | None = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = available_encoders()
+        self.preferred = [name for name in encodings if name in self.encoders]
+        self.stats = stats if stats is not None else compression_stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.preferred)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """요청 하나의 응답 메시지를 가로채 압축 여부를 정하고 본문을 인코딩"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start: Message | None = None
+        self.encoder: Encoder | None = None
+        self.passthrough = False
+        self.streamed = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu_seconds = 0.0
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 본문 첫 덩어리를 보고 압축 여부를 정할 때까지 보류
+            self.start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if message["status"] in (204, 304):
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            if (
+                "content-encoding" in headers
+                or "no-transform" in headers.get("cache-control", "")
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                self.passthrough = True
+                self.middleware.stats.skipped_type += 1
+                await self.downstream(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                self.middleware.stats.skipped_small += 1
+                await self.downstream(start)
+                await self.downstream(message)
+                return
+            self.encoder = self.middleware.encoders[self.encoding]()
+            self.streamed = more_body
+            payload = self.encode(body, more_body)
+            self.prepare_headers(start, None if more_body else len(payload))
+            await self.downstream(start)
+        else:
+            payload = self.encode(body, more_body)
+
+        await self.downstream({"type": "http.response.body", "body": payload, "more_body": more_body})
+        if not more_body:
+            self.middleware.stats.record(
+                self.encoding, self.bytes_in, self.bytes_out, self.cpu_seconds, self.streamed
+            )
+
+    def encode(self, body: bytes, more_body: bool) -> bytes:
+        started = time.thread_time()
+        with timed("compress"):
+            payload = self.encoder.compress(body)
+            payload += self.encoder.flush() if more_body else self.encoder.finish()
+        self.cpu_seconds += time.thread_time() - started
+        self.bytes_in += len(body)
+        self.bytes_out += len(payload)
+        return payload
+
+    def prepare_headers(self, start: Message, content_length: int | None) -> None:
+        headers = MutableHeaders(raw=list(start["headers"]))
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is not None:
+            headers["Content-Length"] = str(content_length)
+        elif "content-length" in headers:
+            del headers["Content-Length"]
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        start["headers"] = headers.raw
+
+
+# 앱 전체에서 공유하는 통계 (/internal/stats에서 노출)
+compression_stats = CompressionStats()
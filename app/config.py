@@ -0,0 +1,78 @@
+# app/config.py
+import os
+
+# 앱 설정값 (Django의 settings.py와 유사)
+# 모든 값은 TODO_ 접두사가 붙은 환경 변수로 덮어쓸 수 있음
+
+# 데이터베이스 URL (벤치마크처럼 다른 파일을 쓸 때 덮어씀)
+DATABASE_URL = os.getenv("TODO_DATABASE_URL", "sqlite+aiosqlite:///./todos.db")
+
+# 일괄 요청(POST /todos/bulk, DELETE /todos) 한 번에 처리할 최대 할일 개수
+BULK_MAX_ITEMS = int(os.getenv("TODO_BULK_MAX_ITEMS", "1000"))
+
+# POST /todos/bulk 본문 최대 크기(바이트) = 할일 개수 한도 × 할일 하나의 최대 크기
+# 본문을 메모리에 모두 읽고 파싱하기 전에 이 크기를 넘으면 413
+BULK_MAX_ITEM_BYTES = int(os.getenv("TODO_BULK_MAX_ITEM_BYTES", str(16 * 1024)))
+BULK_MAX_BODY_BYTES = BULK_MAX_ITEMS * BULK_MAX_ITEM_BYTES
+
+# SQLite PRAGMA 프로필: "durable" | "balanced" | "throughput"
+# (프로필 내용은 app/database.py의 SQLITE_PRAGMA_PROFILES 참고)
+SQLITE_PRAGMA_PROFILE = os.getenv("TODO_SQLITE_PRAGMA_PROFILE", "balanced")
+
+# 읽기 전용 엔진의 최대 연결 수 (쓰기 엔진은 항상 1개)
+READ_POOL_SIZE = int(os.getenv("TODO_READ_POOL_SIZE", "8"))
+
+# 그룹 커밋: 쓰기 작업을 모으는 최대 대기 시간(ms)과 한 트랜잭션의 최대 작업 수
+WRITE_BATCH_WINDOW_MS = float(os.getenv("TODO_WRITE_BATCH_WINDOW_MS", "2"))
+WRITE_BATCH_MAX_OPS = int(os.getenv("TODO_WRITE_BATCH_MAX_OPS", "64"))
+
+# 시작 시 마이그레이션 쓰기 락을 기다리는 최대 시간(초)
+# (다른 워커가 긴 마이그레이션을 실행 중이면 busy_timeout을 넘어도 이 시간까지 다시 시도)
+MIGRATION_LOCK_TIMEOUT = float(os.getenv("TODO_MIGRATION_LOCK_TIMEOUT", "600"))
+
+# 쓰기 배치가 'database is locked'(busy_timeout 초과, 다른 프로세스가 쓰기 락을 오래 잡음)로 실패했을 때 재시도 횟수
+WRITE_LOCK_RETRIES = int(os.getenv("TODO_WRITE_LOCK_RETRIES", "3"))
+
+# 온라인 백필 (app/backfills.py)
+# - 배치 하나가 훑는 id 범위 (클수록 빠르지만 배치 동안 다른 쓰기가 기다림)
+# - 배치 사이에 쉬는 시간(ms)
+# - 1이면 시작할 때 대기(pending)/중단된(running) 백필을 자동으로 이어서 실행
+BACKFILL_BATCH_SIZE = int(os.getenv("TODO_BACKFILL_BATCH_SIZE", "1000"))
+BACKFILL_PAUSE_MS = float(os.getenv("TODO_BACKFILL_PAUSE_MS", "50"))
+BACKFILL_AUTO_START = os.getenv("TODO_BACKFILL_AUTO_START", "1") == "1"
+
+# GET /todos/{todo_id} 응답 캐시: 개수 한도, 바이트 한도, TTL(초)
+# 한도 0은 그 기준으로 제한 없음 (개수/바이트 모두 0이면 캐시 끔), TTL 0은 만료 없음
+TODO_CACHE_MAX_ENTRIES = int(os.getenv("TODO_CACHE_MAX_ENTRIES", "10000"))
+TODO_CACHE_MAX_BYTES = int(os.getenv("TODO_CACHE_MAX_BYTES", "0"))
+TODO_CACHE_TTL_SECONDS = float(os.getenv("TODO_CACHE_TTL_SECONDS", "60"))
+
+# GET /todos/export: 덩어리 하나(짧은 읽기 트랜잭션 하나)로 읽어 보내는 행 수
+EXPORT_FETCH_SIZE = int(os.getenv("TODO_EXPORT_FETCH_SIZE", "1000"))
+
+# POST /todos/import: 한 트랜잭션으로 커밋할 행 수, 한 줄 최대 크기, 응답에 담을 최대 오류 수
+IMPORT_CHUNK_SIZE = int(os.getenv("TODO_IMPORT_CHUNK_SIZE", "5000"))
+IMPORT_MAX_LINE_BYTES = int(os.getenv("TODO_IMPORT_MAX_LINE_BYTES", str(1024 * 1024)))
+IMPORT_MAX_ERRORS = int(os.getenv("TODO_IMPORT_MAX_ERRORS", "100"))
+
+# 응답 압축: 이 크기(바이트) 미만 본문은 압축 안 함, 서버 선호 순서(설치된 것만 사용), 인코딩별 레벨
+COMPRESSION_MIN_SIZE = int(os.getenv("TODO_COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_ENCODINGS = tuple(
+    name.strip() for name in os.getenv("TODO_COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if name.strip()
+)
+COMPRESSION_GZIP_LEVEL = int(os.getenv("TODO_COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("TODO_COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("TODO_COMPRESSION_ZSTD_LEVEL", "3"))
+
+# SQL 로그 (app/query_log.py)
+# - 이 시간(ms) 이상 걸린 문장은 경고 로그 (파라미터 값은 가림)
+# - 나머지 문장은 이 비율(0~1)만 샘플링해서 로그 (0이면 안 남김)
+# - 한 요청에서 같은 SELECT가 이 횟수 이상 실행되면 N+1 경고 (0이면 끔)
+# - 1이면 SQLAlchemy echo로 모든 문장 출력 (학습/디버깅용, 동기 로그라 처리량이 떨어짐)
+SLOW_QUERY_MS = float(os.getenv("TODO_SLOW_QUERY_MS", "100"))
+QUERY_LOG_SAMPLE_RATE = float(os.getenv("TODO_QUERY_LOG_SAMPLE_RATE", "0"))
+N_PLUS_ONE_THRESHOLD = int(os.getenv("TODO_N_PLUS_ONE_THRESHOLD", "10"))
+SQL_ECHO = os.getenv("TODO_SQL_ECHO", "0") == "1"
+
+# 요청별 단계 시간 측정: 1이면 Server-Timing 헤더와 todo.timing 로그 출력 (0이면 측정 코드 자체를 등록 안 함)
+SERVER_TIMING = os.getenv("TODO_SERVER_TIMING", "0") == "1"
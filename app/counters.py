@@ -0,0 +1,101 @@
+# app/counters.py
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas import TodoStats
+
+# 집계 카운터 테이블: 이름별 값 한 줄씩 (total, completed)
+# open은 total - completed로 계산하므로 따로 저장하지 않음
+COUNTERS_DDL = """
+CREATE TABLE todo_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+# todos가 바뀌는 같은 트랜잭션 안에서 카운터도 바뀜
+# → 쓰기가 롤백되면 카운터도 같이 롤백, 어느 시점에 읽어도 todos와 일치
+COUNTER_TRIGGERS_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS todo_counters_ai AFTER INSERT ON todos BEGIN
+        UPDATE todo_counters SET value = value + 1 WHERE name = 'total';
+        UPDATE todo_counters SET value = value + new.completed WHERE name = 'completed';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS todo_counters_ad AFTER DELETE ON todos BEGIN
+        UPDATE todo_counters SET value = value - 1 WHERE name = 'total';
+        UPDATE todo_counters SET value = value - old.completed WHERE name = 'completed';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS todo_counters_au AFTER UPDATE OF completed ON todos
+    WHEN new.completed IS NOT old.completed BEGIN
+        UPDATE todo_counters SET value = value + new.completed - old.completed
+        WHERE name = 'completed';
+    END
+    """,
+]
+
+# 실제 개수 (todos 전체를 읽음, 관리용 재계산/검증에만 사용)
+ACTUAL_COUNTS_SQL = "SELECT count(*) AS total, coalesce(sum(completed), 0) AS completed FROM todos"
+
+STORED_COUNTS_SQL = "SELECT name, value FROM todo_counters WHERE name IN ('total', 'completed')"
+
+STORE_COUNT_SQL = """
+INSERT INTO todo_counters (name, value) VALUES (:name, :value)
+ON CONFLICT (name) DO UPDATE SET value = excluded.value
+"""
+
+
+def create_counters(conn: Connection) -> None:
+    """
+    카운터 테이블과 트리거를 없으면 생성
+
+    테이블을 처음 만들 때만 기존 데이터로 값을 채움 (트리거 생성과 같은 트랜잭션)
+    """
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'todo_counters'"
+    ).first()
+    if exists is None:
+        conn.exec_driver_sql(COUNTERS_DDL)
+        total, completed = conn.execute(text(ACTUAL_COUNTS_SQL)).one()
+        conn.execute(
+            text(STORE_COUNT_SQL),
+            [{"name": "total", "value": total}, {"name": "completed", "value": completed}],
+        )
+    for statement in COUNTER_TRIGGERS_DDL:
+        conn.exec_driver_sql(statement)
+
+
+def _to_stats(total: int, completed: int) -> TodoStats:
+    return TodoStats(total=total, open=total - completed, completed=completed)
+
+
+async def read_stored_counts(db: AsyncSession) -> TodoStats:
+    """카운터 테이블에서 읽기 (행 두 개, todos 크기와 무관)"""
+    result = await db.execute(text(STORED_COUNTS_SQL))
+    values = dict(result.tuples().all())
+    return _to_stats(values.get("total", 0), values.get("completed", 0))
+
+
+async def read_actual_counts(db: AsyncSession) -> TodoStats:
+    """todos를 직접 세기"""
+    row = (await db.execute(text(ACTUAL_COUNTS_SQL))).one()
+    return _to_stats(row.total, row.completed)
+
+
+async def recompute_counters(db: AsyncSession) -> tuple[TodoStats, TodoStats]:
+    """
+    카운터를 실제 개수로 다시 맞춤 → (이전 저장값, 실제 개수)
+
+    쓰기 트랜잭션 안에서 실행해야 세는 도중 다른 쓰기가 끼어들지 않음
+    """
+    stored = await read_stored_counts(db)
+    actual = await read_actual_counts(db)
+    if stored != actual:
+        await db.execute(
+            text(STORE_COUNT_SQL),
+            [{"name": "total", "value": actual.total}, {"name": "completed", "value": actual.completed}],
+        )
+    return stored, actual
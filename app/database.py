@@ -1,42 +1,206 @@
 # app/database.py
+import time
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-# SQLite 데이터베이스 URL
-DATABASE_URL = "sqlite+aiosqlite:///./todos.db"
+from app import config
+from app.metrics import pool_checkout_timeouts, pool_checkout_wait, sqlite_lock_wait
+from app.query_log import install_query_log
+from app.timing import start_phase, stop_phase
 
-# 비동기 엔진 생성
-# echo=True: 실행되는 SQL 쿼리를 콘솔에 출력 (학습용)
-engine = create_async_engine(
+# SQLite 데이터베이스 URL (기본값 ./todos.db, TODO_DATABASE_URL로 변경)
+DATABASE_URL = config.DATABASE_URL
+
+# SQLite PRAGMA 프로필 (연결마다 적용)
+# - durable: WAL + synchronous=FULL, 커밋마다 fsync (전원 장애에도 유실 없음)
+# - balanced: WAL + synchronous=NORMAL, 체크포인트 때만 fsync (전원 장애 시 마지막 커밋 몇 개 유실 가능)
+# - throughput: WAL + synchronous=OFF, fsync 안 함 (OS 장애 시 유실 가능, 벤치마크/재생성 가능한 데이터용)
+# cache_size 음수는 KiB 단위 (-65536 = 64MB)
+SQLITE_PRAGMA_PROFILES: dict[str, dict[str, str | int]] = {
+    "durable": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16384,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    "balanced": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "throughput": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+    },
+}
+
+if config.SQLITE_PRAGMA_PROFILE not in SQLITE_PRAGMA_PROFILES:
+    raise ValueError(
+        f"Unknown SQLite pragma profile {config.SQLITE_PRAGMA_PROFILE!r} "
+        f"(choose from {', '.join(SQLITE_PRAGMA_PROFILES)})"
+    )
+
+SQLITE_PRAGMAS = SQLITE_PRAGMA_PROFILES[config.SQLITE_PRAGMA_PROFILE]
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """
+    연결 획득 시간(빈 연결을 기다리는 시간 + 새 연결을 여는 시간)을 /metrics에 기록하는 풀
+    
+    풀 이벤트(checkout)는 연결을 얻은 뒤에만 불리므로 대기 시간을 재려면 connect()를 감싸야 함
+    라벨은 엔진의 pool_logging_name ("read" / "write")
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            pool_checkout_timeouts[self.logging_name] = pool_checkout_timeouts.get(self.logging_name, 0) + 1
+            raise
+        finally:
+            pool_checkout_wait.observe((self.logging_name,), time.perf_counter() - started)
+
+# 비동기 엔진 생성 (읽기/쓰기 분리)
+# SQLite는 동시에 여러 리더 + 단 하나의 writer만 허용하므로 엔진을 나눔
+# - write_engine: 연결 1개, 쓰기 요청은 SQLite 락 대신 풀에서 순서대로 대기
+# - read_engine: 연결 여러 개, query_only로 읽기만 가능 (WAL에서 writer와 동시 실행)
+# SQL 로그는 echo 대신 app/query_log.py의 이벤트 리스너 (느린 문장 + 샘플링)
+# TODO_SQL_ECHO=1이면 예전처럼 모든 문장을 출력 (학습용)
+write_engine = create_async_engine(
+    DATABASE_URL,
+    echo=config.SQL_ECHO,
+    poolclass=MeasuredQueuePool,
+    pool_logging_name="write",
+    pool_size=1,
+    max_overflow=0,
+)
+
+read_engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # SQL 로그 출력
+    echo=config.SQL_ECHO,
+    poolclass=MeasuredQueuePool,
+    pool_logging_name="read",
+    pool_size=config.READ_POOL_SIZE,
+    max_overflow=0,
 )
 
+install_query_log(write_engine)
+install_query_log(read_engine)
+
+@event.listens_for(write_engine.sync_engine, "connect")
+@event.listens_for(read_engine.sync_engine, "connect")
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    새 연결이 풀에 들어올 때마다 PRAGMA 적용
+    
+    대부분의 PRAGMA는 연결 단위 설정이라 첫 연결에만 적용하면 안 됨
+    (journal_mode=WAL만 DB 파일에 영구 저장됨)
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+@event.listens_for(read_engine.sync_engine, "connect")
+def make_read_only(dbapi_connection, connection_record):
+    """읽기 엔진 연결은 쓰기 문장을 거부 (실수로 읽기 세션에서 쓰는 것 방지)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+@event.listens_for(write_engine.sync_engine, "connect")
+def disable_driver_begin(dbapi_connection, connection_record):
+    """드라이버의 자동 BEGIN을 끄고 아래 begin 이벤트에서 직접 BEGIN"""
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(write_engine.sync_engine, "begin")
+def begin_immediate(conn):
+    """
+    쓰기 트랜잭션은 BEGIN IMMEDIATE로 시작
+    
+    기본 BEGIN(DEFERRED)은 첫 쓰기 때 락을 올리다가 'database is locked'로
+    실패할 수 있음 → 시작할 때 바로 쓰기 락을 잡고 busy_timeout 동안 대기
+    (대기 시간은 /metrics의 todo_sqlite_write_lock_wait_seconds)
+    """
+    started = time.perf_counter()
+    try:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    finally:
+        sqlite_lock_wait.observe((), time.perf_counter() - started)
+
+async def read_sqlite_pragmas(conn: AsyncConnection) -> dict[str, str | int]:
+    """연결에 실제로 적용된 PRAGMA 값 조회 (시작 시 확인용)"""
+    effective = {}
+    for name in SQLITE_PRAGMAS:
+        result = await conn.exec_driver_sql(f"PRAGMA {name}")
+        effective[name] = result.scalar()
+    return effective
+
 # 세션 팩토리 생성
 # expire_on_commit=False: 커밋 후에도 객체 속성 접근 가능 (비동기 필수)
-AsyncSessionLocal = async_sessionmaker(
-    engine,
+WriteSessionLocal = async_sessionmaker(
+    write_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+# 요청별 단계 시간 측정 (TODO_SERVER_TIMING=1일 때만 리스너 등록 → 꺼져 있으면 비용 없음)
+# SQLAlchemy 이벤트는 요청 태스크의 contextvar를 그대로 보므로 현재 요청에 기록됨
+# (쓰기 큐 작업자 태스크에는 측정값이 없어서 무시됨, 쓰기는 main.py에서 write_queue 단계로 측정)
+if config.SERVER_TIMING:
+    @event.listens_for(Session, "do_orm_execute")
+    def start_checkout_timing(orm_execute_state: ORMExecuteState):
+        """세션의 첫 문장이면 연결 획득(풀 대기 포함) 시간 측정 시작"""
+        if not orm_execute_state.session.in_transaction():
+            start_phase("db_checkout")
+
+    @event.listens_for(read_engine.sync_engine, "checkout")
+    def stop_checkout_timing(dbapi_connection, connection_record, connection_proxy):
+        stop_phase("db_checkout")
+
+    @event.listens_for(read_engine.sync_engine, "before_cursor_execute")
+    def start_query_timing(conn, cursor, statement, parameters, context, executemany):
+        start_phase("db_query")
+
+    @event.listens_for(read_engine.sync_engine, "after_cursor_execute")
+    def stop_query_timing(conn, cursor, statement, parameters, context, executemany):
+        stop_phase("db_query")
+
 # 모델 베이스 클래스
 class Base(DeclarativeBase):
     """모든 모델이 상속받을 베이스 클래스"""
     pass
 
 # 의존성 주입용 함수
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI 의존성 주입으로 세션 제공
+    FastAPI 의존성 주입으로 읽기 전용 세션 제공 (GET 엔드포인트용)
     
     Django와의 차이:
-    - Django: 자동으로 각 요청마다 DB 연결 관리
+    - Django: 자동으로 각 요청마다 DB 연결 관리 (DATABASE_ROUTERS로 읽기/쓰기 분리)
     - FastAPI: 명시적으로 의존성 주입 패턴 사용
     """
-    async with AsyncSessionLocal() as session:
+    async with ReadSessionLocal() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
@@ -0,0 +1,96 @@
+# app/filters.py
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, String, Update, false, select, true, type_coerce, update
+
+from app.models import Todo, completed_at_on_update
+from app.pagination import to_db_timestamp
+from app.serialization import select_columns
+
+
+def to_db_utc(value: datetime) -> str:
+    """
+    요청의 datetime → DB 비교용 문자열
+
+    CURRENT_TIMESTAMP는 UTC라서 시간대가 있는 값은 UTC로 바꾸고,
+    시간대가 없는 값은 UTC로 간주
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return to_db_timestamp(value)
+
+
+def todo_filters(
+    completed: bool | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    updated_after: datetime | None = None,
+    updated_before: datetime | None = None,
+) -> list[ColumnElement[bool]]:
+    """
+    목록 필터 → WHERE 조건 목록 (Django의 .filter(completed=..., created_at__gte=...))
+
+    - *_after는 그 시각 포함(>=), *_before는 제외(<)
+    - completed는 바인드 파라미터 대신 상수(0/1)로 렌더링해야 플래너가 값을 보고
+      ix_todos_completed_created_at(completed, created_at, id)으로 범위를 좁힘
+    - updated_*는 인덱스로 거르지 못함: 정렬이 created_at이라 플래너는
+      ix_todos_created_at_id를 따라가며 행마다 updated_at을 비교함 (범위가 좁으면 느려질 수 있음)
+    """
+    conditions: list[ColumnElement[bool]] = []
+    if completed is not None:
+        conditions.append(Todo.completed == (true() if completed else false()))
+
+    created_at = type_coerce(Todo.created_at, String)
+    updated_at = type_coerce(Todo.updated_at, String)
+    if created_after is not None:
+        conditions.append(created_at >= to_db_utc(created_after))
+    if created_before is not None:
+        conditions.append(created_at < to_db_utc(created_before))
+    if updated_after is not None:
+        conditions.append(updated_at >= to_db_utc(updated_after))
+    if updated_before is not None:
+        conditions.append(updated_at < to_db_utc(updated_before))
+    return conditions
+
+
+def list_todos_query(
+    fields: Sequence[str] | None = None,
+    conditions: Sequence[ColumnElement[bool]] = (),
+    limit: int = 20,
+) -> Select:
+    """
+    GET /todos의 SELECT (컬럼, 필터, 정렬, LIMIT)
+
+    커서(after_cursor) 또는 OFFSET은 호출하는 쪽에서 붙임
+    tests/test_query_plans.py도 이 함수로 만든 문장의 실행 계획을 확인함
+    """
+    return (
+        select(*select_columns(fields))
+        .where(*conditions)
+        .order_by(Todo.created_at.desc(), Todo.id.desc())  # Django의 order_by('-created_at', '-id')
+        .limit(limit)  # Django의 [:limit]
+    )
+
+
+def update_todo_query(todo_id: int, changes: Mapping[str, Any]) -> Update | Select:
+    """
+    PUT /todos/{todo_id}의 문장 (바꿀 필드가 없으면 쓰기 없이 조회만)
+
+    UPDATE todos SET ... WHERE id = ? RETURNING * (updated_at은 onupdate로 갱신)
+    completed를 바꾸면 completed_at도 함께 (completed_at_on_update)
+    tests/test_query_plans.py도 이 함수로 만든 문장의 실행 계획을 확인함
+    """
+    values = dict(changes)
+    if "completed" in values:
+        values["completed_at"] = completed_at_on_update(values["completed"])
+    if not values:
+        return select(Todo).where(Todo.id == todo_id)
+    return (
+        update(Todo)
+        .where(Todo.id == todo_id)
+        .values(**values)
+        .returning(Todo)
+        .execution_options(synchronize_session=False)
+    )
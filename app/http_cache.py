@@ -0,0 +1,67 @@
+# app/http_cache.py
+import hashlib
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any
+
+
+def todo_fingerprint(todo: Any, fields: Sequence[str] | None = None) -> bytes:
+    """
+    ETag 계산용 행 지문: id + updated_at + 내용
+
+    updated_at은 CURRENT_TIMESTAMP(초 단위)라서 같은 초에 두 번 수정되면
+    값이 같음 → 내용까지 넣어야 낡은 304가 나가지 않음
+    (JSON 직렬화보다 훨씬 가벼움)
+    completed_at은 백필이 updated_at을 바꾸지 않고 채우므로 따로 넣음
+
+    fields(?fields=)를 주면 응답에 담긴 필드 값과 필드 목록으로 계산
+    → 필드 조합마다 다른 ETag, 응답에 없는 필드만 바뀌면 그대로
+    """
+    if fields is None:
+        return (
+            f"{todo.id}|{todo.updated_at.isoformat()}|{todo.completed:d}|"
+            f"{todo.completed_at}|{todo.title}|{todo.description}"
+        ).encode()
+    values = [",".join(fields), todo.id, todo.updated_at.isoformat()]
+    values.extend(getattr(todo, name) for name in fields)
+    return "|".join(map(str, values)).encode()
+
+
+def todo_etag(todo: Any, fields: Sequence[str] | None = None) -> str:
+    """할일 하나의 strong ETag"""
+    return f'"{hashlib.blake2b(todo_fingerprint(todo, fields), digest_size=12).hexdigest()}"'
+
+
+def page_etag(todos: Iterable[Any], fields: Sequence[str] | None = None) -> str:
+    """목록 페이지의 weak ETag (행 수, 각 행 지문으로 계산)"""
+    digest = hashlib.blake2b(digest_size=12)
+    count = 0
+    for todo in todos:
+        digest.update(todo_fingerprint(todo, fields))
+        digest.update(b"\n")
+        count += 1
+    digest.update(str(count).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """DB 시각(UTC, naive) → Last-Modified 헤더 형식"""
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더가 etag와 일치하는지 (weak 비교)
+
+    GET의 If-None-Match는 W/ 접두사를 무시하고 비교함 (RFC 9110)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == target
+        for candidate in if_none_match.split(",")
+    )
@@ -1,32 +1,83 @@
 # app/main.py
+import json
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, HTTPException
+from datetime import datetime
+from typing import Literal
+from fastapi import FastAPI, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 
-from .database import engine, get_db, Base
+from . import config
+from .database import read_engine, write_engine, get_read_db, read_sqlite_pragmas
 from .models import Todo
-from .schemas import TodoCreate, TodoUpdate, TodoResponse
+from .schemas import (
+    TodoCreate, TodoUpdate, TodoResponse, TodoDeleteResult, TodoImportResult, TodoSearchResult,
+    TodoStats, TodoCounterCheck, BackfillStatus, BackfillThrottle,
+)
+from .pagination import after_cursor, decode_cursor, encode_cursor, decode_search_cursor, encode_search_cursor
+from .search import build_match_query, search_todos
+from .filters import list_todos_query, todo_filters, update_todo_query
+from .counters import read_actual_counts, read_stored_counts, recompute_counters
+from .write_queue import write_queue
+from .migrations import migrate, schema_report
+from .backfills import BACKFILLS, backfill_runner
+from .cache import todo_cache
+from .http_cache import etag_matches, http_date, page_etag, todo_etag
+from .streaming import export_todos, import_todos
+from .compression import CompressionMiddleware, compression_stats
+from .timing import ServerTimingMiddleware, timed
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, render_metrics
+from .query_log import QueryCountMiddleware
+from .serialization import parse_fields, render_todo_row, render_todo_rows, select_columns
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     앱 생명주기 관리
-    Django의 migrate와 유사하게 시작 시 테이블 생성
+    Django의 migrate와 유사하게 시작 시 스키마를 최신 버전으로 맞춤
+    (이미 최신이면 버전 확인 한 번으로 끝, app/migrations.py)
     """
     print("🚀 데이터베이스 초기화 중...")
     
-    # 테이블 생성
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    report = await migrate(read_engine, write_engine)
+    async with read_engine.connect() as conn:
+        pragmas = await read_sqlite_pragmas(conn)
+    
+    if report.applied:
+        print(
+            f"✅ 마이그레이션 {len(report.applied)}개 적용 → 스키마 v{report.version} "
+            f"({report.seconds * 1000:.1f}ms, 락 대기 {report.lock_wait_seconds * 1000:.1f}ms)"
+        )
+        for migration in report.applied:
+            print(f"   v{migration['version']} {migration['name']}: {migration['duration_ms']:.1f}ms")
+    else:
+        # 다른 워커가 먼저 적용했으면 락 대기 시간도 함께 표시
+        waited = f", 락 대기 {report.lock_wait_seconds * 1000:.1f}ms" if report.lock_wait_seconds else ""
+        print(f"✅ 스키마 v{report.version} 최신 ({report.seconds * 1000:.1f}ms{waited})")
+    print(
+        f"⚙️  SQLite PRAGMA ({config.SQLITE_PRAGMA_PROFILE}): "
+        + ", ".join(f"{name}={value}" for name, value in pragmas.items())
+    )
+    
+    write_queue.start()
     
-    print("✅ 테이블 생성 완료")
+    # 마이그레이션이 등록한 백필, 지난번 실행 중 종료된 백필을 이어서 실행 (app/backfills.py)
+    if config.BACKFILL_AUTO_START:
+        resumed = await backfill_runner.resume()
+        if resumed:
+            print(f"🔁 백필 실행: {', '.join(resumed)}")
     
     yield  # 앱 실행
     
-    # 종료 시 정리
+    # 종료 시 정리 (진행 중인 백필 배치와 대기 중인 쓰기를 모두 커밋한 뒤 연결 종료)
+    await backfill_runner.stop()
+    await write_queue.stop()
     print("👋 데이터베이스 연결 종료")
-    await engine.dispose()
+    await read_engine.dispose()
+    await write_engine.dispose()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -35,43 +86,312 @@ app = FastAPI(
     lifespan=lifespan  # ← lifespan 등록
 )
 
+# 응답 압축 (Django의 GZipMiddleware와 유사, gzip 외에 br/zstd도 설치돼 있으면 협상)
+app.add_middleware(CompressionMiddleware)
+
+# 요청당 SQL 문장 수와 N+1 경고 (문장 로그 자체는 app/query_log.py의 엔진 리스너)
+app.add_middleware(QueryCountMiddleware)
+
+# 라우트별 지연/처리 중/상태 코드 (압축 시간 포함, 라우트 목록을 넘겨 요청 전에 라우트 템플릿을 찾음)
+app.add_middleware(MetricsMiddleware, routes=app.routes)
+
+# 요청별 단계 시간 측정 (켜져 있을 때만 등록, 가장 바깥에서 압축 시간까지 포함)
+if config.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+
 @app.get("/")
 async def root():
     return {"message": "Todo API with SQLAlchemy 2.0"}
 
+@app.get("/internal/stats")
+async def internal_stats():
+    """모니터링용 내부 통계 (쓰기 큐 배치 크기/대기 시간, 캐시 적중률, 응답 압축률/CPU 시간)"""
+    return {
+        "write_queue": write_queue.stats.as_dict(),
+        "todo_cache": todo_cache.as_dict(),
+        "compression": compression_stats.as_dict(),
+        "schema": schema_report.as_dict(),
+        "backfills": backfill_runner.as_dict(),
+    }
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Prometheus 수집용 지표 (텍스트 형식)
+    
+    HTTP 지연 히스토그램/처리 중/상태 코드, 읽기·쓰기 연결 풀 상태와 획득 대기,
+    SQLite 쓰기 락 대기와 재시도, 쓰기 큐, 캐시, 응답 압축
+    
+    Django와의 차이:
+    - Django: django-prometheus 같은 패키지의 미들웨어 + 뷰
+    - FastAPI: 순수 ASGI 미들웨어로 직접 집계하고 요청 시점에 텍스트로 출력 (별도 exporter 없음)
+    """
+    body = render_metrics(
+        {"read": read_engine.pool, "write": write_engine.pool},
+        write_queue,
+        todo_cache,
+        compression_stats,
+        schema_report,
+    )
+    return Response(content=body, media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/internal/counters/verify", response_model=TodoCounterCheck)
+async def verify_counters(db: AsyncSession = Depends(get_read_db)):
+    """
+    집계 카운터 검증 (todos를 직접 세서 비교, 고치지는 않음)
+    
+    같은 읽기 트랜잭션(스냅샷) 안에서 둘 다 읽으므로 진행 중인 쓰기와 무관하게 비교 가능
+    todos 전체를 읽으므로 운영 중에는 가끔만 호출
+    """
+    stored = await read_stored_counts(db)
+    actual = await read_actual_counts(db)
+    return TodoCounterCheck(stored=stored, actual=actual, consistent=stored == actual)
+
+@app.post("/internal/counters/recompute", response_model=TodoCounterCheck)
+async def recompute_counters_endpoint():
+    """
+    집계 카운터 재계산 (어긋나 있으면 실제 개수로 고침)
+    
+    쓰기 큐를 거쳐 한 쓰기 트랜잭션 안에서 세고 고치므로 다른 쓰기와 섞이지 않음
+    """
+    with timed("write_queue"):
+        stored, actual = await write_queue.submit(recompute_counters)
+    consistent = stored == actual
+    return TodoCounterCheck(stored=stored, actual=actual, consistent=consistent, repaired=not consistent)
+
+def get_backfill_name(name: str) -> str:
+    """경로의 백필 이름 검증 (등록되지 않은 이름이면 404)"""
+    if name not in BACKFILLS:
+        raise HTTPException(status_code=404, detail="Backfill not found")
+    return name
+
+async def backfill_status(name: str) -> BackfillStatus:
+    for status in await backfill_runner.status():
+        if status["name"] == name:
+            return BackfillStatus(**status)
+    # 등록한 마이그레이션이 아직 적용되지 않은 백필
+    raise HTTPException(status_code=404, detail="Backfill not registered")
+
+@app.get("/internal/backfills", response_model=list[BackfillStatus])
+async def list_backfills():
+    """
+    백필 진행 상태 (backfill_progress 테이블, 진행 위치는 배치마다 커밋됨)
+    
+    Django와의 차이:
+    - Django: RunPython 데이터 마이그레이션은 migrate 명령 안에서 한 트랜잭션으로 끝까지 실행
+    - 여기: 스키마 마이그레이션은 즉시 끝내고 기존 행은 서비스 중에 작은 배치로 나눠 채움
+    """
+    return await backfill_runner.status()
+
+@app.post("/internal/backfills/{name}/start", response_model=BackfillStatus)
+async def start_backfill(name: str = Depends(get_backfill_name)):
+    """
+    백필 시작/재개 (멈춘 위치 다음 id부터, 이미 끝났으면 409)
+    
+    이 프로세스에서 백그라운드로 실행되고 배치마다 쓰기 큐를 거쳐 커밋
+    """
+    with timed("write_queue"):
+        started = await backfill_runner.start(name)
+    if not started:
+        raise HTTPException(status_code=409, detail="Backfill already done or not registered")
+    return await backfill_status(name)
+
+@app.post("/internal/backfills/{name}/pause", response_model=BackfillStatus)
+async def pause_backfill(name: str = Depends(get_backfill_name)):
+    """백필 일시 정지 (진행 중인 배치는 커밋되고 다음 배치부터 멈춤, 자동 재개도 안 함)"""
+    with timed("write_queue"):
+        paused = await backfill_runner.pause(name)
+    if not paused:
+        raise HTTPException(status_code=409, detail="Backfill is not pending or running")
+    return await backfill_status(name)
+
+@app.post("/internal/backfills/throttle", response_model=BackfillThrottle)
+async def throttle_backfills(throttle: BackfillThrottle):
+    """
+    백필 속도 조절 (배치 크기, 배치 사이 쉬는 시간)
+    
+    이 프로세스의 모든 백필에 다음 배치부터 적용 (재시작하면 설정값으로 돌아감)
+    """
+    backfill_runner.throttle(
+        throttle.batch_size, None if throttle.pause_ms is None else throttle.pause_ms / 1000
+    )
+    return BackfillThrottle(batch_size=backfill_runner.batch_size, pause_ms=backfill_runner.pause_seconds * 1000)
+
+def todo_fields(
+    fields: str | None = Query(None, description="응답에 담을 필드 (쉼표로 구분, 예: id,title,completed)")
+) -> tuple[str, ...] | None:
+    """
+    ?fields= 의존성 → 응답 필드 목록 (None이면 전체)
+    
+    모르는 필드는 다른 검증 오류와 같은 형식의 422로 거부
+    """
+    try:
+        return parse_fields(fields)
+    except ValueError as exc:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("query", "fields"), "msg": str(exc), "input": fields}]
+        )
+
 @app.get("/todos", response_model=list[TodoResponse])
 async def list_todos(
     skip: int = 0,
     limit: int = 20,
-    db: AsyncSession = Depends(get_db)
+    cursor: str | None = None,
+    completed: bool | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    updated_after: datetime | None = None,
+    updated_before: datetime | None = None,
+    fields: tuple[str, ...] | None = Depends(todo_fields),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     할일 목록 조회
     
     Django와의 차이:
     - select() 문으로 명시적 쿼리 작성
-    - execute() → scalars() → all() 3단계 과정
+    - execute() → all() 2단계 과정
+    - ORM 객체 대신 컬럼 튜플만 읽고(Django의 .values_list()), 
+      response_model 검증 없이 JSON을 직접 만들어 반환 (출력 형식은 TodoResponse 그대로)
+    
+    페이지네이션:
+    - skip: 기존 OFFSET 방식 (하위 호환용, 깊은 페이지일수록 느려짐)
+    - cursor: 응답 헤더 X-Next-Cursor 값을 넘기면 그 다음 페이지부터 조회
+      (keyset 방식, 페이지 깊이와 무관하게 일정한 비용, 지정 시 skip 무시)
+    
+    필터 (Django의 .filter()):
+    - completed: 완료 여부
+    - created_after/before, updated_after/before: 시각 범위 (after는 포함, before는 제외)
+      (updated_*는 인덱스로 거르지 않음: created_at 순서로 읽으며 행마다 비교)
+    - 커서로 다음 페이지를 볼 때도 같은 필터를 넘겨야 함
+    
+    fields: 응답에 담을 필드만 지정 (Django의 .only()) → SELECT 컬럼 자체가 줄어듦
     """
     # 1. 쿼리 작성 (아직 실행 안 됨), statement
-    stmt = (
-        select(Todo)
-        .order_by(Todo.created_at.desc())  # Django의 order_by('-created_at')
-        .offset(skip)  # Django의 [skip:]
-        .limit(limit)  # Django의 [:limit]
+    stmt = list_todos_query(
+        fields,
+        todo_filters(completed, created_after, created_before, updated_after, updated_before),
+        limit,
     )
     
+    if cursor is not None:
+        try:
+            stmt = stmt.where(after_cursor(decode_cursor(cursor)))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    else:
+        stmt = stmt.offset(skip)  # Django의 [skip:]
+    
     # 2. 쿼리 실행
     result = await db.execute(stmt)
     
-    # 3. 결과 추출
-    todos = result.scalars().all()
+    # 3. 결과 추출 (Row는 todo.id처럼 속성으로 접근 가능)
+    with timed("fetch"):
+        todos = result.all()
+    
+    # 조건부 요청용 헤더: 페이지 내용으로 만든 weak ETag, 가장 최근 수정 시각
+    with timed("etag"):
+        headers = {"ETag": page_etag(todos, fields)}
+        if todos:
+            headers["Last-Modified"] = http_date(max(todo.updated_at for todo in todos))
+    
+    # 페이지가 꽉 찼으면 다음 페이지가 있을 수 있으므로 커서 제공
+    if todos and len(todos) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(todos[-1])
+    
+    # 페이지가 바뀌지 않았으면 직렬화 없이 304
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
+    # 미리 만든 JSON을 그대로 반환 (response_model은 문서화용으로만 쓰임)
+    with timed("serialize"):
+        content = render_todo_rows(todos, fields)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+@app.get("/todos/search", response_model=list[TodoSearchResult])
+async def search_todos_endpoint(
+    response: Response,
+    q: str = Query(..., min_length=1, description="검색어 (단어 끝에 *를 붙이면 접두어 검색)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    할일 전문 검색 (제목 + 설명)
+    
+    Django와의 차이:
+    - Django의 SearchVector/SearchRank(PostgreSQL)와 비슷한 역할을 SQLite FTS5로
+    - 관련도(BM25) 순 정렬, 일치 부분 발췌(snippet) 포함
+    - 다음 페이지는 응답 헤더 X-Next-Cursor 값을 cursor로 넘김 (keyset)
+    
+    /todos/{todo_id}보다 먼저 등록해야 "search"가 todo_id로 해석되지 않음
+    """
+    match_query = build_match_query(q)
+    if not match_query:
+        raise HTTPException(status_code=400, detail="Search query has no searchable terms")
+    
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_search_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    results = await search_todos(db, match_query, limit, after)
+    
+    if len(results) == limit:
+        response.headers["X-Next-Cursor"] = encode_search_cursor(results[-1].rank, results[-1].id)
+    
+    return results
+
+@app.get("/todos/stats", response_model=TodoStats)
+async def todo_stats(db: AsyncSession = Depends(get_read_db)):
+    """
+    할일 개수 집계 (전체/미완료/완료)
+    
+    Django와의 차이:
+    - Todo.objects.count()처럼 매번 세지 않고, 트리거가 유지하는 카운터 테이블을 읽음
+      → todos 크기와 무관하게 행 두 개만 읽음
+    
+    /todos/{todo_id}보다 먼저 등록해야 "stats"가 todo_id로 해석되지 않음
+    """
+    return await read_stored_counts(db)
+
+@app.get(
+    "/todos/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+async def export_todos_endpoint(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format")
+):
+    """
+    할일 전체 내보내기 (NDJSON 또는 CSV 스트리밍)
+    
+    Django와의 차이:
+    - Django의 StreamingHttpResponse + .iterator(chunk_size=...)와 유사
+    - 첫 묶음을 읽자마자 전송 시작, 전체를 메모리에 올리지 않음
     
-    return todos
+    /todos/{todo_id}보다 먼저 등록해야 "export"가 todo_id로 해석되지 않음
+    """
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_todos(fmt),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="todos.{fmt}"'},
+    )
+
+def serialize_todo(todo: Todo) -> bytes:
+    """Todo → TodoResponse JSON 바이트 (캐시에 그대로 저장하고 응답으로 보냄)"""
+    return TodoResponse.model_validate(todo).model_dump_json().encode()
 
 @app.get("/todos/{todo_id}", response_model=TodoResponse)
 async def get_todo(
     todo_id: int,
-    db: AsyncSession = Depends(get_db)
+    fields: tuple[str, ...] | None = Depends(todo_fields),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     특정 할일 조회
@@ -79,11 +399,27 @@ async def get_todo(
     Django와의 차이:
     - .get() 대신 select() + where()
     - 명시적 404 처리
+    - 직렬화된 응답을 메모리 캐시에 저장 (Django의 cache framework와 유사)
+    - ETag + If-None-Match 조건부 요청 (Django의 ConditionalGetMiddleware와 유사)
+    - fields를 지정하면 그 컬럼만 읽음 (Django의 .only()), 캐시는 전체 응답만 저장하므로 사용 안 함
     """
+    if fields is not None:
+        return await get_todo_fields(db, todo_id, fields, if_none_match)
+    
+    # 캐시에 있으면 DB 조회와 직렬화 모두 생략
+    with timed("cache"):
+        cached = todo_cache.get(todo_id)
+    if cached is not None:
+        if etag_matches(if_none_match, cached.etag):
+            return Response(status_code=304, headers={"ETag": cached.etag})
+        return Response(content=cached.payload, media_type="application/json", headers={"ETag": cached.etag})
+    
     # 쿼리 작성
+    token = todo_cache.fill_token()
     stmt = select(Todo).where(Todo.id == todo_id)
     result = await db.execute(stmt)
-    todo = result.scalar_one_or_none()
+    with timed("hydrate"):
+        todo = result.scalar_one_or_none()
     
     # 404 처리
     if todo is None:
@@ -92,47 +428,204 @@ async def get_todo(
             detail=f"Todo with id {todo_id} not found"
         )
     
-    return todo
+    # 클라이언트가 가진 버전과 같으면 본문 직렬화 없이 304
+    with timed("etag"):
+        etag = todo_etag(todo)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    with timed("serialize"):
+        payload = serialize_todo(todo)
+    todo_cache.fill(todo_id, payload, etag, token)
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+async def get_todo_fields(
+    db: AsyncSession,
+    todo_id: int,
+    fields: tuple[str, ...],
+    if_none_match: str | None,
+) -> Response:
+    """get_todo의 ?fields= 경로: 필요한 컬럼만 Core로 읽어 바로 직렬화"""
+    stmt = select(*select_columns(fields)).where(Todo.id == todo_id)
+    result = await db.execute(stmt)
+    with timed("fetch"):
+        row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Todo with id {todo_id} not found"
+        )
+    
+    with timed("etag"):
+        etag = todo_etag(row, fields)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    with timed("serialize"):
+        content = render_todo_row(row, fields)
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
 @app.post("/todos", response_model=TodoResponse, status_code=201)
-async def create_todo(
-    todo_data: TodoCreate,
-    db: AsyncSession = Depends(get_db)  # Django의 request와 유사
-):
+async def create_todo(todo_data: TodoCreate):
     """
     할일 생성
     
     Django와의 차이:
     - 명시적 세션 관리
-    - add → commit → refresh 3단계
+    - INSERT ... RETURNING 한 문장으로 저장과 동시에
+      DB 생성 값(id, created_at, updated_at)을 받아옴 → refresh 불필요
+    - 커밋은 write_queue가 다른 쓰기 요청과 묶어서 한 번에 처리 (그룹 커밋)
     """
-    # 1. 모델 인스턴스 생성 (Django와 동일)
-    todo = Todo(
-        title=todo_data.title,
-        description=todo_data.description,
-        completed=todo_data.completed,
+    # 1. INSERT 문 작성 (Django의 Todo.objects.create()와 유사)
+    stmt = (
+        insert(Todo)
+        .values(**todo_data.model_dump())
+        .returning(Todo)
     )
     
-    # 2. 세션에 추가 (Django의 save() 전 상태)
-    db.add(todo)
-    # 이 시점에는 아직 DB에 저장 안 됨!
-    # Django는 .save() 호출 시 즉시 저장
+    # 2. 쓰기 작업 정의 (RETURNING 결과가 곧 생성된 Todo 객체)
+    async def insert_todo(db: AsyncSession) -> Todo:
+        result = await db.scalars(stmt)
+        return result.one()
     
-    # 3. 커밋 (실제 DB에 저장)
-    await db.commit()
-    # Django: todo.save()와 동일한 효과
+    # 3. 큐에 넣고 커밋될 때까지 대기 (실제 DB에 저장)
+    with timed("write_queue"):
+        todo = await write_queue.submit(insert_todo)
     
-    # 4. 리프레시 (DB에서 생성된 값 가져오기)
-    await db.refresh(todo)
-    # id, created_at 같은 DB 생성 값을 가져옴
+    # 4. 커밋된 값으로 캐시 채우기 (생성 직후 조회가 흔함)
+    with timed("serialize"):
+        todo_cache.put(todo.id, serialize_todo(todo), todo_etag(todo))
     
     return todo
 
+# 요청 본문 → list[TodoCreate] 검증기 (한 번만 만들어 재사용)
+todo_create_list = TypeAdapter(list[TodoCreate])
+
+
+async def read_bulk_body(request: Request) -> list[TodoCreate]:
+    """
+    일괄 생성 요청 본문 파싱
+    
+    - application/json: 할일 객체의 JSON 배열
+    - application/x-ndjson: 한 줄에 할일 객체 하나 (빈 줄 무시)
+    
+    본문이 BULK_MAX_BODY_BYTES를 넘으면 다 읽기 전에 413
+    (Content-Length가 있으면 읽지 않고, 없으면 받는 도중 한도를 넘는 순간)
+    NDJSON은 JSON 파싱 전에 줄 수로 BULK_MAX_ITEMS를 확인
+    """
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Request body too large (max {config.BULK_MAX_BODY_BYTES} bytes)"
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > config.BULK_MAX_BODY_BYTES:
+        raise too_large
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > config.BULK_MAX_BODY_BYTES:
+            raise too_large
+    content_type = request.headers.get("content-type", "")
+    
+    try:
+        if content_type.startswith("application/x-ndjson"):
+            lines = [line for line in body.splitlines() if line.strip()]
+            if len(lines) > config.BULK_MAX_ITEMS:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Too many todos in one request (max {config.BULK_MAX_ITEMS})"
+                )
+            items = [json.loads(line) for line in lines]
+        else:
+            items = json.loads(body)
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", exc.pos), "msg": "JSON decode error", "input": {}}]
+        )
+    
+    if isinstance(items, list) and len(items) > config.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many todos in one request (max {config.BULK_MAX_ITEMS})"
+        )
+    
+    try:
+        return todo_create_list.validate_python(items)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
+
+
+@app.post(
+    "/todos/bulk",
+    response_model=list[TodoResponse],
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": TodoCreate.model_json_schema()}
+                },
+                "application/x-ndjson": {"schema": TodoCreate.model_json_schema()},
+            },
+        }
+    },
+)
+async def create_todos_bulk(request: Request):
+    """
+    할일 일괄 생성
+    
+    Django와의 차이:
+    - Django의 bulk_create()와 유사
+    - INSERT ... RETURNING 한 번으로 생성된 id, 시각까지 가져옴 (refresh 불필요)
+    - 전체가 한 트랜잭션: 하나라도 검증 실패하면 아무것도 저장 안 됨
+    """
+    todos_data = await read_bulk_body(request)
+    if not todos_data:
+        return []
+    
+    # 1. 여러 행을 한 번에 INSERT (sort_by_parameter_order: 요청 순서대로 결과 반환)
+    stmt = insert(Todo).returning(Todo, sort_by_parameter_order=True)
+    
+    async def insert_todos(db: AsyncSession) -> list[Todo]:
+        result = await db.scalars(stmt, [todo.model_dump() for todo in todos_data])
+        return list(result.all())
+    
+    # 2. 한 번만 커밋
+    with timed("write_queue"):
+        return await write_queue.submit(insert_todos)
+
+@app.post(
+    "/todos/import",
+    response_model=TodoImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": TodoCreate.model_json_schema()}},
+        }
+    },
+)
+async def import_todos_endpoint(request: Request):
+    """
+    할일 대량 가져오기 (NDJSON 스트리밍)
+    
+    Django와의 차이:
+    - Django의 loaddata와 비슷하지만 본문을 한 줄씩 읽으면서 처리
+    - IMPORT_CHUNK_SIZE 행마다 따로 커밋 (전체가 한 트랜잭션이 아님)
+    - 잘못된 줄은 거부하고 나머지는 저장, 결과에 줄 번호별 오류 보고
+    - 묶음 커밋이 실패하면 500이지만 본문은 같은 형식 (그 전까지 저장된 수, 실패한 줄 범위)
+    """
+    result = await import_todos(request.stream())
+    if result.aborted is not None:
+        return JSONResponse(status_code=500, content=result.model_dump(mode="json"))
+    return result
+
 @app.put("/todos/{todo_id}", response_model=TodoResponse)
 async def update_todo(
     todo_id: int,
     todo_data: TodoUpdate,
-    db: AsyncSession = Depends(get_db)
 ):
     """
     할일 수정
@@ -140,49 +633,89 @@ async def update_todo(
     Django와의 차이:
     - 명시적 commit 필요
     - exclude_unset으로 부분 업데이트
+    - Django의 .filter(id=...).update(...)처럼 조회 없이 UPDATE 한 번
+      (RETURNING으로 수정된 행을 바로 받아서 refresh 불필요)
     """
-    # 1. 기존 데이터 조회
-    stmt = select(Todo).where(Todo.id == todo_id)
-    result = await db.execute(stmt)
-    todo = result.scalar_one_or_none()
+    # 1. UPDATE todos SET ... WHERE id = ? RETURNING * (updated_at은 onupdate로 갱신)
+    # 바꿀 필드가 없으면 쓰기 없이 조회만
+    stmt = update_todo_query(todo_id, todo_data.model_dump(exclude_unset=True))
+    
+    async def update_row(db: AsyncSession) -> Todo | None:
+        result = await db.scalars(stmt)
+        return result.one_or_none()
     
+    # 2. 커밋 (Django의 .save())
+    with timed("write_queue"):
+        todo = await write_queue.submit(update_row)
+    
+    # 일치하는 행이 없으면 404
     if todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     
-    # 2. 데이터 업데이트
-    update_data = todo_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(todo, field, value)
-    
-    # 3. 커밋 (Django의 .save())
-    await db.commit()
-    await db.refresh(todo)
+    # 커밋된 값으로 캐시 갱신
+    with timed("serialize"):
+        todo_cache.put(todo.id, serialize_todo(todo), todo_etag(todo))
     
     return todo
 
 @app.delete("/todos/{todo_id}", status_code=204)
-async def delete_todo(
-    todo_id: int,
-    db: AsyncSession = Depends(get_db)
-):
+async def delete_todo(todo_id: int):
     """
     할일 삭제
     
     Django와의 차이:
-    - session.delete() + commit
+    - Django의 .filter(id=...).delete()처럼 조회 없이 DELETE 한 번
+    - RETURNING id로 실제 삭제 여부 확인
     - 204 No Content 상태 코드
     """
-    # 조회
-    stmt = select(Todo).where(Todo.id == todo_id)
-    result = await db.execute(stmt)
-    todo = result.scalar_one_or_none()
+    # DELETE FROM todos WHERE id = ? RETURNING id
+    stmt = delete(Todo).where(Todo.id == todo_id).returning(Todo.id)
     
-    if todo is None:
+    async def delete_row(db: AsyncSession) -> int | None:
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+    
+    with timed("write_queue"):
+        deleted_id = await write_queue.submit(delete_row)
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     
-    # 삭제
-    await db.delete(todo)
-    await db.commit()
+    todo_cache.invalidate(todo_id)
     
     # 204는 응답 본문 없음
-    return None
\ No newline at end of file
+    return None
+
+@app.delete("/todos", response_model=TodoDeleteResult)
+async def delete_todos(
+    ids: list[int] = Query(..., description="삭제할 할일 id (?ids=1&ids=2)"),
+):
+    """
+    할일 여러 개 삭제
+    
+    Django와의 차이:
+    - Django의 .filter(id__in=ids).delete()와 유사
+    - DELETE ... WHERE id IN (...) RETURNING id 한 번으로 처리
+    """
+    if len(ids) > config.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many ids in one request (max {config.BULK_MAX_ITEMS})"
+        )
+    
+    stmt = delete(Todo).where(Todo.id.in_(ids)).returning(Todo.id)
+    
+    async def delete_rows(db: AsyncSession) -> set[int]:
+        result = await db.execute(stmt)
+        return set(result.scalars().all())
+    
+    with timed("write_queue"):
+        deleted = await write_queue.submit(delete_rows)
+    for todo_id in deleted:
+        todo_cache.invalidate(todo_id)
+    
+    # 요청 순서를 유지하고 중복 id는 한 번만
+    requested = list(dict.fromkeys(ids))
+    return TodoDeleteResult(
+        deleted=[todo_id for todo_id in requested if todo_id in deleted],
+        not_found=[todo_id for todo_id in requested if todo_id not in deleted],
+    )
@@ -0,0 +1,355 @@
+# app/metrics.py
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from sqlalchemy.pool import Pool
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+if TYPE_CHECKING:
+    from app.cache import TodoCache
+    from app.compression import CompressionStats
+    from app.migrations import SchemaReport
+    from app.write_queue import WriteCoordinator
+
+# Prometheus 텍스트 형식 (별도 exporter/라이브러리 없이 /metrics에서 직접 출력)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청 지연 버킷(초): 캐시 적중(~1ms)부터 대용량 내보내기(~10s)까지
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 연결/락 대기 버킷(초): 평소엔 거의 0, busy_timeout(5s) 근처까지
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# 요청당 SQL 문장 수 버킷
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 라우트에 매칭되지 않은 요청(404)의 route 라벨 (경로를 그대로 쓰면 라벨 종류가 무한히 늘어남)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class HistogramSeries:
+    """라벨 조합 하나의 버킷별 개수 (누적이 아닌 구간별, 출력할 때 누적으로 바꿈)"""
+    counts: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+class Histogram:
+    """라벨 값 튜플 → HistogramSeries (Prometheus histogram)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.series: dict[tuple[str, ...], HistogramSeries] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            # 마지막 칸은 +Inf
+            series = self.series[labels] = HistogramSeries([0] * (len(self.buckets) + 1))
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+
+@dataclass
+class HttpMetrics:
+    """라우트별 요청 지연, 처리 중인 요청 수, 상태 코드별 응답 수"""
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    in_flight: dict[tuple[str, str], int] = field(default_factory=dict)
+    responses: dict[tuple[str, str, str], int] = field(default_factory=dict)
+
+
+@dataclass
+class QueryMetrics:
+    """SQL 문장 지연, 요청당 문장 수, 느린 문장 수, 라우트별 N+1 경고 수 (app/query_log.py가 기록)"""
+    duration: Histogram = field(default_factory=lambda: Histogram(WAIT_BUCKETS))
+    per_request: Histogram = field(default_factory=lambda: Histogram(QUERY_COUNT_BUCKETS))
+    slow: int = 0
+    n_plus_one: dict[str, int] = field(default_factory=dict)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 라우트 템플릿(/todos/{todo_id}) 기준으로 지연/처리 중/상태 코드 기록
+
+    - 지연은 본문 전송이 끝날 때까지 (스트리밍 응답과 압축 포함)
+    - 처리 중 요청 수를 라우트별로 세려고 라우터보다 먼저 라우트를 찾음 (라우트 수만큼 정규식 매칭)
+    - 응답 전에 예외가 나면 상태 코드 500으로 셈 (ServerErrorMiddleware가 보내는 응답)
+    """
+
+    def __init__(self, app: ASGIApp, routes: Sequence[BaseRoute], metrics: HttpMetrics | None = None):
+        self.app = app
+        self.routes = routes
+        self.metrics = metrics if metrics is not None else http_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key = (scope["method"], self.route_path(scope))
+        in_flight = self.metrics.in_flight
+        in_flight[key] = in_flight.get(key, 0) + 1
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight[key] -= 1
+            self.metrics.latency.observe(key, time.perf_counter() - started)
+            response_key = (*key, str(status))
+            self.metrics.responses[response_key] = self.metrics.responses.get(response_key, 0) + 1
+
+    def route_path(self, scope: Scope) -> str:
+        """라우터와 같은 규칙으로 라우트 템플릿 찾기 (FULL 우선, 없으면 첫 PARTIAL = 405)"""
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                return getattr(route, "path", UNMATCHED_ROUTE)
+            if match is Match.PARTIAL and partial is None:
+                partial = route
+        return getattr(partial, "path", UNMATCHED_ROUTE)
+
+
+class Exposition:
+    """Prometheus 텍스트 형식 출력 (# HELP / # TYPE 다음에 샘플)"""
+
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def samples(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        samples: Iterable[tuple[dict[str, str], float]],
+    ) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            self.lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+
+    def counter(self, name: str, help_text: str, samples: Iterable[tuple[dict[str, str], float]]) -> None:
+        self.samples(name, "counter", help_text, samples)
+
+    def gauge(self, name: str, help_text: str, samples: Iterable[tuple[dict[str, str], float]]) -> None:
+        self.samples(name, "gauge", help_text, samples)
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str], histogram: Histogram) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} histogram")
+        bounds = [format_value(bound) for bound in histogram.buckets] + ["+Inf"]
+        for values, series in histogram.series.items():
+            labels = dict(zip(label_names, values))
+            cumulative = 0
+            for bound, count in zip(bounds, series.counts):
+                cumulative += count
+                self.lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {cumulative}")
+            self.lines.append(f"{name}_sum{format_labels(labels)} {format_value(series.sum)}")
+            self.lines.append(f"{name}_count{format_labels(labels)} {series.count}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+def escape_label(value: str) -> str:
+    """라벨 값의 \\, ", 줄바꿈 이스케이프"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metrics(
+    pools: dict[str, Pool],
+    write_queue: "WriteCoordinator",
+    todo_cache: "TodoCache",
+    compression: "CompressionStats",
+    schema: "SchemaReport",
+) -> str:
+    """/metrics 응답 본문 (요청 시점에 모든 값을 읽어 만듦)"""
+    out = Exposition()
+
+    # HTTP
+    out.histogram(
+        "todo_http_request_duration_seconds",
+        "Request latency by route template, until the response body is sent.",
+        ("method", "route"),
+        http_metrics.latency,
+    )
+    out.gauge(
+        "todo_http_requests_in_flight",
+        "Requests currently being handled.",
+        (({"method": method, "route": route}, count) for (method, route), count in http_metrics.in_flight.items()),
+    )
+    out.counter(
+        "todo_http_responses_total",
+        "Responses by status code.",
+        (
+            ({"method": method, "route": route, "status": status}, count)
+            for (method, route, status), count in http_metrics.responses.items()
+        ),
+    )
+
+    # 연결 풀 (engine 라벨: read / write)
+    out.gauge(
+        "todo_db_pool_size",
+        "Configured pool size.",
+        (({"engine": name}, pool.size()) for name, pool in pools.items()),
+    )
+    out.gauge(
+        "todo_db_pool_checked_out",
+        "Connections currently checked out.",
+        (({"engine": name}, pool.checkedout()) for name, pool in pools.items()),
+    )
+    out.gauge(
+        "todo_db_pool_checked_in",
+        "Idle connections in the pool.",
+        (({"engine": name}, pool.checkedin()) for name, pool in pools.items()),
+    )
+    out.gauge(
+        "todo_db_pool_overflow",
+        "Connections open beyond the pool size.",
+        (({"engine": name}, max(pool.overflow(), 0)) for name, pool in pools.items()),
+    )
+    out.histogram(
+        "todo_db_pool_checkout_wait_seconds",
+        "Time to get a connection from the pool, including waiting for a free one.",
+        ("engine",),
+        pool_checkout_wait,
+    )
+    out.counter(
+        "todo_db_pool_checkout_timeouts_total",
+        "Checkouts that gave up after the pool timeout.",
+        (({"engine": name}, count) for name, count in pool_checkout_timeouts.items()),
+    )
+
+    # SQL 문장
+    out.histogram(
+        "todo_db_query_duration_seconds",
+        "Time each SQL statement spent in the driver.",
+        (),
+        query_metrics.duration,
+    )
+    out.histogram(
+        "todo_db_queries_per_request",
+        "SQL statements executed while handling one request, including its writes.",
+        ("method", "route"),
+        query_metrics.per_request,
+    )
+    out.counter(
+        "todo_db_slow_queries_total",
+        "Statements slower than TODO_SLOW_QUERY_MS.",
+        [({}, query_metrics.slow)],
+    )
+    out.counter(
+        "todo_db_n_plus_one_warnings_total",
+        "SELECT statements run at least TODO_N_PLUS_ONE_THRESHOLD times within one request.",
+        (({"route": route}, count) for route, count in query_metrics.n_plus_one.items()),
+    )
+
+    # SQLite 쓰기 락
+    out.histogram(
+        "todo_sqlite_write_lock_wait_seconds",
+        "Time spent in BEGIN IMMEDIATE waiting for the SQLite write lock.",
+        (),
+        sqlite_lock_wait,
+    )
+    out.counter(
+        "todo_sqlite_lock_retries_total",
+        "Write batches retried after 'database is locked'.",
+        [({}, write_queue.stats.lock_retries)],
+    )
+
+    # 쓰기 큐
+    stats = write_queue.stats
+    out.gauge("todo_write_queue_depth", "Writes waiting for the next batch.", [({}, write_queue.depth())])
+    out.counter("todo_write_queue_batches_total", "Committed or failed write batches.", [({}, stats.batches)])
+    out.counter("todo_write_queue_ops_total", "Write operations run in batches.", [({}, stats.ops)])
+    out.counter("todo_write_queue_failed_ops_total", "Write operations that raised.", [({}, stats.failed_ops)])
+    out.counter("todo_write_queue_failed_batches_total", "Batches whose commit failed.", [({}, stats.failed_batches)])
+    out.counter(
+        "todo_write_queue_wait_seconds_total",
+        "Total time writes spent queued before their batch started.",
+        [({}, stats.queue_wait_seconds_total)],
+    )
+
+    # 캐시
+    cache = todo_cache.stats
+    for name in ("hits", "misses", "evictions", "expirations", "invalidations", "rejected_fills"):
+        out.counter(f"todo_cache_{name}_total", f"Todo cache {name.replace('_', ' ')}.", [({}, getattr(cache, name))])
+    cache_state = todo_cache.as_dict()
+    out.gauge("todo_cache_entries", "Cached todos.", [({}, cache_state["entries"])])
+    out.gauge("todo_cache_bytes", "Cached payload bytes.", [({}, cache_state["bytes"])])
+
+    # 응답 압축
+    encodings = compression.encodings.items()
+    out.counter(
+        "todo_compression_responses_total",
+        "Compressed responses.",
+        (({"encoding": name}, stats.responses) for name, stats in encodings),
+    )
+    out.counter(
+        "todo_compression_bytes_in_total",
+        "Bytes before compression.",
+        (({"encoding": name}, stats.bytes_in) for name, stats in encodings),
+    )
+    out.counter(
+        "todo_compression_bytes_out_total",
+        "Bytes after compression.",
+        (({"encoding": name}, stats.bytes_out) for name, stats in encodings),
+    )
+    out.counter(
+        "todo_compression_cpu_seconds_total",
+        "CPU time spent compressing.",
+        (({"encoding": name}, stats.cpu_seconds_total) for name, stats in encodings),
+    )
+    out.counter(
+        "todo_compression_skipped_total",
+        "Responses sent uncompressed although the client accepted an encoding.",
+        [({"reason": "small"}, compression.skipped_small), ({"reason": "type"}, compression.skipped_type)],
+    )
+
+    # 시작 시 스키마 작업
+    out.gauge("todo_schema_version", "Schema version this process started with.", [({}, schema.version)])
+    out.gauge(
+        "todo_schema_startup_seconds",
+        "Startup time spent on the schema version check and migrations.",
+        [({}, schema.seconds)],
+    )
+    out.gauge(
+        "todo_schema_migrations_applied",
+        "Migrations this process applied at startup.",
+        [({}, len(schema.applied))],
+    )
+
+    return out.render()
+
+
+# 앱 전체에서 공유하는 측정값
+# (풀/락 대기는 app/database.py, SQL 문장은 app/query_log.py가 기록, 워커 프로세스마다 따로 쌓이므로 워커별로 수집)
+http_metrics = HttpMetrics()
+query_metrics = QueryMetrics()
+pool_checkout_wait = Histogram(WAIT_BUCKETS)
+pool_checkout_timeouts: dict[str, int] = {}
+sqlite_lock_wait = Histogram(WAIT_BUCKETS)
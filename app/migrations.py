@@ -0,0 +1,176 @@
+# app/migrations.py
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app import config
+from app.backfills import create_backfill_progress, register_backfill
+from app.counters import create_counters
+from app.search import create_search_index
+from app.write_queue import is_lock_error
+
+# 적용된 마이그레이션 기록 (Django의 django_migrations 테이블과 유사)
+SCHEMA_VERSION_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        duration_ms REAL NOT NULL
+    )
+"""
+
+CURRENT_VERSION_SQL = "SELECT max(version) FROM schema_version"
+
+RECORD_VERSION_SQL = (
+    "INSERT INTO schema_version (version, name, duration_ms) VALUES (:version, :name, :duration_ms)"
+)
+
+# 마이그레이션 1, 2의 DDL (모델이 바뀌어도 이미 적용된 마이그레이션은 그대로 두도록 모델에서 만들지 않고 고정)
+# IF NOT EXISTS: schema_version 이전에 create_all로 만든 DB도 그대로 따라잡음
+TODOS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS todos (
+        id INTEGER NOT NULL,
+        title VARCHAR(200) NOT NULL,
+        description TEXT,
+        completed BOOLEAN NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL,
+        PRIMARY KEY (id)
+    )
+"""
+
+TODOS_INDEXES_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_todos_created_at_id ON todos (created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_todos_completed_created_at ON todos (completed, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_todos_updated_at ON todos (updated_at)",
+]
+
+
+def create_todos_table(conn: Connection) -> None:
+    conn.exec_driver_sql(TODOS_TABLE_DDL)
+
+
+def create_todos_indexes(conn: Connection) -> None:
+    for statement in TODOS_INDEXES_DDL:
+        conn.exec_driver_sql(statement)
+
+
+def add_todos_completed_at(conn: Connection) -> None:
+    """
+    컬럼 추가는 SQLite에서 스키마만 바꾸고 테이블을 다시 쓰지 않음 → 행 수와 무관하게 즉시 끝남
+    기존 완료 행의 값은 시작 후 백필이 나눠서 채움 (app/backfills.py)
+    """
+    conn.exec_driver_sql("ALTER TABLE todos ADD COLUMN completed_at DATETIME")
+    register_backfill(conn, "todos_completed_at")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+# 순서대로 적용되는 마이그레이션 (새 변경은 항상 끝에 version을 하나 올려서 추가, 이미 있는 항목은 고치지 않음)
+MIGRATIONS: list[Migration] = [
+    Migration(1, "create todos table", create_todos_table),
+    Migration(2, "create todos indexes", create_todos_indexes),
+    Migration(3, "create full-text search index", create_search_index),
+    Migration(4, "create aggregate counters", create_counters),
+    Migration(5, "create backfill progress table", create_backfill_progress),
+    Migration(6, "add todos.completed_at", add_todos_completed_at),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(conn: Connection) -> int:
+    """적용된 최신 version (schema_version 테이블이 없으면 0)"""
+    try:
+        return conn.exec_driver_sql(CURRENT_VERSION_SQL).scalar() or 0
+    except OperationalError as exc:
+        if "no such table" not in str(exc.orig):
+            raise
+        conn.rollback()
+        return 0
+
+
+def apply_migrations(conn: Connection, target: int = LATEST_VERSION) -> list[dict[str, Any]]:
+    """
+    target까지 아직 적용되지 않은 마이그레이션을 순서대로 실행하고 schema_version에 기록
+
+    호출하는 쪽의 트랜잭션 안에서 실행 (SQLite는 DDL도 트랜잭션으로 롤백되므로 전부 적용되거나 하나도 안 됨)
+    """
+    conn.exec_driver_sql(SCHEMA_VERSION_DDL)
+    version = conn.exec_driver_sql(CURRENT_VERSION_SQL).scalar() or 0
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version <= version or migration.version > target:
+            continue
+        started = time.perf_counter()
+        migration.apply(conn)
+        duration_ms = (time.perf_counter() - started) * 1000
+        conn.execute(
+            text(RECORD_VERSION_SQL),
+            {"version": migration.version, "name": migration.name, "duration_ms": duration_ms},
+        )
+        applied.append({"version": migration.version, "name": migration.name, "duration_ms": duration_ms})
+    return applied
+
+
+@dataclass
+class SchemaReport:
+    """시작 시 스키마 작업 결과 (/internal/stats, /metrics에서 노출)"""
+    version: int = 0
+    applied: list[dict[str, Any]] = field(default_factory=list)
+    seconds: float = 0.0  # 버전 확인부터 마이그레이션 커밋까지 전체
+    lock_wait_seconds: float = 0.0  # 쓰기 락 대기 (다른 워커가 마이그레이션하는 동안 포함)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self.__dict__, "latest_version": LATEST_VERSION}
+
+
+async def migrate(read_engine: AsyncEngine, write_engine: AsyncEngine) -> SchemaReport:
+    """
+    시작 시 스키마 준비
+
+    - 보통: 읽기 연결로 버전을 한 번 읽고 최신이면 끝 (쓰기 락도, 테이블 리플렉션도 없음)
+    - 뒤처져 있으면: 쓰기 엔진의 BEGIN IMMEDIATE로 쓰기 락을 잡은 뒤 버전을 다시 읽고 남은 것만 적용
+      → 여러 워커가 동시에 떠도 한 워커만 적용하고, 나머지는 락이 풀린 뒤 적용할 게 없음을 확인
+    - 락을 기다리다 busy_timeout을 넘기면(긴 마이그레이션) TODO_MIGRATION_LOCK_TIMEOUT까지 다시 시도
+    """
+    started = time.perf_counter()
+    report = schema_report
+    report.applied, report.lock_wait_seconds = [], 0.0
+    async with read_engine.connect() as conn:
+        report.version = await conn.run_sync(current_version)
+
+    if report.version < LATEST_VERSION:
+        deadline = started + config.MIGRATION_LOCK_TIMEOUT
+        while True:
+            attempt = time.perf_counter()
+            try:
+                async with write_engine.begin() as conn:
+                    # begin()이 BEGIN IMMEDIATE까지 실행함 → 여기까지가 락 대기
+                    report.lock_wait_seconds += time.perf_counter() - attempt
+                    report.applied = await conn.run_sync(apply_migrations)
+                break
+            except OperationalError as exc:
+                if not is_lock_error(exc) or time.perf_counter() >= deadline:
+                    raise
+                report.lock_wait_seconds += time.perf_counter() - attempt
+                await asyncio.sleep(0.1)
+        report.version = LATEST_VERSION
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+# 이 프로세스의 시작 시 스키마 작업 결과
+schema_report = SchemaReport()
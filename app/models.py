@@ -1,10 +1,19 @@
 # app/models.py
-from datetime import datetime
-from sqlalchemy import String, Text, func
+from datetime import datetime, timezone
+from sqlalchemy import Index, String, Text, case, func
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import ColumnElement
 from app.database import Base
 
 
+def completed_at_default(context: DefaultExecutionContext) -> datetime | None:
+    """INSERT 기본값: 완료 상태로 만들면 지금(UTC), 아니면 NULL (일괄 INSERT는 행마다 호출됨)"""
+    if context.get_current_parameters().get("completed"):
+        return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    return None
+
+
 class Todo(Base):
     """
     할일 모델
@@ -35,5 +44,35 @@ class Todo(Base):
         onupdate=func.now()
     )
     
+    # 완료 시각 (미완료면 NULL)
+    # 마이그레이션 6에서 추가된 컬럼, 그 전에 완료된 행은 updated_at으로 백필 (app/backfills.py)
+    completed_at: Mapped[datetime | None] = mapped_column(default=completed_at_default)
+    
+    # 보조 인덱스 (Django의 Meta.indexes)
+    # 실제 쿼리 모양에 맞춤: ORDER BY created_at DESC, id DESC 가 정렬 없이 인덱스 순서로 읽힘
+    # 실제 DB에는 app/migrations.py가 만듦 (인덱스를 바꾸면 새 마이그레이션도 추가)
+    __table_args__ = (
+        Index("ix_todos_created_at_id", created_at.desc(), id.desc()),
+        Index("ix_todos_completed_created_at", completed, created_at.desc(), id.desc()),
+        Index("ix_todos_updated_at", updated_at),
+    )
+    
     def __repr__(self) -> str:
-        return f"<Todo(id={self.id}, title='{self.title}', completed={self.completed})>"
\ No newline at end of file
+        return f"<Todo(id={self.id}, title='{self.title}', completed={self.completed})>"
+
+
+def completed_at_on_update(completed: bool) -> ColumnElement | None:
+    """
+    UPDATE에서 completed를 바꿀 때 completed_at 값
+
+    SET 식의 컬럼은 수정 전 값이므로
+    - 이미 완료였던 행: 기존 completed_at 유지 (아직 백필 전이면 백필과 같은 규칙으로 updated_at)
+    - 미완료였던 행: 지금
+    미완료로 바꾸면 NULL
+    """
+    if not completed:
+        return None
+    return case(
+        (Todo.completed, func.coalesce(Todo.completed_at, Todo.updated_at)),
+        else_=func.now(),
+    )
@@ -0,0 +1,83 @@
+# app/pagination.py
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, String, tuple_, type_coerce
+
+from app.models import Todo
+
+
+def to_db_timestamp(value: datetime) -> str:
+    """
+    datetime → SQLite에 저장된 문자열 형식
+
+    server_default=func.now()는 'YYYY-MM-DD HH:MM:SS' 텍스트를 저장하므로
+    비교할 때도 같은 형식의 문자열을 써야 정확히 일치함
+    (SQLAlchemy 기본 바인딩은 마이크로초 6자리를 항상 붙임)
+    """
+    return value.isoformat(sep=" ")
+
+
+def _encode(values: list) -> str:
+    """값 목록 → URL에 넣을 수 있는 불투명한 문자열"""
+    payload = json.dumps(values)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    """_encode()의 역변환, 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def encode_cursor(todo: Todo) -> str:
+    """
+    마지막 행의 (created_at, id)를 불투명한 커서 문자열로 인코딩
+
+    id는 created_at이 같은 행들 사이의 순서를 정하는 tiebreaker
+    """
+    return _encode([to_db_timestamp(todo.created_at), todo.id])
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """커서 문자열 → (created_at, id), 형식이 잘못되면 ValueError"""
+    values = _decode(cursor)
+    if len(values) != 2 or not isinstance(values[0], str) or type(values[1]) is not int:
+        raise ValueError("Invalid cursor")
+    return values[0], values[1]
+
+
+def encode_search_cursor(rank: float, todo_id: int) -> str:
+    """검색 결과 마지막 행의 (rank, id)를 커서로 인코딩"""
+    return _encode([rank, todo_id])
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, int]:
+    """검색 커서 → (rank, id), 형식이 잘못되면 ValueError"""
+    values = _decode(cursor)
+    if (
+        len(values) != 2
+        or type(values[0]) not in (int, float)
+        or type(values[1]) is not int
+    ):
+        raise ValueError("Invalid cursor")
+    return float(values[0]), values[1]
+
+
+def after_cursor(cursor: tuple[str, int]) -> ColumnElement[bool]:
+    """
+    keyset 조건: (created_at, id) < (커서 값)
+
+    ORDER BY created_at DESC, id DESC 순서에서 커서 다음 행부터 시작하므로
+    OFFSET처럼 앞 페이지 행들을 읽고 버리지 않음 (페이지 깊이와 무관하게 일정한 비용)
+    """
+    created_at, todo_id = cursor
+    return tuple_(type_coerce(Todo.created_at, String), Todo.id) < tuple_(created_at, todo_id)
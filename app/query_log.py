@@ -0,0 +1,159 @@
+# app/query_log.py
+import json
+import logging
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app import config
+from app.metrics import UNMATCHED_ROUTE, query_metrics
+
+logger = logging.getLogger("todo.sql")
+
+
+@dataclass
+class RequestQueries:
+    """요청 하나에서 실행된 SQL 문장 수 (문장 텍스트별로도 세서 N+1 감지)"""
+    method: str
+    path: str
+    count: int = 0
+    seconds: float = 0.0
+    statements: dict[str, int] = field(default_factory=dict)
+
+
+# 현재 요청의 쿼리 집계 (요청 밖이면 None)
+# 쓰기 큐 작업자는 작업마다 제출한 요청의 값을 잠시 설정함 (app/write_queue.py)
+_current: ContextVar[RequestQueries | None] = ContextVar("request_queries", default=None)
+
+
+def current_queries() -> RequestQueries | None:
+    return _current.get()
+
+
+@contextmanager
+def recording_to(queries: RequestQueries | None) -> Iterator[None]:
+    """다른 태스크(쓰기 큐 작업자)에서 실행되는 문장을 제출한 요청의 집계에 기록"""
+    token = _current.set(queries)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def redact(parameters, executemany: bool) -> str:
+    """바인딩 파라미터 값 대신 개수만 남김 (제목/설명 같은 사용자 데이터가 로그에 남지 않도록)"""
+    if executemany:
+        return f"<{len(parameters)} rows redacted>"
+    return f"<{len(parameters) if parameters else 0} redacted>"
+
+
+def log_statement(
+    level: int, event_name: str, statement: str, parameters, executemany: bool, seconds: float
+) -> None:
+    queries = _current.get()
+    logger.log(level, json.dumps({
+        "event": event_name,
+        "duration_ms": round(seconds * 1000, 3),
+        "statement": statement,
+        "parameters": redact(parameters, executemany),
+        "method": queries.method if queries else None,
+        "path": queries.path if queries else None,
+    }))
+
+
+def install_query_log(engine: AsyncEngine) -> None:
+    """
+    엔진에 쿼리 계측 리스너 등록 (echo=True 대신)
+
+    - 모든 문장: 현재 요청의 문장 수/시간/문장별 횟수에 더함
+    - TODO_SLOW_QUERY_MS 이상 걸린 문장: 경고 로그 (파라미터 값은 가림)
+    - 나머지 문장: TODO_QUERY_LOG_SAMPLE_RATE 비율만 info 로그
+    문장 하나당 비용은 perf_counter 두 번과 dict 갱신 정도 (echo처럼 매번 로그를 쓰지 않음)
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    slow_seconds = config.SLOW_QUERY_MS / 1000
+    sample_rate = config.QUERY_LOG_SAMPLE_RATE
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def finish_query(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_started"].pop()
+        query_metrics.duration.observe((), seconds)
+        queries = _current.get()
+        if queries is not None:
+            queries.count += 1
+            queries.seconds += seconds
+            queries.statements[statement] = queries.statements.get(statement, 0) + 1
+        if seconds >= slow_seconds:
+            query_metrics.slow += 1
+            log_statement(logging.WARNING, "slow_query", statement, parameters, executemany, seconds)
+        elif sample_rate and random.random() < sample_rate:
+            log_statement(logging.INFO, "sampled_query", statement, parameters, executemany, seconds)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def discard_start(exception_context):
+        # 실패한 문장은 after_cursor_execute가 불리지 않으므로 시작 시각을 버림
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            started.pop()
+
+
+class QueryCountMiddleware:
+    """
+    요청마다 실행된 SQL 문장 수를 세어 /metrics 히스토그램에 기록하고 N+1 패턴을 경고
+
+    같은 SELECT가 한 요청에서 TODO_N_PLUS_ONE_THRESHOLD번 이상 실행되면
+    (목록을 읽고 항목마다 다시 조회하는 전형적인 N+1) 문장과 횟수를 경고 로그로 남김
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.threshold = config.N_PLUS_ONE_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries(scope["method"], scope["path"])
+        token = _current.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            # 라우터가 scope["route"]를 채워 둠 (매칭 실패면 없음)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            query_metrics.per_request.observe((queries.method, route), queries.count)
+            if self.threshold:
+                self.warn_repeated(queries, route)
+
+    def warn_repeated(self, queries: RequestQueries, route: str) -> None:
+        for statement, count in queries.statements.items():
+            if count >= self.threshold and statement.lstrip().upper().startswith("SELECT"):
+                query_metrics.n_plus_one[route] = query_metrics.n_plus_one.get(route, 0) + 1
+                logger.warning(json.dumps({
+                    "event": "n_plus_one",
+                    "method": queries.method,
+                    "path": queries.path,
+                    "route": route,
+                    "executions": count,
+                    "statement": statement,
+                    "queries_in_request": queries.count,
+                }))
@@ -1,6 +1,8 @@
 # app/schemas.py
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict  # Python 3.11 이하에서 pydantic이 요구
 
 class TodoCreate(BaseModel):
     """할일 생성 시 받는 데이터 (Django Form/Serializer와 유사)"""
@@ -23,4 +25,83 @@ class TodoResponse(BaseModel):
     description: str | None
     completed: bool
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+    completed_at: datetime | None
+
+class TodoRow(TypedDict):
+    """
+    TodoResponse와 같은 필드의 TypedDict (목록 응답 빠른 직렬화용)
+    
+    DB에서 읽은 값을 검증 없이 그대로 JSON으로 덤프할 때 사용
+    """
+    id: int
+    title: str
+    description: str | None
+    completed: bool
+    created_at: datetime
+    updated_at: datetime
+    completed_at: datetime | None
+
+class TodoSearchResult(TodoResponse):
+    """검색 결과 (BM25 점수와 일치 부분 발췌 포함)"""
+    rank: float  # BM25 점수, 작을수록(더 음수일수록) 관련도 높음
+    snippet: str  # HTML 이스케이프한 발췌, 일치한 단어만 <mark></mark>로 감쌈
+
+class TodoDeleteResult(BaseModel):
+    """여러 개 삭제 결과"""
+    deleted: list[int]
+    not_found: list[int]
+
+class TodoImportError(BaseModel):
+    """가져오기에서 거부된 줄 하나 (line은 1부터 시작)"""
+    line: int
+    errors: list[dict[str, Any]]
+
+class TodoImportAbort(BaseModel):
+    """커밋에 실패해 가져오기를 멈춘 묶음 (이 묶음의 줄은 하나도 저장되지 않음)"""
+    first_line: int  # 다시 보낼 때 이 줄부터 (앞의 줄은 모두 저장 또는 거부됨)
+    last_line: int
+    error: str
+
+class TodoImportResult(BaseModel):
+    """가져오기 결과"""
+    accepted: int
+    rejected: int
+    errors: list[TodoImportError]
+    errors_truncated: bool = False  # 오류가 IMPORT_MAX_ERRORS개를 넘어 일부만 담긴 경우
+    aborted: TodoImportAbort | None = None  # 묶음 커밋 실패로 중단된 경우 (accepted는 그 전까지)
+
+class TodoStats(BaseModel):
+    """할일 개수 집계"""
+    total: int
+    open: int
+    completed: int
+
+class TodoCounterCheck(BaseModel):
+    """카운터 검증/재계산 결과"""
+    stored: TodoStats  # 카운터 테이블에 저장돼 있던 값
+    actual: TodoStats  # todos를 직접 센 값
+    consistent: bool
+    repaired: bool = False  # 재계산으로 저장값을 고쳤는지
+
+class BackfillStatus(BaseModel):
+    """백필 진행 상태 (backfill_progress 한 줄 + 이 프로세스의 실행 여부)"""
+    name: str
+    description: str | None
+    status: str  # pending / running / paused / done
+    last_id: int  # 여기까지 처리됨 (다음 배치는 이 다음 id부터)
+    max_id: int
+    progress: float  # last_id / max_id (0~1)
+    rows_updated: int
+    batches: int
+    created_at: datetime
+    started_at: datetime | None
+    updated_at: datetime | None
+    finished_at: datetime | None
+    running_here: bool  # 이 프로세스에서 배치를 돌리고 있는지
+    last_error: str | None = None
+
+class BackfillThrottle(BaseModel):
+    """백필 속도 조절 (지정한 값만 바뀜, 다음 배치부터 적용)"""
+    batch_size: int | None = Field(None, ge=1, le=100_000)
+    pause_ms: float | None = Field(None, ge=0, le=60_000)
@@ -0,0 +1,156 @@
+# app/search.py
+import html
+import re
+
+from sqlalchemy import Boolean, Connection, DateTime, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas import TodoSearchResult
+
+# FTS5 외부 콘텐츠(external content) 테이블
+# 본문은 todos에만 저장하고 todos_fts에는 검색 인덱스만 둠 → 저장 공간 중복 없음
+# todos가 바뀔 때마다 트리거가 인덱스를 같은 트랜잭션 안에서 갱신
+SEARCH_INDEX_DDL = [
+    """
+    CREATE VIRTUAL TABLE todos_fts USING fts5(
+        title,
+        description,
+        content='todos',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    # 정렬 기준(rank) = BM25, 제목 일치를 설명 일치보다 10배 가중
+    "INSERT INTO todos_fts(todos_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    # 이미 있는 할일들로 인덱스 채우기
+    "INSERT INTO todos_fts(todos_fts) VALUES ('rebuild')",
+]
+
+SEARCH_TRIGGERS_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS todos_fts_ai AFTER INSERT ON todos BEGIN
+        INSERT INTO todos_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS todos_fts_ad AFTER DELETE ON todos BEGIN
+        INSERT INTO todos_fts(todos_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS todos_fts_au AFTER UPDATE OF title, description ON todos BEGIN
+        INSERT INTO todos_fts(todos_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO todos_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+# snippet()의 일치 구간 표시 (제어 문자라 보통 텍스트에 없음)
+# SQLite가 바로 <mark>를 넣으면 사용자 텍스트의 HTML이 그대로 섞이므로
+# 파이썬에서 텍스트를 HTML 이스케이프한 뒤 이 표시만 <mark></mark>로 바꿈 (render_snippet)
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+SNIPPET_MARKERS = re.compile(f"[{MATCH_START}{MATCH_END}]")
+
+# 검색 결과 페이지: FTS 쪽에서 rank 순으로 limit개만 고른 뒤 todos와 조인
+# (snippet은 고른 행에만 계산)
+SEARCH_SQL = """
+SELECT todos.id, todos.title, todos.description, todos.completed,
+       todos.created_at, todos.updated_at, todos.completed_at, matches.rank, matches.snippet
+FROM (
+    SELECT rowid AS id, rank,
+           snippet(todos_fts, -1, :match_start, :match_end, '…', 16) AS snippet
+    FROM todos_fts
+    WHERE todos_fts MATCH :query {after}
+    ORDER BY rank, rowid
+    LIMIT :limit
+) AS matches
+JOIN todos ON todos.id = matches.id
+ORDER BY matches.rank, matches.id
+"""
+
+# 커서 다음부터: (rank, id) > (커서 값)
+AFTER_CURSOR_SQL = "AND (rank > :after_rank OR (rank = :after_rank AND rowid > :after_id))"
+
+TERM_PATTERN = re.compile(r"(\w+)(\*?)")
+
+
+def create_search_index(conn: Connection) -> None:
+    """
+    검색 인덱스와 동기화 트리거를 없으면 생성
+
+    가상 테이블을 처음 만들 때만 rebuild로 기존 데이터를 채움
+    """
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'todos_fts'"
+    ).first()
+    if exists is None:
+        for statement in SEARCH_INDEX_DDL:
+            conn.exec_driver_sql(statement)
+    for statement in SEARCH_TRIGGERS_DDL:
+        conn.exec_driver_sql(statement)
+
+
+def build_match_query(q: str) -> str:
+    """
+    사용자 입력 → FTS5 MATCH 식
+
+    단어만 뽑아서 각각 따옴표로 감싸므로 FTS 문법 오류나 연산자 주입이 없음
+    단어 끝에 *를 붙이면 접두어 검색 (예: "fast*" → fastapi, faster ...)
+    여러 단어는 모두 포함해야 일치 (AND)
+    """
+    terms = [f'"{word}"{star}' for word, star in TERM_PATTERN.findall(q)]
+    return " ".join(terms)
+
+
+def render_snippet(raw: str) -> str:
+    """
+    snippet() 결과 → HTML 안전한 발췌 (텍스트는 이스케이프, 일치 구간만 <mark></mark>)
+
+    사용자 텍스트에 표시 문자가 들어 있어도 태그가 항상 짝이 맞도록
+    열린 상태에서만 닫고 닫힌 상태에서만 열며, 남은 표시는 버림
+    """
+    parts: list[str] = []
+    open_ = False
+    position = 0
+    for marker in SNIPPET_MARKERS.finditer(raw):
+        parts.append(html.escape(raw[position:marker.start()]))
+        position = marker.end()
+        if marker.group() == MATCH_START and not open_:
+            parts.append("<mark>")
+            open_ = True
+        elif marker.group() == MATCH_END and open_:
+            parts.append("</mark>")
+            open_ = False
+    parts.append(html.escape(raw[position:]))
+    if open_:
+        parts.append("</mark>")
+    return "".join(parts)
+
+
+async def search_todos(
+    db: AsyncSession,
+    match_query: str,
+    limit: int,
+    after: tuple[float, int] | None = None,
+) -> list[TodoSearchResult]:
+    """BM25 순으로 검색 결과 한 페이지 조회 (after: 이전 페이지 마지막 (rank, id))"""
+    params: dict = {
+        "query": match_query, "limit": limit, "match_start": MATCH_START, "match_end": MATCH_END
+    }
+    if after is not None:
+        params["after_rank"], params["after_id"] = after
+    sql = SEARCH_SQL.format(after=AFTER_CURSOR_SQL if after is not None else "")
+
+    stmt = text(sql).columns(
+        completed=Boolean, created_at=DateTime, updated_at=DateTime, completed_at=DateTime
+    )
+    result = await db.execute(stmt, params)
+    return [
+        TodoSearchResult.model_validate({**row, "snippet": render_snippet(row["snippet"])})
+        for row in result.mappings()
+    ]
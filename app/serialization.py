@@ -0,0 +1,75 @@
+# app/serialization.py
+from collections.abc import Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import Column, Row
+
+from app.models import Todo
+from app.schemas import TodoResponse, TodoRow
+
+# 응답 필드 (TodoResponse와 같은 순서)
+TODO_FIELDS = tuple(TodoResponse.model_fields)
+
+# ?fields=로 일부만 요청해도 항상 읽는 컬럼 (커서, ETag, Last-Modified 계산용)
+KEY_FIELDS = ("id", "created_at", "updated_at")
+
+# 목록 전체를 한 번에 JSON으로 덤프하는 어댑터 (스키마는 import 시 한 번만 빌드)
+# TypedDict라서 일부 키만 있는 dict도 그대로 덤프됨
+todo_rows_adapter = TypeAdapter(list[TodoRow])
+todo_row_adapter = TypeAdapter(TodoRow)
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """
+    ?fields= 값 → 응답 필드 이름 (TodoResponse 순서, 중복 제거)
+
+    지정하지 않았거나 전체 필드를 지정하면 None (전체 응답)
+    모르는 필드나 빈 목록이면 ValueError
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise ValueError("At least one field is required")
+    unknown = requested.difference(TODO_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))} (allowed: {', '.join(TODO_FIELDS)})"
+        )
+    selected = tuple(name for name in TODO_FIELDS if name in requested)
+    return None if selected == TODO_FIELDS else selected
+
+
+def select_columns(fields: Sequence[str] | None = None) -> list[Column]:
+    """
+    SELECT할 컬럼: 요청한 필드 먼저, 그 뒤에 빠진 KEY_FIELDS
+
+    응답 필드가 행 앞쪽에 오므로 render_*()가 zip으로 잘라 쓸 수 있음
+    description처럼 큰 컬럼은 요청하지 않으면 읽지도 않음
+    """
+    fields = fields or TODO_FIELDS
+    names = [*fields, *(name for name in KEY_FIELDS if name not in fields)]
+    return [Todo.__table__.c[name] for name in names]
+
+
+# 전체 응답용 컬럼 목록
+TODO_COLUMNS = select_columns()
+
+
+def render_todo_rows(rows: Sequence[Row], fields: Sequence[str] | None = None) -> bytes:
+    """
+    Core 행 목록 → JSON 배열 바이트 (fields만 담음)
+
+    response_model 경로는 ORM 객체를 행마다 TodoResponse로 검증(from_attributes)한 뒤
+    직렬화하지만, DB에서 읽은 값은 이미 타입이 맞으므로 검증을 건너뛰고
+    Rust 직렬화기(pydantic-core)로 한 번에 덤프함 (출력 JSON은 동일)
+
+    Row._asdict()는 행마다 키 목록을 다시 만들어서 느리므로 고정된 필드 이름과 zip
+    """
+    fields = fields or TODO_FIELDS
+    return todo_rows_adapter.dump_json([dict(zip(fields, row)) for row in rows])
+
+
+def render_todo_row(row: Row, fields: Sequence[str] | None = None) -> bytes:
+    """Core 행 하나 → JSON 객체 바이트 (fields만 담음)"""
+    return todo_row_adapter.dump_json(dict(zip(fields or TODO_FIELDS, row)))
@@ -0,0 +1,169 @@
+# app/streaming.py
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+
+from pydantic import ValidationError
+from sqlalchemy import Row, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.database import ReadSessionLocal
+from app.models import Todo
+from app.schemas import TodoCreate, TodoImportAbort, TodoImportError, TodoImportResult, TodoResponse
+from app.write_queue import write_queue
+
+# 내보내기 컬럼 (TodoResponse와 같은 순서)
+EXPORT_COLUMNS = list(TodoResponse.model_fields)
+
+
+def ndjson_chunk(rows: Sequence[Row]) -> bytes:
+    """행 묶음 → NDJSON (한 줄에 TodoResponse 하나)"""
+    return b"".join(
+        TodoResponse.model_validate(row).model_dump_json().encode() + b"\n"
+        for row in rows
+    )
+
+
+def csv_chunk(rows: Sequence[Row], header: bool = False) -> bytes:
+    """행 묶음 → CSV (첫 묶음에만 헤더)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow(TodoResponse.model_validate(row).model_dump(mode="json").values())
+    return buffer.getvalue().encode()
+
+
+async def export_todos(fmt: str) -> AsyncIterator[bytes]:
+    """
+    todos 테이블 전체를 id 순서로 스트리밍
+
+    - keyset으로 EXPORT_FETCH_SIZE 행씩 읽음 (WHERE id > 마지막 id ORDER BY id LIMIT n)
+      → 테이블 크기와 무관하게 메모리 사용량과 덩어리 하나의 쿼리 비용이 일정
+    - 덩어리마다 짧은 읽기 트랜잭션을 열고 보내기 전에 연결을 풀에 돌려줌
+      한 트랜잭션으로 전체를 읽으면 느린 다운로드 동안 WAL 체크포인트가 끝나지 못해
+      -wal 파일이 계속 커지고 읽기 연결 하나를 내내 잡고 있게 됨
+    - 대신 전체가 한 스냅샷은 아님: 각 행은 그 덩어리를 읽은 시점의 값,
+      내보내는 도중 새로 생긴 행(더 큰 id)은 포함될 수 있고 이미 보낸 행의 수정/삭제는 반영 안 됨
+    - ORM 객체 대신 컬럼 튜플(Row)만 읽어 하이드레이션 비용 없음
+
+    StreamingResponse는 엔드포인트가 반환된 뒤에 본문을 보내므로
+    의존성 세션 대신 제너레이터 안에서 세션을 직접 엶
+    """
+    fetch_size = config.EXPORT_FETCH_SIZE
+    stmt = (
+        select(*(Todo.__table__.c[name] for name in EXPORT_COLUMNS))
+        .order_by(Todo.id)
+        .limit(fetch_size)
+    )
+    if fmt == "csv":
+        yield csv_chunk([], header=True)
+    last_id = 0
+    while True:
+        async with ReadSessionLocal() as session:
+            rows = (await session.execute(stmt.where(Todo.id > last_id))).all()
+        if not rows:
+            return
+        yield csv_chunk(rows) if fmt == "csv" else ndjson_chunk(rows)
+        if len(rows) < fetch_size:
+            return
+        last_id = rows[-1].id
+
+
+class LineTooLong(Exception):
+    """IMPORT_MAX_LINE_BYTES를 넘는 줄 (그 줄만 거부하고 계속 읽음)"""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes | LineTooLong]:
+    """
+    요청 본문 조각 → 줄 단위로 나눠서 하나씩 반환
+
+    본문 전체를 메모리에 올리지 않고, 아직 끝나지 않은 마지막 줄만 버퍼에 남김
+    한도를 넘는 줄은 버리고 LineTooLong을 대신 반환
+    """
+    buffer = b""
+    skipping = False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            yield line if len(line) <= max_line_bytes else LineTooLong()
+        if len(buffer) > max_line_bytes:
+            # 줄이 끝나기 전에 한도를 넘음 → 다음 줄바꿈까지 버림
+            if not skipping:
+                yield LineTooLong()
+            skipping = True
+            buffer = b""
+    if buffer and not skipping:
+        yield buffer
+
+
+async def import_todos(chunks: AsyncIterator[bytes]) -> TodoImportResult:
+    """
+    NDJSON 본문을 한 줄씩 검증해서 IMPORT_CHUNK_SIZE 행마다 커밋
+
+    - 본문을 읽는 속도는 커밋 속도에 맞춰짐 (커밋이 끝날 때까지 다음 조각을 읽지 않음)
+    - 한 트랜잭션이 너무 커지지 않아서 다른 쓰기 요청이 오래 기다리지 않음
+    - 잘못된 줄은 건너뛰고 줄 번호와 함께 보고, 나머지는 그대로 저장
+    - 묶음 커밋이 실패하면 거기서 멈추고 result.aborted에 그 묶음의 줄 범위와 오류를 담음
+      (그 전까지 커밋된 묶음은 남고 accepted에 포함 → 클라이언트는 first_line부터 다시 보내면 됨)
+    """
+    result = TodoImportResult(accepted=0, rejected=0, errors=[])
+    chunk: list[dict] = []
+    chunk_first_line = chunk_last_line = 0
+
+    async def flush() -> bool:
+        rows = chunk.copy()
+        chunk.clear()
+
+        async def insert_rows(db: AsyncSession) -> None:
+            await db.execute(insert(Todo), rows)
+
+        try:
+            await write_queue.submit(insert_rows)
+        except SQLAlchemyError as exc:
+            result.aborted = TodoImportAbort(
+                first_line=chunk_first_line,
+                last_line=chunk_last_line,
+                error=str(getattr(exc, "orig", None) or exc),
+            )
+            return False
+        result.accepted += len(rows)
+        return True
+
+    def reject(line_number: int, errors: list[dict]) -> None:
+        result.rejected += 1
+        if len(result.errors) < config.IMPORT_MAX_ERRORS:
+            result.errors.append(TodoImportError(line=line_number, errors=errors))
+        else:
+            result.errors_truncated = True
+
+    line_number = 0
+    async for line in iter_lines(chunks, config.IMPORT_MAX_LINE_BYTES):
+        line_number += 1
+        if isinstance(line, LineTooLong):
+            reject(line_number, [{"type": "line_too_long", "msg": f"Line exceeds {config.IMPORT_MAX_LINE_BYTES} bytes"}])
+            continue
+        if not line.strip():
+            continue
+        try:
+            todo = TodoCreate.model_validate_json(line)
+        except ValidationError as exc:
+            reject(line_number, exc.errors(include_url=False, include_context=False, include_input=False))
+            continue
+        if not chunk:
+            chunk_first_line = line_number
+        chunk.append(todo.model_dump())
+        chunk_last_line = line_number
+        if len(chunk) >= config.IMPORT_CHUNK_SIZE and not await flush():
+            return result
+
+    if chunk:
+        await flush()
+    return result
@@ -0,0 +1,150 @@
+# app/timing.py
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("todo.timing")
+
+
+@dataclass
+class RequestTimings:
+    """요청 하나의 단계별 누적 시간 (같은 단계가 여러 번이면 합산하고 횟수를 셈)"""
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    _open: dict[str, float] = field(default_factory=dict)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def start(self, phase: str) -> None:
+        self._open[phase] = time.perf_counter()
+
+    def stop(self, phase: str) -> None:
+        started = self._open.pop(phase, None)
+        if started is not None:
+            self.add(phase, time.perf_counter() - started)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (ms, 응답 시작 시점까지의 단계 + total)"""
+        entries = [f"{phase};dur={seconds * 1000:.3f}" for phase, seconds in self.phases.items()]
+        entries.append(f"total;dur={self.elapsed() * 1000:.3f}")
+        return ", ".join(entries)
+
+
+# 현재 요청의 측정값 (측정 중이 아니면 None)
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+class _Phase:
+    __slots__ = ("timings", "phase", "started")
+
+    def __init__(self, timings: RequestTimings, phase: str):
+        self.timings = timings
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.timings.add(self.phase, time.perf_counter() - self.started)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+def timed(phase: str) -> _Phase | _NoPhase:
+    """
+    with timed("serialize"): ... → 현재 요청의 phase 시간에 더함
+
+    측정 중이 아니면 아무것도 하지 않는 공용 객체를 돌려주므로
+    꺼져 있을 때 비용은 contextvar 조회 한 번
+    """
+    timings = _current.get()
+    return _NO_PHASE if timings is None else _Phase(timings, phase)
+
+
+def start_phase(phase: str) -> None:
+    """with를 쓸 수 없는 곳(SQLAlchemy 이벤트 등)에서 단계 시작"""
+    timings = _current.get()
+    if timings is not None:
+        timings.start(phase)
+
+
+def stop_phase(phase: str) -> None:
+    """start_phase()로 시작한 단계 종료 (시작하지 않았으면 무시)"""
+    timings = _current.get()
+    if timings is not None:
+        timings.stop(phase)
+
+
+class ServerTimingMiddleware:
+    """
+    요청마다 단계별 시간을 모아 Server-Timing 응답 헤더와 구조화 로그 한 줄로 내보냄
+
+    - 헤더: 응답 시작(http.response.start) 시점까지의 단계 + total
+    - 로그: 본문 전송(스트리밍 포함)까지 끝난 뒤의 전체 단계 (JSON 한 줄, todo.timing 로거)
+
+    TODO_SERVER_TIMING=1일 때만 앱에 등록됨 (app/main.py)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(raw=list(message["headers"]))
+                headers.append("Server-Timing", timings.server_timing())
+                message["headers"] = headers.raw
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            logger.info(json.dumps({
+                "event": "request_timing",
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status,
+                "total_ms": round(timings.elapsed() * 1000, 3),
+                "phases_ms": {phase: round(seconds * 1000, 3) for phase, seconds in timings.phases.items()},
+                "counts": timings.counts,
+            }))
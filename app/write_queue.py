@@ -0,0 +1,225 @@
+# app/write_queue.py
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app import config
+from app.database import WriteSessionLocal
+from app.query_log import RequestQueries, current_queries, recording_to
+
+T = TypeVar("T")
+
+# 쓰기 작업: 세션을 받아 쿼리를 실행하고 결과를 돌려주는 함수 (커밋은 코디네이터가 함)
+WriteOp = Callable[[AsyncSession], Awaitable[T]]
+
+# 락 재시도 전 대기 시간(초), 재시도마다 두 배
+LOCK_RETRY_DELAY = 0.05
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    """busy_timeout 동안 쓰기 락을 못 잡아 난 SQLite 오류인지"""
+    return isinstance(exc, OperationalError) and "database is locked" in str(exc.orig)
+
+
+@dataclass
+class PendingWrite:
+    """큐에서 대기 중인 쓰기 작업 하나"""
+    op: WriteOp
+    future: asyncio.Future
+    submitted_at: float = field(default_factory=time.perf_counter)
+    # 제출한 요청의 SQL 문장 집계 (작업자 태스크에서 실행돼도 요청의 문장 수에 포함되도록)
+    queries: RequestQueries | None = field(default_factory=current_queries)
+
+
+@dataclass
+class WriteQueueStats:
+    """배치 크기와 큐 대기 시간 통계"""
+    batches: int = 0
+    ops: int = 0
+    failed_ops: int = 0
+    failed_batches: int = 0
+    lock_retries: int = 0
+    max_batch_size: int = 0
+    queue_wait_seconds_total: float = 0.0
+    queue_wait_seconds_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "ops": self.ops,
+            "failed_ops": self.failed_ops,
+            "failed_batches": self.failed_batches,
+            "lock_retries": self.lock_retries,
+            "max_batch_size": self.max_batch_size,
+            "mean_batch_size": self.ops / self.batches if self.batches else 0.0,
+            "queue_wait_seconds_mean": self.queue_wait_seconds_total / self.ops if self.ops else 0.0,
+            "queue_wait_seconds_max": self.queue_wait_seconds_max,
+        }
+
+
+class WriteCoordinator:
+    """
+    그룹 커밋 코디네이터
+
+    짧은 시간(window) 안에 들어온 쓰기 작업들을 모아서 한 트랜잭션으로 실행
+    → 커밋(fsync) 한 번에 여러 요청을 처리하므로 초당 fsync 수가 처리량 상한이 되지 않음
+
+    - 작업마다 SAVEPOINT를 걸어서 한 작업이 실패해도 나머지는 그대로 커밋
+    - 작업이 끝날 때마다 세션의 identity map을 비움 → 작업끼리 ORM 객체를 공유하지 않음
+    - 각 요청은 자기 작업의 결과 또는 예외를 그대로 돌려받음
+    - 커밋 자체가 실패하면 배치의 모든 요청이 그 예외를 받음
+    - 쓰기 락을 못 잡아 실패하면('database is locked') 배치 전체를 lock_retries번까지 다시 실행
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        window: float,
+        max_ops: int,
+        lock_retries: int = 0,
+    ):
+        self.session_factory = session_factory
+        self.window = window
+        self.max_ops = max_ops
+        self.lock_retries = lock_retries
+        self.stats = WriteQueueStats()
+        self._queue: asyncio.Queue[PendingWrite] = asyncio.Queue()
+        self._batch_full = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """배치 처리 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._worker is None or self._worker.done():
+            if self._queue.empty():
+                # asyncio 큐/이벤트는 처음 사용한 이벤트 루프에 묶이므로 새로 만듦
+                self._queue = asyncio.Queue()
+                self._batch_full = asyncio.Event()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 작업을 모두 처리한 뒤 태스크 종료"""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def depth(self) -> int:
+        """다음 배치를 기다리는 작업 수"""
+        return self._queue.qsize()
+
+    async def submit(self, op: WriteOp[T]) -> T:
+        """쓰기 작업을 큐에 넣고 배치가 커밋될 때까지 기다려 결과 반환"""
+        self.start()
+        pending = PendingWrite(op=op, future=asyncio.get_running_loop().create_future())
+        self._queue.put_nowait(pending)
+        if self._queue.qsize() >= self.max_ops:
+            self._batch_full.set()
+        return await pending.future
+
+    async def _run(self) -> None:
+        while True:
+            first = await self._queue.get()
+            # window 동안 더 모으되, max_ops가 차면 바로 실행
+            if self.window > 0 and self._queue.qsize() + 1 < self.max_ops:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+            batch = self._drain([first])
+            try:
+                await self._apply(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _drain(self, batch: list[PendingWrite]) -> list[PendingWrite]:
+        """큐에 쌓인 작업을 max_ops까지 꺼냄"""
+        while len(batch) < self.max_ops and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        self._batch_full.clear()
+        return batch
+
+    async def _apply(self, batch: list[PendingWrite]) -> None:
+        """배치를 한 트랜잭션으로 실행하고 각 요청의 future에 결과 전달"""
+        started = time.perf_counter()
+        # 요청이 이미 취소된 작업은 실행하지 않음
+        batch = [pending for pending in batch if not pending.future.done()]
+        if not batch:
+            return
+
+        attempt = 0
+        while True:
+            try:
+                outcomes = await self._execute(batch)
+                break
+            except Exception as exc:
+                # 락 실패는 배치 전체가 롤백된 상태이므로 처음부터 다시 실행해도 안전
+                if is_lock_error(exc) and attempt < self.lock_retries:
+                    self.stats.lock_retries += 1
+                    await asyncio.sleep(LOCK_RETRY_DELAY * 2 ** attempt)
+                    attempt += 1
+                    continue
+                # 커밋 실패(또는 재시도 소진): 배치 전체가 롤백됨
+                self.stats.failed_batches += 1
+                outcomes = [(pending, None, exc) for pending in batch]
+                break
+
+        self._record(batch, started, outcomes)
+        for pending, result, exc in outcomes:
+            if pending.future.done():
+                continue
+            if exc is None:
+                pending.future.set_result(result)
+            else:
+                pending.future.set_exception(exc)
+
+    async def _execute(self, batch: list[PendingWrite]) -> list[tuple[PendingWrite, Any, BaseException | None]]:
+        """배치를 한 트랜잭션으로 실행 (작업별 예외는 결과로, 트랜잭션 시작/커밋 실패는 그대로 raise)"""
+        outcomes: list[tuple[PendingWrite, Any, BaseException | None]] = []
+        async with self.session_factory() as session:
+            async with session.begin():
+                # BEGIN IMMEDIATE(쓰기 락)를 첫 작업 전에 실행 → 락 실패가 작업 하나의 예외로 묻히지 않음
+                await session.connection()
+                for pending in batch:
+                    try:
+                        async with session.begin_nested():
+                            with recording_to(pending.queries):
+                                result = await pending.op(session)
+                            outcomes.append((pending, result, None))
+                    except Exception as exc:
+                        outcomes.append((pending, None, exc))
+                    finally:
+                        # 작업이 받은 ORM 객체를 세션에서 떼어 냄 (SAVEPOINT 해제 때 이미 flush됨)
+                        # 같은 배치의 다음 작업이 같은 행을 읽으면 identity map의 낡은 객체 대신
+                        # RETURNING/SELECT 결과로 새 객체를 만들고, 앞 작업의 결과도 덮어쓰지 않음
+                        session.expunge_all()
+        return outcomes
+
+    def _record(self, batch: list[PendingWrite], started: float, outcomes: list) -> None:
+        """배치 통계 갱신"""
+        self.stats.batches += 1
+        self.stats.ops += len(batch)
+        self.stats.failed_ops += sum(1 for _, _, exc in outcomes if exc is not None)
+        self.stats.max_batch_size = max(self.stats.max_batch_size, len(batch))
+        for pending in batch:
+            wait = started - pending.submitted_at
+            self.stats.queue_wait_seconds_total += wait
+            self.stats.queue_wait_seconds_max = max(self.stats.queue_wait_seconds_max, wait)
+
+
+# 앱 전체에서 공유하는 코디네이터 (쓰기 엔진의 연결 하나를 독점)
+write_queue = WriteCoordinator(
+    WriteSessionLocal,
+    window=config.WRITE_BATCH_WINDOW_MS / 1000,
+    max_ops=config.WRITE_BATCH_MAX_OPS,
+    lock_retries=config.WRITE_LOCK_RETRIES,
+)
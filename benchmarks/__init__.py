@@ -0,0 +1 @@
+# benchmarks: 성능 점검용 스크립트 모음 (python -m benchmarks.<모듈> 로 실행)
@@ -0,0 +1,87 @@
+# benchmarks/create_todo.py
+"""
+create_todo 쓰기 경로 지연 시간 비교
+
+- refresh: add → commit → refresh (INSERT 후 SELECT 한 번 더)
+- returning: INSERT ... RETURNING → commit (문장 하나)
+
+임시 SQLite 파일에 같은 개수의 할일을 하나씩 생성하면서 요청당 지연 시간을 측정
+
+실행: python -m benchmarks.create_todo [--requests 2000]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import Todo
+from app.schemas import TodoCreate
+
+
+async def create_with_refresh(session: AsyncSession, data: TodoCreate) -> Todo:
+    """기존 경로: add → commit → refresh"""
+    todo = Todo(**data.model_dump())
+    session.add(todo)
+    await session.commit()
+    await session.refresh(todo)
+    return todo
+
+
+async def create_with_returning(session: AsyncSession, data: TodoCreate) -> Todo:
+    """현재 경로: INSERT ... RETURNING → commit"""
+    result = await session.scalars(insert(Todo).values(**data.model_dump()).returning(Todo))
+    todo = result.one()
+    await session.commit()
+    return todo
+
+
+async def measure(path: Path, create, requests: int) -> list[float]:
+    """요청마다 새 세션을 열어 create를 실행하고 걸린 시간(ms) 목록 반환"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    timings = []
+    for i in range(requests):
+        data = TodoCreate(title=f"benchmark {i}", description="create_todo benchmark")
+        started = time.perf_counter()
+        async with session_factory() as session:
+            await create(session, data)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    await engine.dispose()
+    return timings
+
+
+def summarize(name: str, timings: list[float]) -> None:
+    """평균/p50/p95 출력"""
+    quantiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name:<10} mean={statistics.fmean(timings):.3f}ms "
+        f"p50={quantiles[49]:.3f}ms p95={quantiles[94]:.3f}ms"
+    )
+
+
+async def main(requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        refresh = await measure(Path(tmp) / "refresh.db", create_with_refresh, requests)
+        returning = await measure(Path(tmp) / "returning.db", create_with_returning, requests)
+
+    summarize("refresh", refresh)
+    summarize("returning", returning)
+    drop = 1 - statistics.fmean(returning) / statistics.fmean(refresh)
+    print(f"mean latency drop: {drop:.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
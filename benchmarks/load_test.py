@@ -0,0 +1,452 @@
+# benchmarks/load_test.py
+"""
+모든 엔드포인트 부하 테스트 (asyncio + httpx)
+
+고정된 동시성(--concurrency)과 고정된 요청 비율(MIX)로 --requests개 요청을 보내고
+엔드포인트별/전체 p50/p95/p99 지연 시간과 처리량을 JSON으로 저장
+
+- 요청 종류의 순서는 --seed로 고정 (대상 id/검색어도 같은 seed의 난수지만
+  동시 실행 순서에 따라 어느 요청에 배정되는지는 달라질 수 있음)
+- 삭제는 이번 실행에서 만든 할일만 대상으로 함 (만든 게 아직 없으면 그 차례는 생성으로 대체)
+  수정/생성/bulk/가져오기는 시드 데이터를 바꾸므로 --database는 실행마다 복사본으로 측정
+- 모든 라우트가 OPERATIONS에 있고, 관리용 라우트는 기본 비율 0 (--mix NAME=WEIGHT로 켬)
+  - counters_verify / counters_recompute: todos 전체 스캔 (/internal/counters/*)
+  - backfills: 백필 진행 상태 조회
+  - backfill_start / backfill_pause / backfill_throttle: 백필 상태와 속도를 바꿈
+    (끝났거나 멈춰 있지 않으면 409, 서버 오류로 세지 않음)
+- export는 테이블 전체를 보내므로 10M 규모에서는 --mix export=0 권장
+- 온라인 백필 중 지연을 재려면 seed --pending-backfills로 만든 DB를 사용
+  (서버가 시작하면서 백필을 실행, 진행 상태는 backfills 요청으로 조회)
+
+--database를 주면 그 파일을 같은 디렉터리의 임시 폴더에 복사하고 복사본으로 uvicorn 서버를 띄워서
+측정한 뒤 서버를 종료하고 복사본을 지움 → 원본은 바뀌지 않아 매 실행이 같은 데이터에서 시작
+(DB 크기만큼 디스크 공간과 복사 시간이 더 듦)
+주지 않으면 --base-url에 이미 떠 있는 서버를 측정 (그 서버의 데이터는 실행할 때마다 바뀜)
+
+--baseline에 이전 결과 JSON을 주면 엔드포인트별 p95와 전체 처리량을 비교해서
+--max-regression(기본 10%)보다 나빠지면 종료 코드 1
+
+실행:
+    python -m benchmarks.seed --rows 1M --database bench.db
+    python -m benchmarks.load_test --database bench.db --output results.json
+    python -m benchmarks.load_test --database bench.db --baseline results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.seed import VOCABULARY
+
+# 엔드포인트별 요청 비율 (합이 1일 필요는 없음, 상대 가중치)
+MIX: dict[str, float] = {
+    "root": 1,
+    "internal_stats": 1,
+    "metrics": 1,
+    "list": 20,
+    "list_cursor": 10,
+    "list_filtered": 8,
+    "list_fields": 8,
+    "get": 20,
+    "get_fields": 5,
+    "search": 8,
+    "stats": 3,
+    "export": 0.05,
+    "create": 6,
+    "bulk": 1,
+    "import": 0.5,
+    "update": 6,
+    "delete": 3,
+    "delete_many": 0.5,
+    "counters_verify": 0,
+    "counters_recompute": 0,
+    "backfills": 0,
+    "backfill_start": 0,
+    "backfill_pause": 0,
+    "backfill_throttle": 0,
+}
+
+# 백필 라우트 요청 대상 (app/backfills.py의 BACKFILLS)
+BACKFILL_NAME = "todos_completed_at"
+
+
+@dataclass
+class Sample:
+    operation: str
+    status: int | None
+    seconds: float
+
+
+@dataclass
+class LoadState:
+    """실행 중 공유 상태 (요청 대상 선택용)"""
+    rng: random.Random
+    max_seed_id: int
+    first_cursor: str | None
+    created: list[int] = field(default_factory=list)
+
+    def seed_id(self) -> int:
+        return self.rng.randint(1, self.max_seed_id)
+
+    def title(self) -> str:
+        return " ".join(self.rng.choices(VOCABULARY, k=self.rng.randint(2, 6)))
+
+
+Operation = Callable[[httpx.AsyncClient, LoadState], Awaitable[httpx.Response]]
+
+
+def track_created(response: httpx.Response, state: LoadState) -> httpx.Response:
+    if response.status_code == 201:
+        body = response.json()
+        state.created.extend(todo["id"] for todo in (body if isinstance(body, list) else [body]))
+    return response
+
+
+async def op_create(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    response = await client.post("/todos", json={"title": state.title(), "description": state.title()})
+    return track_created(response, state)
+
+
+async def op_bulk(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    items = [{"title": state.title()} for _ in range(10)]
+    return track_created(await client.post("/todos/bulk", json=items), state)
+
+
+async def op_import(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    # 가져온 할일은 id를 돌려받지 않으므로 삭제 대상에 넣지 않음
+    lines = "".join(json.dumps({"title": state.title()}) + "\n" for _ in range(50))
+    return await client.post(
+        "/todos/import", content=lines, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+
+async def op_delete(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    if not state.created:
+        return await op_create(client, state)
+    return await client.delete(f"/todos/{state.created.pop()}")
+
+
+async def op_delete_many(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    if not state.created:
+        return await op_create(client, state)
+    ids = [state.created.pop() for _ in range(min(10, len(state.created)))]
+    return await client.delete("/todos", params={"ids": ids})
+
+
+async def op_export(client: httpx.AsyncClient, state: LoadState) -> httpx.Response:
+    # 본문을 끝까지 받아야 전체 시간이 측정됨
+    async with client.stream("GET", "/todos/export") as response:
+        async for _ in response.aiter_bytes():
+            pass
+    return response
+
+
+OPERATIONS: dict[str, Operation] = {
+    "root": lambda client, state: client.get("/"),
+    "internal_stats": lambda client, state: client.get("/internal/stats"),
+    "metrics": lambda client, state: client.get("/metrics"),
+    "list": lambda client, state: client.get("/todos", params={"limit": 20}),
+    "list_cursor": lambda client, state: client.get(
+        "/todos", params={"limit": 20, **({"cursor": state.first_cursor} if state.first_cursor else {})}
+    ),
+    "list_filtered": lambda client, state: client.get("/todos", params={"completed": "false", "limit": 20}),
+    "list_fields": lambda client, state: client.get("/todos", params={"fields": "id,title,completed", "limit": 100}),
+    "get": lambda client, state: client.get(f"/todos/{state.seed_id()}"),
+    "get_fields": lambda client, state: client.get(f"/todos/{state.seed_id()}", params={"fields": "id,title"}),
+    "search": lambda client, state: client.get(
+        "/todos/search", params={"q": " ".join(state.rng.sample(VOCABULARY, 2)), "limit": 20}
+    ),
+    "stats": lambda client, state: client.get("/todos/stats"),
+    "export": op_export,
+    "create": op_create,
+    "bulk": op_bulk,
+    "import": op_import,
+    "update": lambda client, state: client.put(
+        f"/todos/{state.seed_id()}", json={"completed": state.rng.random() < 0.5}
+    ),
+    "delete": op_delete,
+    "delete_many": op_delete_many,
+    "counters_verify": lambda client, state: client.get("/internal/counters/verify"),
+    "counters_recompute": lambda client, state: client.post("/internal/counters/recompute"),
+    "backfills": lambda client, state: client.get("/internal/backfills"),
+    "backfill_start": lambda client, state: client.post(f"/internal/backfills/{BACKFILL_NAME}/start"),
+    "backfill_pause": lambda client, state: client.post(f"/internal/backfills/{BACKFILL_NAME}/pause"),
+    "backfill_throttle": lambda client, state: client.post(
+        "/internal/backfills/throttle",
+        json={"batch_size": state.rng.choice([250, 500, 1000]), "pause_ms": state.rng.choice([0, 50])},
+    ),
+}
+
+
+def build_schedule(mix: dict[str, float], requests: int, rng: random.Random) -> list[str]:
+    """가중치대로 뽑은 요청 순서 (seed가 같으면 항상 같음)"""
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    return rng.choices(names, weights=weights, k=requests)
+
+
+async def prepare_state(client: httpx.AsyncClient, seed: int) -> LoadState:
+    """시드 데이터의 최대 id와 두 번째 페이지 커서 확인"""
+    response = await client.get("/todos", params={"limit": 20, "fields": "id"})
+    response.raise_for_status()
+    newest = response.json()
+    if not newest:
+        raise SystemExit("database is empty; run python -m benchmarks.seed first")
+    # 시드 데이터는 id 순서로 created_at이 증가하므로 가장 최근 행이 최대 id
+    return LoadState(
+        rng=random.Random(seed),
+        max_seed_id=newest[0]["id"],
+        first_cursor=response.headers.get("X-Next-Cursor"),
+    )
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    mix: dict[str, float],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> tuple[list[Sample], float]:
+    """워밍업 후 concurrency개 작업자가 schedule을 나눠 실행 → (샘플 목록, 측정 구간 시간)"""
+    state = await prepare_state(client, seed)
+    schedule = build_schedule(mix, warmup + requests, random.Random(seed))
+    samples: list[Sample] = []
+
+    async def drive(names: list[str], record: bool) -> None:
+        pending = iter(names)  # 작업자들이 같은 이터레이터에서 다음 요청을 가져감
+
+        async def worker() -> None:
+            for name in pending:
+                started = time.perf_counter()
+                try:
+                    status = (await OPERATIONS[name](client, state)).status_code
+                except httpx.HTTPError:
+                    status = None
+                if record:
+                    samples.append(Sample(name, status, time.perf_counter() - started))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    # 워밍업 (캐시, 연결 풀, 페이지 캐시 채우기), 측정에는 넣지 않음
+    await drive(schedule[:warmup], record=False)
+    started = time.perf_counter()
+    await drive(schedule[warmup:], record=True)
+    return samples, time.perf_counter() - started
+
+
+def percentile_summary(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    """샘플 목록 → 요청 수, 오류 수, 처리량, 지연 시간(ms) 분위수"""
+    latencies = sorted(sample.seconds * 1000 for sample in samples)
+    statuses = Counter(str(sample.status) for sample in samples)
+    errors = sum(1 for sample in samples if sample.status is None or sample.status >= 500)
+    summary: dict[str, Any] = {
+        "requests": len(samples),
+        "errors": errors,
+        "statuses": dict(sorted(statuses.items())),
+        "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+    }
+    if latencies:
+        if len(latencies) > 1:
+            quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        else:
+            quantiles = latencies * 99
+        summary.update(
+            mean_ms=statistics.fmean(latencies),
+            p50_ms=quantiles[49],
+            p95_ms=quantiles[94],
+            p99_ms=quantiles[98],
+            max_ms=latencies[-1],
+        )
+    return summary
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    by_operation: dict[str, list[Sample]] = {}
+    for sample in samples:
+        by_operation.setdefault(sample.operation, []).append(sample)
+    return {
+        "overall": percentile_summary(samples, elapsed),
+        "operations": {
+            name: percentile_summary(by_operation[name], elapsed) for name in sorted(by_operation)
+        },
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], max_regression: float) -> list[str]:
+    """이전 결과 대비 나빠진 항목 (p95가 늘었거나 전체 처리량이 줄었거나)"""
+    regressions = []
+    for name, stats in current["operations"].items():
+        before = baseline["operations"].get(name)
+        if before is None or "p95_ms" not in before or "p95_ms" not in stats:
+            continue
+        change = stats["p95_ms"] / before["p95_ms"] - 1
+        if change > max_regression:
+            regressions.append(f"{name}: p95 {before['p95_ms']:.2f}ms → {stats['p95_ms']:.2f}ms (+{change:.0%})")
+    before_rps = baseline["overall"]["throughput_rps"]
+    change = 1 - current["overall"]["throughput_rps"] / before_rps if before_rps else 0.0
+    if change > max_regression:
+        regressions.append(
+            f"throughput: {before_rps:.1f} → {current['overall']['throughput_rps']:.1f} req/s (-{change:.0%})"
+        )
+    return regressions
+
+
+def print_report(result: dict[str, Any]) -> None:
+    print(f"{'operation':<20} {'requests':>8} {'errors':>6} {'p50':>9} {'p95':>9} {'p99':>9}")
+    rows = [*result["operations"].items(), ("overall", result["overall"])]
+    for name, stats in rows:
+        print(
+            f"{name:<20} {stats['requests']:>8} {stats['errors']:>6} "
+            f"{stats.get('p50_ms', 0):>7.2f}ms {stats.get('p95_ms', 0):>7.2f}ms {stats.get('p99_ms', 0):>7.2f}ms"
+        )
+    print(f"throughput: {result['overall']['throughput_rps']:.1f} req/s")
+
+
+def copy_database(source: Path, directory: Path) -> Path:
+    """실행용 DB 복사본 만들기 (sqlite3 백업 API라서 -wal에만 있는 변경도 포함)"""
+    if not source.exists():
+        raise SystemExit(f"database not found: {source}")
+    target = directory / source.name
+    src, dst = sqlite3.connect(source), sqlite3.connect(target)
+    try:
+        src.backup(dst)
+    finally:
+        src.close()
+        dst.close()
+    return target
+
+
+def start_server(database: Path, port: int, log_path: Path) -> subprocess.Popen:
+    """지정한 DB 파일로 uvicorn 서버 시작 (서버 로그는 log_path로)"""
+    env = {**os.environ, "TODO_DATABASE_URL": f"sqlite+aiosqlite:///{database.resolve()}"}
+    log = log_path.open("w")
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--no-access-log"],
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > deadline:
+            raise SystemExit("server did not become ready")
+        await asyncio.sleep(0.2)
+
+
+def parse_mix(overrides: list[str]) -> dict[str, float]:
+    """--mix name=weight 목록으로 기본 비율 덮어쓰기"""
+    mix = dict(MIX)
+    for override in overrides:
+        name, _, weight = override.partition("=")
+        if name not in OPERATIONS:
+            raise SystemExit(f"unknown operation in --mix: {name} (known: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight)
+    return mix
+
+
+async def main(args: argparse.Namespace) -> int:
+    mix = parse_mix(args.mix)
+    base_url = args.base_url
+    server = None
+    workdir = None
+    if args.database is not None:
+        base_url = f"http://127.0.0.1:{args.port}"
+        # 원본 옆(같은 디스크)에 복사, 끝나면 -wal/-shm까지 폴더째 삭제
+        workdir = tempfile.TemporaryDirectory(prefix="load_test-", dir=args.database.resolve().parent)
+        database = copy_database(args.database, Path(workdir.name))
+        server = start_server(database, args.port, args.server_log)
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+            await wait_until_ready(client)
+            rows = (await client.get("/todos/stats")).json()["total"]
+            samples, elapsed = await run_load(
+                client, mix, args.requests, args.concurrency, args.warmup, args.seed
+            )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if workdir is not None:
+            workdir.cleanup()
+
+    result = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "rows": rows,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "mix": mix,
+            "elapsed_seconds": elapsed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        **summarize(samples, elapsed),
+    }
+    args.output.write_text(json.dumps(result, indent=2))
+    print_report(result)
+    print(f"results written to {args.output}")
+
+    if args.baseline is not None:
+        regressions = compare(json.loads(args.baseline.read_text()), result, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", type=Path, help="start a server on a temporary copy of this seeded database")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="server to test when --database is not given")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--server-log", type=Path, default=Path("load_test_server.log"))
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--warmup", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--mix", action="append", default=[], metavar="NAME=WEIGHT")
+    parser.add_argument("--output", type=Path, default=Path("load_test_results.json"))
+    parser.add_argument("--baseline", type=Path, help="previous results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,147 @@
+# benchmarks/seed.py
+"""
+부하 테스트용 SQLite 데이터베이스 생성
+
+같은 --rows / --seed면 항상 같은 데이터가 만들어지므로 커밋 간 비교가 가능함
+
+- 제목/설명은 VOCABULARY 단어 조합 (검색 부하 테스트가 같은 단어로 검색)
+- 약 30%는 완료, 약 20%는 설명 없음, 약 40%는 생성 후 수정됨
+- created_at은 2025-01-01부터 행 순서대로 증가 (같은 초에 여러 행 가능)
+
+빠르게 채우기 위해 첫 마이그레이션(테이블)만 적용하고 저널 없이 행을 넣은 뒤
+나머지 마이그레이션(인덱스, 검색 인덱스, 집계 카운터)을 앱 시작 때와 같은 함수로 적용
+(행마다 인덱스/트리거가 도는 것보다 훨씬 빠르고, 스키마 버전도 앱과 같음)
+마이그레이션이 등록한 백필(completed_at)도 UPDATE 한 번으로 끝내 둠
+(--pending-backfills면 그대로 두고 앱 시작 때 온라인 백필로 채움 → 백필 중 부하 테스트용)
+
+실행: python -m benchmarks.seed --rows 1M --database bench.db
+      (10k / 1M / 10M 또는 정수, 이미 있는 파일은 --force로 덮어씀)
+"""
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from app.backfills import run_to_completion
+from app.migrations import apply_migrations
+
+VOCABULARY = [
+    "buy", "milk", "call", "mom", "write", "report", "review", "pull", "request", "deploy",
+    "server", "fix", "bug", "plan", "sprint", "book", "flight", "pay", "rent", "clean",
+    "kitchen", "read", "paper", "update", "docs", "refactor", "database", "index", "query", "cache",
+    "email", "team", "meeting", "notes", "backup", "photos", "renew", "passport", "schedule", "dentist",
+]
+
+SIZES = {"10k": 10_000, "1M": 1_000_000, "10M": 10_000_000}
+
+INSERT_SQL = (
+    "INSERT INTO todos (title, description, completed, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+START = datetime(2025, 1, 1)
+
+
+def parse_rows(value: str) -> int:
+    """'10k', '1M', '10M' 또는 정수 → 행 수"""
+    if value in SIZES:
+        return SIZES[value]
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:].lower(), 1)
+    number = value[:-1] if multiplier != 1 else value
+    try:
+        return int(number) * multiplier
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid row count: {value}")
+
+
+def generate_rows(count: int, seed: int) -> Iterator[tuple]:
+    """결정적인 할일 행 (title, description, completed, created_at, updated_at)"""
+    rng = random.Random(seed)
+    created = START
+    for _ in range(count):
+        created += timedelta(seconds=rng.randint(0, 3))
+        updated = created + timedelta(seconds=rng.randint(1, 7 * 86400)) if rng.random() < 0.4 else created
+        title = " ".join(rng.choices(VOCABULARY, k=rng.randint(2, 6)))
+        description = (
+            " ".join(rng.choices(VOCABULARY, k=rng.randint(5, 60))) if rng.random() >= 0.2 else None
+        )
+        yield (
+            title,
+            description,
+            rng.random() < 0.3,
+            created.isoformat(sep=" "),
+            updated.isoformat(sep=" "),
+        )
+
+
+def seed_database(
+    path: Path, rows: int, seed: int, batch_size: int = 50_000, pending_backfills: bool = False
+) -> None:
+    started = time.perf_counter()
+    engine = create_engine(f"sqlite:///{path}")
+
+    # 1. 테이블만 만들고(마이그레이션 1) 저널/fsync 없이 행 채우기
+    with engine.begin() as conn:
+        apply_migrations(conn, target=1)
+    con = sqlite3.connect(path)
+    con.execute("PRAGMA journal_mode = OFF")
+    con.execute("PRAGMA synchronous = OFF")
+    generated = generate_rows(rows, seed)
+    inserted = 0
+    while batch := list(islice(generated, batch_size)):
+        con.executemany(INSERT_SQL, batch)
+        inserted += len(batch)
+        print(f"\r  inserted {inserted:,}/{rows:,}", end="", flush=True)
+    con.commit()
+    con.close()
+    print(f"\n  rows: {time.perf_counter() - started:.1f}s")
+
+    # 2. 나머지 마이그레이션: 인덱스, 검색 인덱스(rebuild), 집계 카운터 (앱 시작 때와 같은 함수)
+    phase = time.perf_counter()
+    with engine.begin() as conn:
+        applied = apply_migrations(conn)
+    print(f"  migrations {', '.join(str(m['version']) for m in applied)}: {time.perf_counter() - phase:.1f}s")
+
+    # 3. 등록된 백필 (서비스 전이므로 나누지 않고 한 번에)
+    if not pending_backfills:
+        phase = time.perf_counter()
+        with engine.begin() as conn:
+            backfilled = run_to_completion(conn, "todos_completed_at")
+        print(f"  backfill todos_completed_at ({backfilled:,} rows): {time.perf_counter() - phase:.1f}s")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode = WAL")
+    engine.dispose()
+    print(f"seeded {rows:,} todos into {path} in {time.perf_counter() - started:.1f}s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=parse_rows, default=SIZES["10k"])
+    parser.add_argument("--database", type=Path, default=Path("bench.db"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--force", action="store_true", help="overwrite an existing database file")
+    parser.add_argument(
+        "--pending-backfills", action="store_true", help="leave backfills for the app to run online"
+    )
+    args = parser.parse_args()
+
+    if args.database.exists():
+        if not args.force:
+            print(f"{args.database} already exists (use --force to overwrite)", file=sys.stderr)
+            return 1
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{args.database}{suffix}").unlink(missing_ok=True)
+
+    seed_database(args.database, args.rows, args.seed, pending_backfills=args.pending_backfills)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
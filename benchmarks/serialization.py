@@ -0,0 +1,109 @@
+# benchmarks/serialization.py
+"""
+list_todos 응답 직렬화 비용 비교 (한 페이지 기준)
+
+- orm: select(Todo) → ORM 객체 → response_model(list[TodoResponse]) 검증 → JSON
+  (FastAPI가 response_model이 있는 엔드포인트에서 serialize_response로 하는 것과 같은 단계)
+- rows: select(컬럼들) → Core Row → TypeAdapter(list[TodoRow]).dump_json
+  (현재 list_todos 경로)
+
+메모리 SQLite에 할일을 채운 뒤 같은 페이지를 반복해서 읽고 직렬화하는
+시간(조회 + 직렬화)과 직렬화만의 시간을 각각 측정
+
+실행: python -m benchmarks.serialization [--rows 100] [--iterations 2000]
+"""
+import argparse
+import statistics
+import time
+
+from fastapi.routing import APIRoute
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.main import app
+from app.models import Todo
+from app.serialization import TODO_COLUMNS, render_todo_rows
+
+
+def list_todos_field():
+    """list_todos 라우트의 response_model 필드 (FastAPI가 응답 검증에 쓰는 것)"""
+    route = next(r for r in app.routes if isinstance(r, APIRoute) and r.name == "list_todos")
+    return route.response_field
+
+
+def serialize_orm(field, todos) -> bytes:
+    """fastapi.routing.serialize_response(dump_json=True)와 같은 단계: 검증 → JSON 덤프"""
+    value, errors = field.validate(todos, {}, loc=("response",))
+    assert not errors
+    return field.serialize_json(value)
+
+
+def measure(fn, iterations: int) -> list[float]:
+    """fn을 반복 실행하고 회당 시간(µs) 목록 반환"""
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def summarize(name: str, timings: list[float]) -> None:
+    """평균/p50/p95 출력"""
+    quantiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name:<24} mean={statistics.fmean(timings):8.1f}µs "
+        f"p50={quantiles[49]:8.1f}µs p95={quantiles[94]:8.1f}µs"
+    )
+
+
+def main(rows: int, iterations: int) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    field = list_todos_field()
+
+    orm_stmt = select(Todo).order_by(Todo.created_at.desc(), Todo.id.desc()).limit(rows)
+    rows_stmt = select(*TODO_COLUMNS).order_by(Todo.created_at.desc(), Todo.id.desc()).limit(rows)
+
+    with Session(engine) as session:
+        session.execute(
+            insert(Todo),
+            [
+                {"title": f"benchmark {i}", "description": "serialization benchmark " * 4, "completed": i % 3 == 0}
+                for i in range(rows)
+            ],
+        )
+        session.commit()
+
+        def fetch_orm():
+            todos = session.scalars(orm_stmt).all()
+            session.expunge_all()  # 요청마다 새 세션처럼 매번 하이드레이션
+            return todos
+
+        def fetch_rows():
+            return session.execute(rows_stmt).all()
+
+        todos = fetch_orm()
+        page = fetch_rows()
+        # 두 경로의 출력이 같은지 먼저 확인
+        assert serialize_orm(field, todos) == render_todo_rows(page)
+
+        print(f"{rows} rows/page, {iterations} iterations")
+        orm_total = measure(lambda: serialize_orm(field, fetch_orm()), iterations)
+        rows_total = measure(lambda: render_todo_rows(fetch_rows()), iterations)
+        summarize("orm (fetch + serialize)", orm_total)
+        summarize("rows (fetch + serialize)", rows_total)
+        summarize("orm (serialize)", measure(lambda: serialize_orm(field, todos), iterations))
+        summarize("rows (serialize)", measure(lambda: render_todo_rows(page), iterations))
+
+    drop = 1 - statistics.fmean(rows_total) / statistics.fmean(orm_total)
+    print(f"mean time drop (fetch + serialize): {drop:.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.rows, args.iterations)
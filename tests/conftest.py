@@ -0,0 +1,34 @@
+# tests/conftest.py
+import atexit
+import os
+import shutil
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+# 엔진은 app.database를 import할 때 만들어지므로 app을 import하기 전에 테스트용 DB 파일 지정
+# 백필은 테스트가 직접 실행할 때만 돌도록 자동 시작을 끔
+_database_dir = tempfile.mkdtemp(prefix="todo-tests-")
+atexit.register(shutil.rmtree, _database_dir, ignore_errors=True)
+os.environ["TODO_DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(_database_dir) / 'todos.db'}"
+os.environ.setdefault("TODO_BACKFILL_AUTO_START", "0")
+
+import httpx  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """lifespan(마이그레이션, 쓰기 큐)까지 실행한 앱에 요청을 보내는 클라이언트"""
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
@@ -0,0 +1,187 @@
+# tests/test_backfills.py
+import asyncio
+from functools import partial
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.backfills import BACKFILLS, PROGRESS_SQL, BackfillRunner, run_batch, start_backfill
+from app.cache import todo_cache
+from app.database import ReadSessionLocal, write_engine
+from app.query_log import RequestQueries, recording_to
+from app.write_queue import write_queue
+
+pytestmark = pytest.mark.anyio
+
+NAME = "todos_completed_at"
+BACKFILL = BACKFILLS[NAME]
+
+# 진행 위치를 지금 테이블 끝으로 옮겨서 이 테스트가 넣은 행만 백필 범위에 들어가게 함
+RESET_SQL = """
+    UPDATE backfill_progress
+    SET status = 'pending', last_id = (SELECT coalesce(max(id), 0) FROM todos), max_id = 0,
+        rows_updated = 0, batches = 0, started_at = NULL, finished_at = NULL
+    WHERE name = :name
+"""
+
+# 마이그레이션 6 이전에 완료된 할일처럼 completed_at이 비어 있는 행
+INSERT_LEGACY_SQL = """
+    INSERT INTO todos (title, completed, created_at, updated_at)
+    VALUES (:title, :completed, '2024-01-01 00:00:00', '2024-01-02 00:00:00')
+    RETURNING id
+"""
+
+
+@pytest.fixture
+async def legacy_ids(client) -> list[int]:
+    """완료 5개 + 미완료 1개를 백필 전 상태로 넣고 진행 상태를 초기화"""
+    async with write_engine.begin() as conn:
+        await conn.execute(text(RESET_SQL), {"name": NAME})
+        ids = [
+            (await conn.execute(text(INSERT_LEGACY_SQL), {"title": f"legacy {i}", "completed": i != 5})).scalar_one()
+            for i in range(6)
+        ]
+    return ids
+
+
+def make_runner(batch_size: int, pause_seconds: float) -> BackfillRunner:
+    return BackfillRunner(write_queue, ReadSessionLocal, todo_cache, batch_size, pause_seconds)
+
+
+async def read_progress() -> dict:
+    async with ReadSessionLocal() as db:
+        result = await db.execute(text(PROGRESS_SQL + " WHERE name = :name"), {"name": NAME})
+        return dict(result.mappings().one())
+
+
+async def unfilled_ids(ids: list[int]) -> list[int]:
+    async with ReadSessionLocal() as db:
+        result = await db.execute(
+            text("SELECT id FROM todos WHERE completed AND completed_at IS NULL ORDER BY id")
+        )
+        return [todo_id for todo_id in result.scalars() if todo_id in ids]
+
+
+async def wait_for_batches(count: int) -> dict:
+    for _ in range(500):
+        progress = await read_progress()
+        if progress["batches"] >= count:
+            return progress
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"backfill did not reach {count} batches")
+
+
+async def test_run_batch_commits_checkpoint_with_the_update(legacy_ids):
+    start = (await read_progress())["last_id"]
+    assert await write_queue.submit(partial(start_backfill, backfill=BACKFILL))
+
+    async def batch_then_fail(db: AsyncSession) -> None:
+        await run_batch(db, BACKFILL, 2)
+        raise RuntimeError("fail after the batch")
+
+    # 같은 트랜잭션(SAVEPOINT)이라 실패하면 UPDATE도 진행 위치도 함께 롤백
+    with pytest.raises(RuntimeError):
+        await write_queue.submit(batch_then_fail)
+    assert (await read_progress())["last_id"] == start
+    assert await unfilled_ids(legacy_ids) == legacy_ids[:5]
+
+    result = await write_queue.submit(partial(run_batch, backfill=BACKFILL, batch_size=2))
+
+    assert result.ids == legacy_ids[:2]
+    assert result.last_id == start + 2
+    progress = await read_progress()
+    assert (progress["last_id"], progress["rows_updated"], progress["batches"]) == (start + 2, 2, 1)
+    assert await unfilled_ids(legacy_ids) == legacy_ids[2:5]
+
+
+async def test_pause_resume_and_throttle(legacy_ids):
+    start = (await read_progress())["last_id"]
+    runner = make_runner(batch_size=1, pause_seconds=0.2)
+    try:
+        assert await runner.start(NAME)
+        await wait_for_batches(1)
+        assert await runner.pause(NAME)
+        await runner.wait(NAME)
+
+        paused = await read_progress()
+        assert paused["status"] == "paused"
+        assert paused["last_id"] == start + paused["batches"]  # batch_size=1
+        assert paused["last_id"] < paused["max_id"]
+        assert not runner.is_running(NAME)
+
+        # 다음 배치부터 새 배치 크기 → 남은 범위를 배치 하나로 끝냄
+        runner.throttle(batch_size=100, pause_seconds=0)
+        assert await runner.start(NAME)
+        await runner.wait(NAME)
+
+        done = await read_progress()
+        assert done["status"] == "done"
+        assert done["batches"] == paused["batches"] + 1
+        assert done["rows_updated"] == 5
+    finally:
+        await runner.stop()
+
+
+async def test_restart_resumes_from_saved_checkpoint(legacy_ids):
+    start = (await read_progress())["last_id"]
+    first = make_runner(batch_size=2, pause_seconds=10)
+    try:
+        assert await first.start(NAME)
+        await wait_for_batches(1)
+    finally:
+        # 프로세스 종료처럼 멈춤: 상태는 running, 진행 위치는 커밋된 배치까지
+        await first.stop()
+    stopped = await read_progress()
+    assert stopped["status"] == "running"
+    assert (stopped["last_id"], stopped["batches"]) == (start + 2, 1)
+
+    second = make_runner(batch_size=2, pause_seconds=0)
+    try:
+        assert await second.resume(include_pending=False) == [NAME]
+        await second.wait(NAME)
+    finally:
+        await second.stop()
+
+    done = await read_progress()
+    assert done["status"] == "done"
+    # 남은 4개 id(start+3..start+6)만 배치 2개로 처리
+    assert (done["batches"], done["rows_updated"]) == (3, 5)
+
+
+async def test_completed_rows_have_completed_at_after_backfill(client, legacy_ids):
+    # 테이블 처음부터 (앞 테스트가 채우다 만 행 포함)
+    async with write_engine.begin() as conn:
+        await conn.execute(text("UPDATE backfill_progress SET last_id = 0 WHERE name = :name"), {"name": NAME})
+    runner = make_runner(batch_size=50, pause_seconds=0)
+    try:
+        assert await runner.start(NAME)
+        await runner.wait(NAME)
+    finally:
+        await runner.stop()
+
+    async with ReadSessionLocal() as db:
+        missing = (
+            await db.execute(text("SELECT count(*) FROM todos WHERE completed AND completed_at IS NULL"))
+        ).scalar_one()
+        open_filled = (
+            await db.execute(text("SELECT completed_at FROM todos WHERE id = :id"), {"id": legacy_ids[5]})
+        ).scalar_one()
+    assert missing == 0
+    assert open_filled is None
+    assert (await client.get(f"/todos/{legacy_ids[0]}")).json()["completed_at"] == "2024-01-02T00:00:00"
+
+
+async def test_backfill_task_does_not_record_into_starting_request(legacy_ids):
+    runner = make_runner(batch_size=1, pause_seconds=0)
+    queries = RequestQueries("POST", f"/internal/backfills/{NAME}/start")
+    try:
+        with recording_to(queries):
+            assert await runner.start(NAME)
+        counted = queries.count
+        await runner.wait(NAME)
+    finally:
+        await runner.stop()
+
+    assert (await read_progress())["batches"] == 6
+    assert queries.count == counted
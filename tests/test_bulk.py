@@ -0,0 +1,46 @@
+# tests/test_bulk.py
+import json
+
+import pytest
+
+from app import config
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_bulk_creates_in_request_order(client):
+    response = await client.post("/todos/bulk", json=[{"title": "a"}, {"title": "b", "completed": True}])
+
+    assert response.status_code == 201
+    assert [todo["title"] for todo in response.json()] == ["a", "b"]
+
+
+async def test_bulk_rejects_large_content_length_before_reading(client):
+    body = b"[" + b" " * config.BULK_MAX_BODY_BYTES + b"]"
+
+    response = await client.post("/todos/bulk", content=body, headers={"content-type": "application/json"})
+
+    assert response.status_code == 413
+
+
+async def test_bulk_rejects_large_chunked_body(client):
+    chunk = b" " * (1024 * 1024)
+
+    async def chunks():
+        yield b"["
+        for _ in range(config.BULK_MAX_BODY_BYTES // len(chunk) + 1):
+            yield chunk
+        yield b"]"
+
+    response = await client.post("/todos/bulk", content=chunks(), headers={"content-type": "application/json"})
+
+    assert response.status_code == 413
+
+
+async def test_bulk_counts_ndjson_lines_before_parsing(client):
+    line = json.dumps({"title": "x"}).encode()
+    body = b"\n".join([line] * (config.BULK_MAX_ITEMS + 1))
+
+    response = await client.post("/todos/bulk", content=body, headers={"content-type": "application/x-ndjson"})
+
+    assert response.status_code == 413
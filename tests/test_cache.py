@@ -0,0 +1,53 @@
+# tests/test_cache.py
+import pytest
+
+from app.cache import TodoCache, todo_cache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_get_after_put_and_delete_is_fresh(client):
+    todo_id = (await client.post("/todos", json={"title": "before"})).json()["id"]
+    assert (await client.get(f"/todos/{todo_id}")).json()["title"] == "before"  # 캐시 채움
+
+    await client.put(f"/todos/{todo_id}", json={"title": "after", "completed": True})
+    fresh = (await client.get(f"/todos/{todo_id}")).json()
+    assert (fresh["title"], fresh["completed"]) == ("after", True)
+
+    await client.delete(f"/todos/{todo_id}")
+    assert (await client.get(f"/todos/{todo_id}")).status_code == 404
+
+
+async def test_fill_started_before_a_write_does_not_repopulate_cache(client):
+    todo_id = (await client.post("/todos", json={"title": "raced"})).json()["id"]
+    stale = await client.get(f"/todos/{todo_id}")
+    todo_cache.invalidate(todo_id)
+
+    # 읽기가 토큰을 받고 DB를 읽는 사이에 쓰기가 끝난 상황
+    token = todo_cache.fill_token()
+    await client.put(f"/todos/{todo_id}", json={"title": "written"})
+    todo_cache.invalidate(todo_id)  # 쓰기 뒤 항목이 비어 있어도 낡은 값으로 다시 채우면 안 됨
+    todo_cache.fill(todo_id, stale.content, stale.headers["ETag"], token)
+
+    assert todo_cache.get(todo_id) is None
+    assert (await client.get(f"/todos/{todo_id}")).json()["title"] == "written"
+
+
+def test_fill_token_rejects_fills_older_than_the_last_write():
+    cache = TodoCache(max_entries=10, max_bytes=0, ttl=60)
+    token = cache.fill_token()
+    cache.put(1, b"new", '"new"')
+    cache.invalidate(2)
+
+    cache.fill(1, b"old", '"old"', token)
+    cache.fill(2, b"old", '"old"', token)
+    cache.fill(3, b"three", '"three"', token)
+
+    assert cache.get(1).payload == b"new"
+    assert cache.get(2) is None
+    assert cache.get(3).payload == b"three"
+    assert cache.stats.rejected_fills == 2
+
+    # 쓰기 뒤에 받은 토큰이면 채움
+    cache.fill(2, b"fresh", '"fresh"', cache.fill_token())
+    assert cache.get(2).payload == b"fresh"
@@ -0,0 +1,170 @@
+# tests/test_compression.py
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+
+from app import config
+from app.compression import CompressionMiddleware, CompressionStats, negotiate
+from app.main import app
+
+pytestmark = pytest.mark.anyio
+
+PREFERRED = ["zstd", "br", "gzip"]
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", "gzip"),
+        ("gzip;q=0.5, br;q=0.8", "br"),
+        ("gzip, br", "br"),  # q가 같으면 서버 선호 순서
+        ("gzip;q=0, br;q=0", None),
+        ("*", "zstd"),
+        ("*;q=0.5, gzip;q=1", "gzip"),
+        ("*, zstd;q=0", "br"),
+        ("gzip;q=0, *", "zstd"),
+        ("identity", None),
+        ("", None),
+        ("gzip;q=abc", None),
+        ("GZIP ; Q=0.3", "gzip"),
+    ],
+)
+def test_negotiate(accept_encoding, expected):
+    assert negotiate(accept_encoding, PREFERRED) == expected
+
+
+def test_negotiate_only_offers_available_encodings():
+    assert negotiate("*", ["gzip"]) == "gzip"
+    assert negotiate("br, zstd", ["gzip"]) is None
+
+
+async def run(messages: list[dict], accept_encoding: str = "gzip", minimum_size: int = 100) -> list[dict]:
+    """messages를 그대로 보내는 ASGI 앱을 압축 미들웨어로 감싸 실행 → 내려간 메시지"""
+    async def downstream_app(scope, receive, send):
+        for message in messages:
+            await send(message)
+
+    sent: list[dict] = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    middleware = CompressionMiddleware(
+        downstream_app, minimum_size=minimum_size, encodings=["gzip"], stats=CompressionStats()
+    )
+    scope = {"type": "http", "method": "GET", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    await middleware(scope, receive, send)
+    return sent
+
+
+def start(status: int = 200, content_type: bytes = b"application/json", etag: bytes | None = b'"abc"') -> dict:
+    headers = [(b"content-type", content_type)]
+    if etag is not None:
+        headers.append((b"etag", etag))
+    return {"type": "http.response.start", "status": status, "headers": headers}
+
+
+def header(message: dict, name: str) -> str | None:
+    values = [value.decode() for key, value in message["headers"] if key.decode().lower() == name]
+    return ", ".join(values) if values else None
+
+
+async def test_small_body_passes_through_uncompressed():
+    body = b'{"ok": true}'
+    sent = await run([start(), {"type": "http.response.body", "body": body}])
+
+    assert header(sent[0], "content-encoding") is None
+    assert header(sent[0], "etag") == '"abc"'
+    assert sent[1]["body"] == body
+
+
+@pytest.mark.parametrize("status", [204, 304])
+async def test_no_body_statuses_pass_through(status):
+    sent = await run([start(status), {"type": "http.response.body", "body": b""}], minimum_size=0)
+
+    assert sent[0]["status"] == status
+    assert header(sent[0], "content-encoding") is None
+    assert header(sent[0], "etag") == '"abc"'
+    assert sent[1]["body"] == b""
+
+
+async def test_compressed_body_gets_weak_etag_and_vary():
+    body = json.dumps([{"title": "compress me"}] * 50).encode()
+    sent = await run([start(), {"type": "http.response.body", "body": body}])
+
+    assert header(sent[0], "content-encoding") == "gzip"
+    assert header(sent[0], "etag") == 'W/"abc"'
+    assert "Accept-Encoding" in header(sent[0], "vary")
+    assert header(sent[0], "content-length") == str(len(sent[1]["body"]))
+    assert gzip.decompress(sent[1]["body"]) == body
+
+
+async def test_client_refusing_every_encoding_gets_identity():
+    body = b"x" * 1000
+    sent = await run([start(), {"type": "http.response.body", "body": body}], accept_encoding="gzip;q=0")
+
+    assert header(sent[0], "content-encoding") is None
+    assert sent[1]["body"] == body
+
+
+async def test_streamed_chunks_decompress_as_they_arrive():
+    chunks = [json.dumps({"id": i}).encode() + b"\n" for i in range(3)]
+    sent = await run(
+        [start(content_type=b"application/x-ndjson", etag=None)]
+        + [{"type": "http.response.body", "body": chunk, "more_body": True} for chunk in chunks]
+        + [{"type": "http.response.body", "body": b"", "more_body": False}]
+    )
+
+    assert header(sent[0], "content-encoding") == "gzip"
+    assert header(sent[0], "content-length") is None
+    decoder = zlib.decompressobj(31)
+    # 덩어리마다 flush하므로 받은 만큼 바로 풀림
+    assert [decoder.decompress(message["body"]) for message in sent[1:4]] == chunks
+    assert decoder.decompress(sent[4]["body"]) + decoder.flush() == b""
+    assert decoder.eof
+
+
+async def test_export_stream_is_gzip_encoded_per_chunk(client, monkeypatch):
+    monkeypatch.setattr(config, "EXPORT_FETCH_SIZE", 2)
+    await client.post("/todos/bulk", json=[{"title": f"gzip export {i}"} for i in range(5)])
+
+    # httpx는 본문을 풀어서 주므로 앱을 직접 호출해 내려가는 압축 덩어리를 받음
+    sent: list[dict] = []
+
+    async def send(message):
+        sent.append(message)
+
+    requested = asyncio.Event()
+
+    async def receive():
+        # 요청 본문은 한 번, 그 뒤로는 연결이 살아 있는 것처럼 대기 (StreamingResponse가 끊김을 감시)
+        if not requested.is_set():
+            requested.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/todos/export", "raw_path": b"/todos/export", "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+
+    assert header(sent[0], "content-encoding") == "gzip"
+    bodies = [message["body"] for message in sent[1:] if message["body"]]
+    assert len(bodies) > 1
+    decoder = zlib.decompressobj(31)
+    lines = []
+    for body in bodies:
+        text = decoder.decompress(body).decode()
+        assert text == "" or text.endswith("\n")  # 덩어리 경계에서 줄이 끊기지 않음
+        lines.extend(text.splitlines())
+    assert decoder.eof
+    assert [json.loads(line)["id"] for line in lines] == sorted(json.loads(line)["id"] for line in lines)
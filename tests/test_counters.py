@@ -0,0 +1,58 @@
+# tests/test_counters.py
+import json
+
+import pytest
+
+from app.counters import read_actual_counts, read_stored_counts
+from app.database import ReadSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+async def assert_counters_match(client, step: str) -> None:
+    """트리거가 유지한 카운터 == todos를 직접 센 값, /internal/counters/verify도 일치"""
+    async with ReadSessionLocal() as db:
+        stored = await read_stored_counts(db)
+        actual = await read_actual_counts(db)
+    assert stored == actual, step
+
+    check = (await client.get("/internal/counters/verify")).json()
+    assert check["consistent"], f"{step}: {check}"
+    assert check["stored"] == check["actual"] == actual.model_dump(), step
+
+
+async def test_counters_follow_every_write_path(client):
+    await assert_counters_match(client, "start")
+
+    created = (await client.post("/todos", json={"title": "count me", "completed": True})).json()
+    await assert_counters_match(client, "create")
+
+    for completed in (False, True, False):
+        response = await client.put(f"/todos/{created['id']}", json={"completed": completed})
+        assert response.status_code == 200
+        await assert_counters_match(client, f"update completed={completed}")
+
+    # completed가 그대로인 수정은 카운터를 바꾸지 않음
+    await client.put(f"/todos/{created['id']}", json={"title": "renamed"})
+    await assert_counters_match(client, "update title")
+
+    assert (await client.delete(f"/todos/{created['id']}")).status_code == 204
+    await assert_counters_match(client, "delete")
+
+    bulk = await client.post(
+        "/todos/bulk", json=[{"title": f"bulk {i}", "completed": i % 2 == 0} for i in range(5)]
+    )
+    assert bulk.status_code == 201
+    await assert_counters_match(client, "bulk")
+
+    ids = [todo["id"] for todo in bulk.json()[:3]]
+    deleted = await client.delete("/todos", params={"ids": ids})
+    assert deleted.json()["deleted"] == ids
+    await assert_counters_match(client, "delete many")
+
+    lines = "".join(json.dumps({"title": f"import {i}", "completed": i < 2}) + "\n" for i in range(4))
+    imported = await client.post(
+        "/todos/import", content=lines, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert imported.json()["accepted"] == 4
+    await assert_counters_match(client, "import")
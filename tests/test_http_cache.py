@@ -0,0 +1,46 @@
+# tests/test_http_cache.py
+import pytest
+from sqlalchemy import text
+
+from app.cache import todo_cache
+from app.database import write_engine
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_if_none_match_returns_304_for_todo_and_list_page(client):
+    todo_id = (await client.post("/todos", json={"title": "conditional"})).json()["id"]
+
+    for path, params in [(f"/todos/{todo_id}", {}), ("/todos", {"limit": 5})]:
+        first = await client.get(path, params=params)
+        etag = first.headers["ETag"]
+
+        repeated = await client.get(path, params=params, headers={"If-None-Match": etag})
+
+        assert repeated.status_code == 304, path
+        assert repeated.content == b""
+        assert repeated.headers["ETag"] == etag
+        assert (await client.get(path, params=params, headers={"If-None-Match": '"other"'})).status_code == 200
+
+
+async def test_etag_changes_with_content_and_completed_at(client):
+    todo_id = (await client.post("/todos", json={"title": "tagged", "completed": True})).json()["id"]
+    original = (await client.get(f"/todos/{todo_id}")).headers["ETag"]
+    page = (await client.get("/todos", params={"limit": 5})).headers["ETag"]
+
+    # 같은 초 안의 수정이라 updated_at이 같아도 내용이 바뀌면 ETag가 바뀜
+    await client.put(f"/todos/{todo_id}", json={"title": "retagged"})
+    retitled = (await client.get(f"/todos/{todo_id}")).headers["ETag"]
+    assert retitled != original
+    assert (await client.get("/todos", params={"limit": 5})).headers["ETag"] != page
+
+    # 백필처럼 updated_at은 그대로 두고 completed_at만 바꿈 (백필도 캐시 항목을 지움)
+    async with write_engine.begin() as conn:
+        await conn.execute(
+            text("UPDATE todos SET completed_at = '2020-01-01 00:00:00' WHERE id = :id"), {"id": todo_id}
+        )
+    todo_cache.invalidate(todo_id)
+    response = await client.get(f"/todos/{todo_id}", headers={"If-None-Match": retitled})
+    assert response.status_code == 200
+    assert response.json()["completed_at"] == "2020-01-01T00:00:00"
+    assert response.headers["ETag"] != retitled
@@ -0,0 +1,32 @@
+# tests/test_metrics.py
+import re
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def route_labels(body: str) -> set[str]:
+    return set(re.findall(r'route="([^"]*)"', body))
+
+
+async def test_metrics_label_routes_by_template(client):
+    todo_id = (await client.post("/todos", json={"title": "measured"})).json()["id"]
+    await client.get(f"/todos/{todo_id}")
+    await client.get(f"/todos/{todo_id + 1000000}")
+    assert (await client.get(f"/no-such-path/{todo_id}")).status_code == 404
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'todo_http_responses_total{method="GET",route="/todos/{todo_id}",status="200"}' in body
+    # 없는 할일의 404도 라우트는 매칭됨 → 템플릿 라벨
+    assert 'todo_http_responses_total{method="GET",route="/todos/{todo_id}",status="404"}' in body
+    assert 'todo_http_responses_total{method="GET",route="<unmatched>",status="404"}' in body
+    assert 'todo_http_request_duration_seconds_count{method="GET",route="/todos/{todo_id}"}' in body
+    assert 'todo_db_queries_per_request_count{method="GET",route="/todos/{todo_id}"}' in body
+    # 실제 경로(id)는 라벨에 들어가지 않음
+    labels = route_labels(body)
+    assert not [label for label in labels if str(todo_id) in label or label.startswith("/no-such-path")]
@@ -0,0 +1,86 @@
+# tests/test_migrations.py
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.migrations import LATEST_VERSION, apply_migrations, migrate, schema_report
+
+pytestmark = pytest.mark.anyio
+
+ALL_VERSIONS = list(range(1, LATEST_VERSION + 1))
+
+
+@pytest.fixture(autouse=True)
+def keep_schema_report() -> Iterator[None]:
+    """migrate()는 프로세스 전역 schema_report를 갱신하므로 테스트 뒤 앱의 값으로 되돌림"""
+    saved = dict(schema_report.__dict__)
+    yield
+    schema_report.__dict__.update(saved)
+
+
+@pytest.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """빈 DB 파일의 엔진 (앱의 쓰기 엔진처럼 BEGIN IMMEDIATE로 트랜잭션 시작)"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrate.db'}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    yield engine
+    await engine.dispose()
+
+
+async def applied_versions(engine: AsyncEngine) -> list[int]:
+    async with engine.connect() as conn:
+        return list((await conn.execute(text("SELECT version FROM schema_version ORDER BY version"))).scalars())
+
+
+async def test_fresh_database_migrates_to_latest(engine):
+    report = await migrate(engine, engine)
+
+    assert report.version == LATEST_VERSION
+    assert [migration["version"] for migration in report.applied] == ALL_VERSIONS
+    assert await applied_versions(engine) == ALL_VERSIONS
+
+
+async def test_second_migrate_is_a_no_op(engine):
+    await migrate(engine, engine)
+
+    report = await migrate(engine, engine)
+
+    assert report.version == LATEST_VERSION
+    assert report.applied == []
+    assert report.lock_wait_seconds == 0.0
+    assert await applied_versions(engine) == ALL_VERSIONS
+
+
+async def test_database_at_v4_upgrades_and_is_reported(engine, tmp_path):
+    # v4까지만 적용된 DB에 완료된 할일이 있는 상태 (completed_at 컬럼 추가 전)
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    with sync_engine.begin() as conn:
+        apply_migrations(conn, target=4)
+        conn.exec_driver_sql("INSERT INTO todos (title, completed) VALUES ('old', 1)")
+    sync_engine.dispose()
+
+    report = await migrate(engine, engine)
+
+    assert report.version == LATEST_VERSION
+    assert [(migration["version"], migration["name"]) for migration in report.applied] == [
+        (5, "create backfill progress table"),
+        (6, "add todos.completed_at"),
+    ]
+    assert report.as_dict()["latest_version"] == LATEST_VERSION
+    assert await applied_versions(engine) == ALL_VERSIONS
+    async with engine.connect() as conn:
+        todo = (await conn.execute(text("SELECT title, completed_at FROM todos"))).one()
+        backfill = (await conn.execute(text("SELECT name, status FROM backfill_progress"))).one()
+    assert tuple(todo) == ("old", None)  # 값은 백필이 채움
+    assert tuple(backfill) == ("todos_completed_at", "pending")
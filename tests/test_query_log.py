@@ -0,0 +1,88 @@
+# tests/test_query_log.py
+import json
+import logging
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app import config
+from app.query_log import QueryCountMiddleware, install_query_log, logger
+
+pytestmark = pytest.mark.anyio
+
+SECRET = "private grocery list"
+
+
+class Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.events: list[dict] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.events.append(json.loads(record.getMessage()))
+
+
+@pytest.fixture
+def records() -> Iterator[Records]:
+    """todo.sql 로거의 JSON 로그 수집 (propagate=False라 caplog로는 안 보임)"""
+    handler = Records()
+    logger.addHandler(handler)
+    yield handler
+    logger.removeHandler(handler)
+
+
+@pytest.fixture
+async def engine(monkeypatch) -> AsyncIterator[AsyncEngine]:
+    """모든 문장이 느린 문장으로 기록되는 메모리 DB 엔진"""
+    monkeypatch.setattr(config, "SLOW_QUERY_MS", 0)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    install_query_log(engine)
+    yield engine
+    await engine.dispose()
+
+
+async def test_slow_query_log_redacts_bound_parameters(engine, records):
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE notes (body TEXT)"))
+        await conn.execute(text("INSERT INTO notes (body) VALUES (:body)"), [{"body": SECRET}, {"body": SECRET}])
+        await conn.execute(text("SELECT count(*) FROM notes WHERE body = :body"), {"body": SECRET})
+
+    slow = [event for event in records.events if event["event"] == "slow_query"]
+    by_statement = {event["statement"]: event["parameters"] for event in slow}
+    assert by_statement["INSERT INTO notes (body) VALUES (?)"] == "<2 rows redacted>"
+    assert by_statement["SELECT count(*) FROM notes WHERE body = ?"] == "<1 redacted>"
+    assert SECRET not in json.dumps(records.events)
+
+
+async def run_request(engine: AsyncEngine, repeats: int) -> None:
+    """같은 SELECT를 repeats번 실행하는 요청 하나를 QueryCountMiddleware로 처리"""
+    async def endpoint(scope, receive, send):
+        async with engine.connect() as conn:
+            for todo_id in range(repeats):
+                await conn.execute(text("SELECT :id"), {"id": todo_id})
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await QueryCountMiddleware(endpoint)({"type": "http", "method": "GET", "path": "/n-plus-one"}, receive, send)
+
+
+async def test_n_plus_one_warning_uses_configured_threshold(engine, records, monkeypatch):
+    monkeypatch.setattr(config, "N_PLUS_ONE_THRESHOLD", 3)
+
+    await run_request(engine, 2)
+    assert not [event for event in records.events if event["event"] == "n_plus_one"]
+
+    await run_request(engine, 4)
+    warnings = [event for event in records.events if event["event"] == "n_plus_one"]
+    assert len(warnings) == 1
+    assert warnings[0]["executions"] == 4
+    assert warnings[0]["statement"] == "SELECT ?"
+    assert (warnings[0]["path"], warnings[0]["route"]) == ("/n-plus-one", "<unmatched>")
@@ -0,0 +1,110 @@
+# tests/test_query_plans.py
+"""
+엔드포인트 쿼리의 실행 계획 점검
+
+각 엔드포인트가 실행하는 쿼리에 EXPLAIN QUERY PLAN을 돌려서
+전체 테이블 스캔(SCAN todos)이나 임시 정렬(USE TEMP B-TREE)이 나오면 실패
+목록/수정 쿼리는 엔드포인트와 같은 함수(list_todos_query, todo_filters, update_todo_query)로 만듦
+
+실행: python -m pytest tests/test_query_plans.py
+"""
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Connection, create_engine, delete, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.sql import Executable
+
+from app.filters import list_todos_query, todo_filters, update_todo_query
+from app.migrations import apply_migrations
+from app.models import Todo
+from app.pagination import after_cursor, to_db_timestamp
+from app.serialization import select_columns
+
+SINCE = datetime(2025, 10, 1)
+UNTIL = datetime(2025, 11, 1)
+CURSOR = (to_db_timestamp(datetime(2025, 10, 29, 10, 30)), 100)
+FIELDS = ("id", "title", "completed")
+
+
+def endpoint_queries() -> dict[str, Executable]:
+    """app/main.py 엔드포인트가 실행하는 쿼리와 같은 모양의 statement 목록"""
+    def list_stmt(fields=None, **filters):
+        return list_todos_query(fields, todo_filters(**filters), 20)
+
+    return {
+        "list_todos (skip)": list_stmt().offset(40),
+        "list_todos (cursor)": list_stmt().where(after_cursor(CURSOR)),
+        "list_todos (fields)": list_stmt(FIELDS).offset(0),
+        "list_todos (fields, cursor)": list_stmt(FIELDS).where(after_cursor(CURSOR)),
+        "list_todos (open)": list_stmt(completed=False).offset(0),
+        "list_todos (open, cursor)": list_stmt(completed=False).where(after_cursor(CURSOR)),
+        "list_todos (open, fields)": list_stmt(FIELDS, completed=False).offset(0),
+        "list_todos (completed)": list_stmt(completed=True).offset(0),
+        "list_todos (created range)": list_stmt(created_after=SINCE, created_before=UNTIL).offset(0),
+        "list_todos (completed, created range)": list_stmt(completed=True, created_after=SINCE).offset(0),
+        "get_todo": select(Todo).where(Todo.id == 1),
+        "get_todo (fields)": select(*select_columns(FIELDS)).where(Todo.id == 1),
+        "update_todo": update_todo_query(1, {"title": "t"}),
+        "update_todo (complete)": update_todo_query(1, {"completed": True}),
+        "update_todo (reopen)": update_todo_query(1, {"completed": False, "title": "t"}),
+        "update_todo (no changes)": update_todo_query(1, {}),
+        "delete_todo": delete(Todo).where(Todo.id == 1).returning(Todo.id),
+        "delete_todos": delete(Todo).where(Todo.id.in_([1, 2, 3])).returning(Todo.id),
+    }
+
+
+def updated_range_queries() -> dict[str, Executable]:
+    """
+    updated_* 필터 목록 쿼리 (인덱스로 걸러지지 않음)
+
+    정렬이 created_at이라 플래너가 ix_todos_created_at_id를 따라가며 행마다 updated_at을 비교하거나,
+    ix_todos_updated_at으로 범위를 찾은 뒤 임시 정렬함 → 전체 테이블 스캔이 아닌지만 확인
+    """
+    def list_stmt(**filters):
+        return list_todos_query(None, todo_filters(**filters), 20)
+
+    return {
+        "list_todos (updated range)": list_stmt(updated_after=SINCE, updated_before=UNTIL).offset(0),
+        "list_todos (updated after, cursor)": list_stmt(updated_after=SINCE).where(after_cursor(CURSOR)),
+        "list_todos (open, updated before)": list_stmt(completed=False, updated_before=UNTIL).offset(0),
+    }
+
+
+def explain(conn: Connection, stmt: Executable) -> list[str]:
+    """EXPLAIN QUERY PLAN 결과의 detail 컬럼만 반환"""
+    compiled = stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"render_postcompile": True})
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+    return [row[-1] for row in rows]
+
+
+def is_full_scan(detail: str) -> bool:
+    return detail.startswith("SCAN") and "USING" not in detail
+
+
+def is_bad_plan(detail: str) -> bool:
+    """인덱스 없는 전체 스캔 또는 임시 B-트리 정렬인지 판단"""
+    return is_full_scan(detail) or "TEMP B-TREE" in detail
+
+
+@pytest.fixture(scope="module")
+def conn() -> Iterator[Connection]:
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        apply_migrations(connection)
+        yield connection
+    engine.dispose()
+
+
+@pytest.mark.parametrize("name", list(endpoint_queries()))
+def test_query_uses_index(conn: Connection, name: str) -> None:
+    plan = explain(conn, endpoint_queries()[name])
+    assert not [detail for detail in plan if is_bad_plan(detail)], f"{name}: {plan}"
+
+
+@pytest.mark.parametrize("name", list(updated_range_queries()))
+def test_updated_range_avoids_full_scan(conn: Connection, name: str) -> None:
+    plan = explain(conn, updated_range_queries()[name])
+    assert not [detail for detail in plan if is_full_scan(detail)], f"{name}: {plan}"
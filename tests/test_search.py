@@ -0,0 +1,25 @@
+# tests/test_search.py
+import pytest
+
+from app.search import MATCH_END, MATCH_START, render_snippet
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_snippet_escapes_todo_html_and_keeps_mark(client):
+    await client.post(
+        "/todos",
+        json={"title": "escape test", "description": '<img src=x onerror="alert(1)"> & xsscheck'},
+    )
+
+    results = (await client.get("/todos/search", params={"q": "xsscheck"})).json()
+
+    snippet = results[0]["snippet"]
+    assert "<img" not in snippet
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; &amp; <mark>xsscheck</mark>" in snippet
+
+
+def test_render_snippet_balances_markers_from_todo_text():
+    raw = f"a{MATCH_END}b {MATCH_START}hit{MATCH_END} c{MATCH_START}{MATCH_START}d"
+
+    assert render_snippet(raw) == "ab <mark>hit</mark> c<mark>d</mark>"
@@ -0,0 +1,64 @@
+# tests/test_streaming.py
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app import config
+from app.database import ReadSessionLocal, write_engine
+from app.models import Todo
+
+pytestmark = pytest.mark.anyio
+
+
+async def count_todos() -> int:
+    async with ReadSessionLocal() as db:
+        return (await db.execute(select(func.count()).select_from(Todo))).scalar_one()
+
+
+async def test_export_reads_keyset_chunks_in_id_order(client, monkeypatch):
+    monkeypatch.setattr(config, "EXPORT_FETCH_SIZE", 2)
+    await client.post("/todos/bulk", json=[{"title": f"export {i}"} for i in range(5)])
+
+    response = await client.get("/todos/export")
+
+    ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+    assert ids == sorted(set(ids))
+    assert len(ids) == await count_todos()
+
+
+async def test_export_csv_has_one_header(client, monkeypatch):
+    monkeypatch.setattr(config, "EXPORT_FETCH_SIZE", 2)
+    await client.post("/todos/bulk", json=[{"title": f"csv {i}"} for i in range(3)])
+
+    lines = (await client.get("/todos/export", params={"format": "csv"})).text.splitlines()
+
+    assert lines[0].startswith("id,title")
+    assert len(lines) == await count_todos() + 1
+
+
+async def test_import_reports_counts_and_failed_chunk_when_a_commit_fails(client, monkeypatch):
+    monkeypatch.setattr(config, "IMPORT_CHUNK_SIZE", 2)
+    async with write_engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TRIGGER reject_boom BEFORE INSERT ON todos WHEN new.title = 'boom' "
+            "BEGIN SELECT RAISE(ABORT, 'boom rejected'); END"
+        )
+    lines = [{"title": "one"}, {"title": "two"}, {"title": "three"}, {"title": "boom"}, {"title": "five"}]
+    body = "\n".join(json.dumps(line) for line in lines)
+    try:
+        before = await count_todos()
+        response = await client.post(
+            "/todos/import", content=body, headers={"content-type": "application/x-ndjson"}
+        )
+    finally:
+        async with write_engine.begin() as conn:
+            await conn.exec_driver_sql("DROP TRIGGER reject_boom")
+
+    assert response.status_code == 500
+    result = response.json()
+    assert result["accepted"] == 2
+    assert result["aborted"]["first_line"] == 3
+    assert result["aborted"]["last_line"] == 4
+    assert "boom rejected" in result["aborted"]["error"]
+    assert await count_todos() == before + 2
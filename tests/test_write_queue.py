@@ -0,0 +1,45 @@
+# tests/test_write_queue.py
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.database import ReadSessionLocal
+from app.models import Todo
+
+pytestmark = pytest.mark.anyio
+
+
+async def read_title(todo_id: int) -> str:
+    async with ReadSessionLocal() as db:
+        return (await db.execute(select(Todo.title).where(Todo.id == todo_id))).scalar_one()
+
+
+async def test_concurrent_updates_of_one_todo_return_their_own_rows(client):
+    """같은 배치에 묶인 두 PUT이 서로의 ORM 객체를 돌려받지 않아야 함 (세션 identity map 공유)"""
+    todo_id = (await client.post("/todos", json={"title": "A"})).json()["id"]
+
+    for round_ in range(5):
+        first, second = f"B{round_}", f"C{round_}"
+        responses = await asyncio.gather(
+            client.put(f"/todos/{todo_id}", json={"title": first}),
+            client.put(f"/todos/{todo_id}", json={"title": second}),
+        )
+
+        assert [response.json()["title"] for response in responses] == [first, second]
+        stored = await read_title(todo_id)
+        assert stored == second
+        cached = await client.get(f"/todos/{todo_id}")
+        assert cached.json()["title"] == stored
+
+
+async def test_update_after_create_in_same_batch_returns_updated_row(client):
+    created = (await client.post("/todos", json={"title": "old"})).json()
+    other, updated = await asyncio.gather(
+        client.put(f"/todos/{created['id']}", json={"description": "x"}),
+        client.put(f"/todos/{created['id']}", json={"title": "new"}),
+    )
+
+    assert updated.json()["title"] == "new"
+    assert updated.json()["description"] == "x"
+    assert (await client.get(f"/todos/{created['id']}")).json()["title"] == await read_title(created["id"])